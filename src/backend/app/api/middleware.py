@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+ASGI middleware for the API.
+"""
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.routing import Match
+from starlette.routing import Router
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from app.core.metrics import EXECUTOR_QUEUED
+from app.core.metrics import EXECUTOR_RUNNING
+from app.core.metrics import REQUEST_DURATION
+from app.core.metrics import REQUESTS_IN_PROGRESS
+from app.db.instrumentation import QueryStats
+from app.db.instrumentation import track_queries
+
+
+def format_server_timing(stats: QueryStats, elapsed: float) -> str:
+    """Formats the ``Server-Timing`` header value for a request.
+
+    Parameters
+    ----------
+    stats : QueryStats
+        The database statistics for the request.
+    elapsed : float
+        The time taken by the application to handle the request (in
+        seconds).
+
+    Returns
+    -------
+    str
+        The header value with the database time (and statement count),
+        the connection pool wait time and the total handler time, all in
+        milliseconds.
+
+    """
+    metrics = [
+        f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"',
+        f'db-pool;dur={stats.pool_wait * 1000:.2f}',
+        f'app;dur={elapsed * 1000:.2f}',
+    ]
+    return ', '.join(metrics)
+
+
+class ServerTimingMiddleware(object):
+    """
+    Middleware adding ``Server-Timing`` headers to HTTP responses.
+
+    The database statements of each request are tracked (see
+    :func:`track_queries`) so the time spent on the database can be told
+    apart from the rest of the handling (e.g. serialization).
+
+    Parameters
+    ----------
+    app : ASGIApp
+        The ASGI application to wrap.
+
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        return
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send
+    ) -> None:
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        started = time.perf_counter()
+        with track_queries() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                if message['type'] == 'http.response.start':
+                    elapsed = time.perf_counter() - started
+                    headers = MutableHeaders(scope=message)
+                    headers.append('Server-Timing',
+                                   format_server_timing(stats, elapsed))
+                await send(message)
+                return
+
+            await self.app(scope, receive, send_with_timing)
+        return
+
+
+class MetricsMiddleware(object):
+    """
+    Middleware recording the request metrics of the application.
+
+    Request durations are labelled by the path template of the route
+    handling them (rather than the actual path) to keep the number of
+    distinct label values bounded.
+
+    Parameters
+    ----------
+    app : ASGIApp
+        The ASGI application to wrap.
+    router : Router
+        The router whose routes to label requests with.
+
+    """
+
+    def __init__(self, app: ASGIApp, router: Router) -> None:
+        self.app = app
+        self.router = router
+        return
+
+    def get_route(self, scope: Scope) -> str:
+        """Gets the path template of the route matching the request."""
+        partial = None
+        for route in self.router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+            elif match == Match.PARTIAL and partial is None:
+                partial = route.path
+        return partial or '<unmatched>'
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send
+    ) -> None:
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+            return
+
+        started = time.perf_counter()
+        REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUESTS_IN_PROGRESS.dec()
+            REQUEST_DURATION.labels(
+                scope['method'], self.get_route(scope), str(status)
+            ).observe(time.perf_counter() - started)
+            executor = getattr(scope['app'].state, 'executor', None)
+            if executor is not None:
+                EXECUTOR_QUEUED.set(executor.queued)
+                EXECUTOR_RUNNING.set(executor.running)
+        return
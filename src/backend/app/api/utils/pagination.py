@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Pagination utilities for the API.
+"""
+import typing as tp
+
+from starlette.responses import Response
+
+from app.crud.base import Repository
+
+
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+def set_next_cursor(
+    response: Response,
+    repository: Repository,
+    results: tp.Sequence[tp.Any],
+    limit: tp.Optional[int]
+) -> None:
+    """Sets the cursor for the next page of results on the response.
+
+    The cursor is only set if the page is full (so there may be more
+    results to fetch), clients should pass it back as the ``cursor``
+    query parameter to get the next page.
+
+    Parameters
+    ----------
+    response : Response
+        The response to set the next cursor header on.
+    repository : Repository
+        The repository the `results` were fetched from.
+    results : Sequence[Any]
+        The current page of results.
+    limit : int, optional
+        The page size the `results` were fetched with.
+
+    """
+    if limit and results and len(results) >= limit:
+        response.headers[NEXT_CURSOR_HEADER] = \
+            repository.get_cursor(results[-1])
+    return
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Rate limiting utilities for the API.
+"""
+import ipaddress
+import os
+import tempfile
+import typing as tp
+
+from fastapi import Depends
+from fastapi.security import OAuth2PasswordRequestForm
+from starlette.requests import Request
+
+from app.core import config
+from app.core.metrics import AUTH_FAILURES
+from app.exceptions import RateLimitError
+from app.utils.ratelimit import MemoryRateLimitStore
+from app.utils.ratelimit import RateLimitStore
+from app.utils.ratelimit import SQLiteRateLimitStore
+from app.utils.ratelimit import TokenBucketLimiter
+
+
+def build_rate_limit_store(store_type: str) -> RateLimitStore:
+    """Creates the rate limit store of the given type.
+
+    Parameters
+    ----------
+    store_type : str
+        The type of store to create, either ``memory`` (separate for each
+        worker process) or ``sqlite`` (shared by the worker processes on
+        a host, via the ``LOGIN_RATE_LIMIT_PATH`` file).
+
+    Returns
+    -------
+    RateLimitStore
+        The new rate limit store.
+
+    Raises
+    ------
+    ValueError
+        If the given `store_type` isn't supported.
+
+    """
+    store_type = store_type.lower()
+    if store_type == 'memory':
+        return MemoryRateLimitStore()
+    elif store_type == 'sqlite':
+        path = config.LOGIN_RATE_LIMIT_PATH or os.path.join(
+            tempfile.gettempdir(), 'login-ratelimit.sqlite3'
+        )
+        return SQLiteRateLimitStore(path)
+    raise ValueError(f"Unsupported rate limit store: {store_type}")
+
+
+_login_store = build_rate_limit_store(config.LOGIN_RATE_LIMIT_STORE)
+
+login_ip_limiter = TokenBucketLimiter(
+    _login_store, config.LOGIN_RATE_LIMIT_IP, config.LOGIN_RATE_LIMIT_PERIOD,
+    prefix='login:ip:'
+)
+login_user_limiter = TokenBucketLimiter(
+    _login_store, config.LOGIN_RATE_LIMIT_USER,
+    config.LOGIN_RATE_LIMIT_PERIOD, prefix='login:user:'
+)
+
+
+_trusted_proxies = [
+    ipaddress.ip_network(x, strict=False) for x in config.TRUSTED_PROXIES
+]
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    """Checks if the given address is one of the trusted proxies."""
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in x for x in _trusted_proxies)
+
+
+def get_client_ip(request: Request) -> str:
+    """Gets the IP address of the client making the request.
+
+    When the request comes from one of the ``TRUSTED_PROXIES`` the
+    ``X-Forwarded-For`` header is used, taking the last address in it
+    not added by a trusted proxy (the ones before that can be set by the
+    client).
+
+    Parameters
+    ----------
+    request : Request
+        The current request.
+
+    Returns
+    -------
+    str
+        The client's IP address (or ``unknown`` if not available).
+
+    """
+    rv = request.client.host if request.client else 'unknown'
+    if not _is_trusted_proxy(rv):
+        return rv
+
+    forwarded: tp.List[str] = []
+    for header in request.headers.getlist('x-forwarded-for'):
+        forwarded.extend(x.strip() for x in header.split(',') if x.strip())
+    for host in reversed(forwarded):
+        rv = host
+        if not _is_trusted_proxy(host):
+            break
+    return rv
+
+
+def check_login_rate_limit(
+    request: Request,
+    form_data: OAuth2PasswordRequestForm = Depends()
+) -> None:
+    """Checks the login attempt against the login rate limits.
+
+    Each attempt takes a token from both the client's (IP address) and
+    then, if allowed, the username's bucket, so neither a single client
+    nor a distributed attack on one account can trigger unlimited
+    password verifications.
+
+    Parameters
+    ----------
+    request : Request
+        The current request.
+    form_data : OAuth2PasswordRequestForm
+        The login form data.
+
+    Raises
+    ------
+    RateLimitError
+        If either of the login rate limits has been exceeded.
+
+    """
+    if not config.LOGIN_RATE_LIMIT_ENABLED:
+        return
+
+    # - The username's bucket is only used once the client's allows the
+    #   attempt, so a blocked client can't drain it (locking the user out)
+    wait = login_ip_limiter.hit(get_client_ip(request))
+    if wait <= 0:
+        wait = login_user_limiter.hit(form_data.username.strip().lower())
+    if wait > 0:
+        AUTH_FAILURES.labels('rate_limited').inc()
+        raise RateLimitError(wait, "Too many login attempts")
+    return
@@ -2,6 +2,7 @@
 """
 Security-related utilities for the API.
 """
+import typing as tp
 from uuid import UUID
 
 from fastapi import Depends
@@ -13,6 +14,10 @@ from app import exceptions
 from app.api.utils.storage import get_uow
 from app.core import config
 from app.core.jwt import ALGORITHM
+from app.core.metrics import AUTH_FAILURES
+from app.core.security import PermissionAction
+from app.core.security import PermissionMatrix
+from app.core.security import UserAuth
 from app.crud.core import UnitOfWork
 from app.db.models.user import User
 from app.models.token import TokenPayload
@@ -23,11 +28,16 @@ reusable_oauth2 = OAuth2PasswordBearer(
 )
 
 
-def get_current_user(
+def get_current_user_auth(
     uow: UnitOfWork = Depends(get_uow),
     token: str = Security(reusable_oauth2)
-) -> User:
-    """Gets the current User object from the given token.
+) -> UserAuth:
+    """Gets the authorization snapshot of the current user.
+
+    The token's snapshot is cached (until the token expires, for at most
+    ``AUTH_CACHE_TTL`` seconds, or until changes to users are committed),
+    so repeated requests with the same token neither decode it nor load
+    the user again.
 
     Parameters
     ----------
@@ -38,26 +48,67 @@ def get_current_user(
 
     Returns
     -------
-    User
-        The User model object for the current user.
+    UserAuth
+        The authorization snapshot of the current user.
 
     Raises
     ------
-    HTTPException
-        If the token could not be validated a ``403`` error is raised.
-        If the user from the valid token could not be found then a
-        ``404`` error is raised.
+    PrivilegeError
+        If the token could not be validated.
+    ObjectNotFoundError
+        If the user from the valid token could not be found.
 
     """
+    rv = uow.user.get_cached_auth(token)
+    if rv is not None:
+        return rv
     try:
         payload = jwt.decode(token, config.SECRET_KEY, algorithms=[ALGORITHM])
         payload['user_id'] = UUID(payload['user_id'])
     except jwt.PyJWTError:
+        AUTH_FAILURES.labels('invalid_token').inc()
         raise exceptions.PrivilegeError(
             "Could not validate the given credentials."
         )
     token_data = TokenPayload(**payload)
-    return uow.user.get(token_data.user_id, raise_ex=True)
+    user = uow.user.get(token_data.user_id)
+    if not user:
+        AUTH_FAILURES.labels('unknown_user').inc()
+        raise exceptions.ObjectNotFoundError(User, 'id')
+    rv = UserAuth.from_user(user)
+    uow.user.cache_auth(token, rv, expires=payload['exp'])
+    return rv
+
+
+def get_current_user(
+    uow: UnitOfWork = Depends(get_uow),
+    auth: UserAuth = Security(get_current_user_auth)
+) -> User:
+    """Gets the current User object from the given token.
+
+    Parameters
+    ----------
+    uow : UnitOfWork
+        The unit of work to use.
+    auth : UserAuth
+        The authorization snapshot of the current user.
+
+    Returns
+    -------
+    User
+        The User model object for the current user.
+
+    Raises
+    ------
+    ObjectNotFoundError
+        If the user from the valid token could not be found.
+
+    """
+    user = uow.user.get(auth.uid)
+    if not user:
+        AUTH_FAILURES.labels('unknown_user').inc()
+        raise exceptions.ObjectNotFoundError(User, 'id')
+    return user
 
 
 def get_current_active_user(
@@ -83,6 +134,7 @@ def get_current_active_user(
 
     """
     if not current_user.is_active:
+        AUTH_FAILURES.labels('inactive_user').inc()
         raise exceptions.APIError("Inactive user")
     return current_user
 
@@ -110,6 +162,7 @@ def get_current_active_poweruser(
 
     """
     if not current_user.is_poweruser:
+        AUTH_FAILURES.labels('insufficient_privileges').inc()
         raise exceptions.PrivilegeError()
     return current_user
 
@@ -137,5 +190,155 @@ def get_current_active_superuser(
 
     """
     if not current_user.is_superuser:
+        AUTH_FAILURES.labels('insufficient_privileges').inc()
         raise exceptions.PrivilegeError()
     return current_user
+
+
+def get_current_active_user_auth(
+    current_user: UserAuth = Security(get_current_user_auth)
+) -> UserAuth:
+    """Gets the authorization snapshot of the current, active user.
+
+    Like :func:`get_current_active_user` but without loading the User
+    object, for endpoints which only need to check privileges.
+
+    Parameters
+    ----------
+    current_user : UserAuth
+        The authorization snapshot of the current user.
+
+    Returns
+    -------
+    UserAuth
+        The current, active user's authorization snapshot.
+
+    Raises
+    ------
+    APIError
+        If the current user is not an active user.
+
+    """
+    if not current_user.is_active:
+        AUTH_FAILURES.labels('inactive_user').inc()
+        raise exceptions.APIError("Inactive user")
+    return current_user
+
+
+def get_current_active_poweruser_auth(
+    current_user: UserAuth = Security(get_current_active_user_auth)
+) -> UserAuth:
+    """Gets the authorization snapshot of the current poweruser.
+
+    Parameters
+    ----------
+    current_user : UserAuth
+        The authorization snapshot of the current, active user.
+
+    Returns
+    -------
+    UserAuth
+        The current, active poweruser's authorization snapshot.
+
+    Raises
+    ------
+    PrivilegeError
+        If the current user is not a poweruser.
+
+    """
+    if not current_user.is_poweruser:
+        AUTH_FAILURES.labels('insufficient_privileges').inc()
+        raise exceptions.PrivilegeError()
+    return current_user
+
+
+def get_current_active_superuser_auth(
+    current_user: UserAuth = Security(get_current_active_user_auth)
+) -> UserAuth:
+    """Gets the authorization snapshot of the current superuser.
+
+    Parameters
+    ----------
+    current_user : UserAuth
+        The authorization snapshot of the current, active user.
+
+    Returns
+    -------
+    UserAuth
+        The current, active superuser's authorization snapshot.
+
+    Raises
+    ------
+    PrivilegeError
+        If the current user is not a superuser.
+
+    """
+    if not current_user.is_superuser:
+        AUTH_FAILURES.labels('insufficient_privileges').inc()
+        raise exceptions.PrivilegeError()
+    return current_user
+
+
+def get_current_user_permissions(
+    uow: UnitOfWork = Depends(get_uow),
+    current_user: UserAuth = Security(get_current_active_user_auth)
+) -> PermissionMatrix:
+    """Gets the resolved permissions of the current user.
+
+    The permissions are cached (per process, until any change), so this
+    usually doesn't query the database.
+
+    Parameters
+    ----------
+    uow : UnitOfWork
+        The unit of work to use.
+    current_user : UserAuth
+        The authorization snapshot of the current, active user.
+
+    Returns
+    -------
+    PermissionMatrix
+        The actions allowed for the current user, by permission name.
+
+    """
+    return uow.config.user.get_matrix(current_user.uid)
+
+
+def require_permission(
+    permission: str,
+    action: PermissionAction
+) -> tp.Callable[..., UserAuth]:
+    """Creates a dependency requiring the current user have a permission.
+
+    Superusers are allowed everything.
+
+    Parameters
+    ----------
+    permission : str
+        The name of the permission required.
+    action : PermissionAction
+        The action(s) the permission must allow.
+
+    Returns
+    -------
+    Callable[..., UserAuth]
+        The dependency function, which gets the authorization snapshot
+        of the current (permitted) user.
+
+    """
+    def _require_permission(
+        current_user: UserAuth = Security(get_current_active_user_auth),
+        permissions: PermissionMatrix = Depends(get_current_user_permissions)
+    ) -> UserAuth:
+        if not current_user.is_superuser and \
+                not permissions.allows(permission, action):
+            AUTH_FAILURES.labels('insufficient_privileges').inc()
+            actions = ', '.join(
+                x.name.lower() for x in PermissionAction if x & action
+            )
+            raise exceptions.PrivilegeError(
+                f"Permissions required: {permission} ({actions})"
+            )
+        return current_user
+
+    return _require_permission
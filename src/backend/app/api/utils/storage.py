@@ -2,42 +2,113 @@
 """
 Database-related utilities for the API.
 """
-from starlette.requests import Request
+import typing as tp
+
+from fastapi import Depends
 from sqlalchemy.orm import Session
+from starlette.requests import Request
 
+from app.core import config
 from app.crud.core import UnitOfWork
+from app.db.crud.core import ReadOnlySQLUnitOfWork
+from app.db.crud.core import SQLUnitOfWork
+from app.db.instrumentation import track_queries
+from app.db.session import ReadOnlySession
+from app.db.session import ReadOnlySQLSession
+from app.db.session import Session as SessionFactory
+from app.memory.crud.core import MemoryUnitOfWork
+from app.memory.store import memory_store
+
+
+SAFE_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+
 
+async def get_db(request: Request) -> tp.AsyncIterator[Session]:
+    """Gets a new database session for the current request.
 
-def get_db(request: Request) -> Session:
-    """Gets the database session stored on the request state.
+    The session is only created for requests which (directly or
+    indirectly) depend on it, and is always closed once the response
+    has been sent - even if an exception was raised while handling the
+    request.
+
+    The statements executed with the session are tracked and, if
+    enabled, any repeated (N+1) queries are logged (or raise an error if
+    ``DB_REPEATED_QUERY_RAISE`` is set, e.g. for tests).
+
+    Requests with safe (read-only) HTTP methods get a read-only session,
+    unless ``DB_READ_ONLY_SAFE_METHODS`` is disabled.
 
     Parameters
     ----------
     request : Request
-        The API request object to fetch the database session object
-        from.
+        The current request.
 
-    Returns
-    -------
+    Yields
+    ------
     Session
         The SQLAlchemy database session object to use.
 
     """
-    return request.state.db
+    threshold = None
+    if config.DB_REPEATED_QUERY_CHECK:
+        threshold = config.DB_REPEATED_QUERY_THRESHOLD
+    with track_queries(threshold=threshold,
+                       raise_ex=config.DB_REPEATED_QUERY_RAISE):
+        if config.DB_READ_ONLY_SAFE_METHODS \
+                and request.method in SAFE_METHODS:
+            db = ReadOnlySession()
+        else:
+            db = SessionFactory()
+        try:
+            yield db
+        finally:
+            db.close()
 
 
-def get_uow(request: Request) -> UnitOfWork:
-    """Gets the unit of work object stored on the request state.
+async def get_sql_uow(db: Session = Depends(get_db)) -> UnitOfWork:
+    """Gets the database unit of work object for the current request.
 
     Parameters
     ----------
-    request : Request
-        The API request object to fetch the unit of work object from.
+    db : Session
+        The database session for the current request.
 
     Returns
     -------
     UnitOfWork
-        The unit of work object stored on the request's state.
+        The unit of work object for the current request (read-only if
+        the session is).
 
     """
-    return request.state.uow
+    if isinstance(db, ReadOnlySQLSession):
+        return ReadOnlySQLUnitOfWork(db)
+    return SQLUnitOfWork(db)
+
+
+async def get_memory_uow() -> tp.AsyncIterator[UnitOfWork]:
+    """Gets the in-memory unit of work object for the current request.
+
+    Any changes not committed by the end of the request are discarded.
+
+    Yields
+    ------
+    UnitOfWork
+        The unit of work object for the current request.
+
+    """
+    uow = MemoryUnitOfWork(memory_store)
+    try:
+        yield uow
+    finally:
+        uow.rollback()
+
+
+_uow_dependencies = {
+    'database': get_sql_uow,
+    'memory': get_memory_uow,
+}
+
+try:
+    get_uow = _uow_dependencies[config.STORAGE_TYPE.lower()]
+except KeyError:
+    raise ValueError(f"Unsupported storage type: {config.STORAGE_TYPE}")
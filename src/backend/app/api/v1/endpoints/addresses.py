@@ -9,12 +9,14 @@ from fastapi import APIRouter
 from fastapi import Body
 from fastapi import Depends
 from fastapi import Query
+from starlette.responses import Response
 
-from app.api.utils.security import get_current_active_poweruser
+from app.api.utils.pagination import set_next_cursor
+from app.api.utils.security import get_current_active_poweruser_auth
 from app.api.utils.storage import get_uow
+from app.core.security import UserAuth
 from app.crud.core import UnitOfWork
 from app.db.models.address import Address as DBAddress
-from app.models.user import UserInDB
 from app.models.address import Address
 from app.models.address import AddressCreate
 from app.models.address import AddressUpdate
@@ -24,11 +26,11 @@ router = APIRouter()
 
 
 @router.post("/", response_model=Address)
-async def create_address(
+def create_address(
     *,
     new_address: AddressCreate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> DBAddress:
     """Creates a new Address object.
 
@@ -38,7 +40,7 @@ async def create_address(
         The new address data to create a new Address object with.
     uow : UnitOfWork
         The unit of work object to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the call.
 
     Returns
@@ -52,11 +54,11 @@ async def create_address(
 
 
 @router.get("/{address_id}", response_model=Address)
-async def read_address(
+def read_address(
     address_id: UUID,
     *,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> DBAddress:
     """Gets the Address from the given ID.
 
@@ -66,7 +68,7 @@ async def read_address(
         The address ID to get the Address object for.
     uow : UnitOfWork
         The unit of work object to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the request.
 
     Returns
@@ -79,12 +81,14 @@ async def read_address(
 
 
 @router.get("/", response_model=tp.List[Address])
-async def read_addresses(
+def read_addresses(
     *,
     skip: tp.Optional[int] = Query(None),
     limit: tp.Optional[int] = Query(None),
+    cursor: tp.Optional[str] = Query(None),
+    response: Response,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> tp.List[DBAddress]:
     """Gets all the addresses specified.
 
@@ -94,9 +98,14 @@ async def read_addresses(
         The number of addresses to skip in the results.
     limit : int, optional
         The number of addresses to return in the results.
+    cursor : str, optional
+        The cursor to start fetching addresses after (as given by the
+        previous page's ``X-Next-Cursor`` header).
+    response : Response
+        The response to set the next page's cursor on.
     uow : UnitOfWork
         The unit of work object to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the request.
 
     Returns
@@ -105,16 +114,18 @@ async def read_addresses(
         The Address object(s) requested.
 
     """
-    return uow.address.all(skip=skip, limit=limit)
+    rv = uow.address.all(skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, uow.address, rv, limit)
+    return rv
 
 
 @router.put("/{address_id}", response_model=Address)
-async def update_address(
+def update_address(
     address_id: UUID,
     *,
     updated_address: AddressUpdate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> DBAddress:
     """Updates the given Address object.
 
@@ -126,7 +137,7 @@ async def update_address(
         The updated address data object.
     uow : UnitOfWork
         The unit of work object to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the request.
 
     Returns
@@ -146,11 +157,11 @@ async def update_address(
 
 
 @router.delete("/{address_id}", response_model=Address)
-async def delete_address(
+def delete_address(
     address_id: UUID,
     *,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> DBAddress:
     """Updates the given Address object.
 
@@ -160,7 +171,7 @@ async def delete_address(
         The address ID of the address to delete.
     uow : UnitOfWork
         The unit of work object to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the request.
 
     Returns
@@ -9,13 +9,15 @@ from fastapi import APIRouter
 from fastapi import Body
 from fastapi import Depends
 from fastapi import Query
+from starlette.responses import Response
 
-from app.api.utils.security import get_current_active_superuser
-from app.api.utils.security import get_current_active_user
+from app.api.utils.pagination import set_next_cursor
+from app.api.utils.security import get_current_active_superuser_auth
+from app.api.utils.security import get_current_active_user_auth
 from app.api.utils.storage import get_uow
+from app.core.security import UserAuth
 from app.crud.core import UnitOfWork
 from app.exceptions import APIError
-from app.models.user import UserInDB
 from app.models.config.setting import DataT
 from app.models.config.setting import Setting
 from app.models.config.setting import SettingCreate
@@ -31,7 +33,7 @@ def create_setting(
     *,
     new_setting: SettingCreate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_superuser)
+    current_user: UserAuth = Depends(get_current_active_superuser_auth)
 ) -> SettingInDB:
     """Create a new setting.
 
@@ -41,7 +43,7 @@ def create_setting(
         The data to use to create the new setting.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the request.
 
     Returns
@@ -64,8 +66,10 @@ def read_settings(
     *,
     skip: tp.Optional[int] = Query(None),
     limit: tp.Optional[int] = Query(None),
+    cursor: tp.Optional[str] = Query(None),
+    response: Response,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_user)
+    current_user: UserAuth = Depends(get_current_active_user_auth)
 ) -> tp.List[SettingInDB]:
     """Gets a list of existing settings.
 
@@ -75,9 +79,14 @@ def read_settings(
         Number of settings to skip in returned results.
     limit : int, optional
         Number of settings to limit returned results to.
+    cursor : str, optional
+        The cursor to start fetching settings after (as given by the
+        previous page's ``X-Next-Cursor`` header).
+    response : Response
+        The response to set the next page's cursor on.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the request.
 
     Returns
@@ -86,7 +95,37 @@ def read_settings(
         List of existing settings.
 
     """
-    return uow.config.setting.all(skip=skip, limit=limit)
+    rv = uow.config.setting.all(skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, uow.config.setting, rv, limit)
+    return rv
+
+
+@router.post('/values', response_model=tp.Dict[str, tp.Optional[DataT]])
+def read_setting_values(
+    *,
+    names: tp.List[str] = Body(...),
+    uow: UnitOfWork = Depends(get_uow),
+    current_user: UserAuth = Depends(get_current_active_user_auth)
+) -> tp.Dict[str, tp.Optional[DataT]]:
+    """Gets the values of multiple settings in a single request.
+
+    Parameters
+    ----------
+    names : List[str]
+        The names of the settings to get the values of.
+    uow : UnitOfWork
+        The unit of work to use.
+    current_user : UserAuth
+        The current user making the request.
+
+    Returns
+    -------
+    Dict[str, Optional[DataT]]
+        The setting values requested, by name (any which don't exist
+        are omitted).
+
+    """
+    return uow.config.setting.get_values(names)
 
 
 @router.get('/{name}', response_model=tp.Optional[DataT])
@@ -94,7 +133,7 @@ def read_setting_value(
     name: str,
     *,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_user)
+    current_user: UserAuth = Depends(get_current_active_user_auth)
 ) -> DataT:
     """Gets a single setting value from the given name.
 
@@ -104,7 +143,7 @@ def read_setting_value(
         The name of the setting to get.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the request.
 
     Returns
@@ -121,7 +160,7 @@ def read_setting_value(
         If the Setting object with the specified `name` doesn't exist.
 
     """
-    setting = uow.config.setting.get_by_name(name, raise_ex=True)
+    setting = uow.config.setting.get_snapshot(name, raise_ex=True)
     if setting.required and setting.value is None:
         raise APIError("Setting value not set")
     return setting.value
@@ -132,7 +171,7 @@ def read_setting_id(
     id: UUID,
     *,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_user)
+    current_user: UserAuth = Depends(get_current_active_user_auth)
 ) -> SettingInDB:
     """Gets a single setting.
 
@@ -142,7 +181,7 @@ def read_setting_id(
         The unique ID of the setting to get.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the request.
 
     Returns
@@ -160,7 +199,7 @@ def update_setting_id(
     *,
     updated_setting: SettingUpdate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_superuser)
+    current_user: UserAuth = Depends(get_current_active_superuser_auth)
 ) -> SettingInDB:
     """Updates the specified setting.
 
@@ -172,7 +211,7 @@ def update_setting_id(
         The data to update the setting with.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the request.
 
     Returns
@@ -197,7 +236,7 @@ def update_setting(
     *,
     value: tp.Optional[DataT] = Body(None),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_superuser)
+    current_user: UserAuth = Depends(get_current_active_superuser_auth)
 ) -> SettingInDB:
     """Updates the value of a setting.
 
@@ -209,7 +248,7 @@ def update_setting(
         The new value to use for the `name` setting.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the request.
 
     Returns
@@ -224,9 +263,8 @@ def update_setting(
         exist.
 
     """
-    current = uow.current.setting.get_by_name(name)
     with uow:
-        return uow.config.setting.update_value(current, value)
+        return uow.config.setting.update_value(name, value)
 
 
 @router.delete('/id/{id}', response_model=Setting)
@@ -234,7 +272,7 @@ def delete_setting_id(
     id: UUID,
     *,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_superuser)
+    current_user: UserAuth = Depends(get_current_active_superuser_auth)
 ) -> SettingInDB:
     """Deletes the specified setting.
 
@@ -244,7 +282,7 @@ def delete_setting_id(
         The unique ID of the setting to delete.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the request.
 
     Returns
@@ -10,27 +10,29 @@ from fastapi import APIRouter
 from fastapi import Body
 from fastapi import Depends
 from fastapi import Query
+from starlette.responses import Response
 
-from app.api.utils.security import get_current_active_poweruser
-from app.api.utils.security import get_current_active_user
+from app.api.utils.pagination import set_next_cursor
+from app.api.utils.security import get_current_active_poweruser_auth
+from app.api.utils.security import get_current_active_user_auth
 from app.api.utils.storage import get_uow
+from app.core.security import UserAuth
 from app.crud.core import UnitOfWork
 from app.db.models.event import Event as DBEvent
 from app.models.event import Event
 from app.models.event import EventCreate
 from app.models.event import EventUpdate
-from app.models.user import UserInDB
 
 
 router = APIRouter()
 
 
 @router.post("/", response_model=Event)
-async def create_event(
+def create_event(
     *,
     new_event: EventCreate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> DBEvent:
     """Creates a new Event object.
 
@@ -40,7 +42,7 @@ async def create_event(
         The new event data to create a new Event object with.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current poweruser making the call.
 
     Returns
@@ -59,12 +61,12 @@ async def create_event(
 
 
 @router.get("/", response_model=tp.List[Event])
-async def read_upcoming_events(
+def read_upcoming_events(
     *,
     skip: tp.Optional[int] = Query(None),
     limit: tp.Optional[int] = Query(None),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_user)
+    current_user: UserAuth = Depends(get_current_active_user_auth)
 ) -> tp.List[DBEvent]:
     """Gets all the event objects.
 
@@ -76,7 +78,7 @@ async def read_upcoming_events(
         The number of events to limit the result to.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the request.
 
     Returns
@@ -86,16 +88,18 @@ async def read_upcoming_events(
 
     """
     return uow.event.all_in_range(start_date=datetime.date.today(), skip=skip,
-                                  limit=limit)
+                                  limit=limit, profile='full')
 
 
 @router.get("/all", response_model=tp.List[Event])
-async def read_all_events(
+def read_all_events(
     *,
     skip: tp.Optional[int] = Query(None),
     limit: tp.Optional[int] = Query(None),
+    cursor: tp.Optional[str] = Query(None),
+    response: Response,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> tp.List[DBEvent]:
     """Gets all the event objects.
 
@@ -105,9 +109,14 @@ async def read_all_events(
         The number of events to skip in the results.
     limit : int, optional
         The number of events to limit the result to.
+    cursor : str, optional
+        The cursor to start fetching events after (as given by the
+        previous page's ``X-Next-Cursor`` header).
+    response : Response
+        The response to set the next page's cursor on.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current power user making the request.
 
     Returns
@@ -116,15 +125,18 @@ async def read_all_events(
         The Event object(s) requested.
 
     """
-    return uow.event.all(skip=skip, limit=limit)
+    rv = uow.event.all(skip=skip, limit=limit, cursor=cursor,
+                       profile='full')
+    set_next_cursor(response, uow.event, rv, limit)
+    return rv
 
 
 @router.get("/id/{event_id}", response_model=Event)
-async def read_event(
+def read_event(
     event_id: UUID,
     *,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> DBEvent:
     """Gets the event with the specified `event_id`.
 
@@ -134,7 +146,7 @@ async def read_event(
         The event ID to get the associated event for.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current power user making the request.
 
     Returns
@@ -148,16 +160,16 @@ async def read_event(
         If the object with the specified `event_id` doesn't exist.
 
     """
-    return uow.event.get(event_id, raise_ex=True)
+    return uow.event.get(event_id, raise_ex=True, profile='full')
 
 
 @router.put("/id/{event_id}", response_model=Event)
-async def update_event(
+def update_event(
     event_id: UUID,
     *,
     updated_event: EventUpdate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> DBEvent:
     """Updates the event with the specified `event_id`.
 
@@ -169,7 +181,7 @@ async def update_event(
         The data to update the event with.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current power user making the request.
 
     Returns
@@ -189,11 +201,11 @@ async def update_event(
 
 
 @router.delete("/id/{event_id}", response_model=Event)
-async def delete_event(
+def delete_event(
     event_id: UUID,
     *,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> DBEvent:
     """Deletes the event with the specified `event_id`.
 
@@ -203,7 +215,7 @@ async def delete_event(
         The event ID for the event to delete.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current power user making the request.
 
     Returns
@@ -10,10 +10,12 @@ from fastapi import Body
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordRequestForm
 
+from app.api.utils.ratelimit import check_login_rate_limit
 from app.api.utils.storage import get_uow
 from app.api.utils.security import get_current_user
 from app.core import config
 from app.core.jwt import create_access_token
+from app.core.metrics import AUTH_FAILURES
 from app.crud.core import UnitOfWork
 from app.db.models.user import User as DBUser
 from app.exceptions import APIError
@@ -30,15 +32,18 @@ from app.utils.email import send_password_reset_email
 router = APIRouter()
 
 
-@router.post("/login/access-token", response_model=Token)
-async def login_access_token(
+@router.post("/login/access-token", response_model=Token,
+             dependencies=[Depends(check_login_rate_limit)])
+def login_access_token(
     *,
     form_data: OAuth2PasswordRequestForm = Depends(),
     uow: UnitOfWork = Depends(get_uow)
 ) -> tp.Mapping[str, str]:
     """OAuth2 compatible token login.
 
-    Acquires an access token to be used for future requests.
+    Acquires an access token to be used for future requests, attempts
+    are rate limited by client and username (see
+    :func:`check_login_rate_limit`).
 
     Parameters
     ----------
@@ -56,12 +61,16 @@ async def login_access_token(
     ------
     APIException
         If the user could not be logged or is not an active user.
+    RateLimitError
+        If there have been too many recent login attempts.
 
     """
     user = uow.user.authenticate(form_data.username, form_data.password)
     if not user:
+        AUTH_FAILURES.labels('invalid_credentials').inc()
         raise APIError("Invalid username or password")
     elif not user.is_active:
+        AUTH_FAILURES.labels('inactive_user').inc()
         raise APIError("Inactive user")
     access_token_expires = timedelta(
         minutes=config.ACCESS_TOKEN_EXPIRE_MINUTES
@@ -95,7 +104,7 @@ async def test_token(
 
 
 @router.post('/password-recovery/{email}', response_model=Message)
-async def recover_password(
+def recover_password(
     email: str,
     *,
     uow: UnitOfWork = Depends(get_uow)
@@ -125,7 +134,7 @@ async def recover_password(
 
 
 @router.post("/reset-password/", response_model=Message)
-async def reset_password(
+def reset_password(
     *,
     token: str = Body(...),
     new_password: str = Body(...),
@@ -158,6 +167,7 @@ async def reset_password(
     """
     email = verify_password_reset_token(token)
     if not email:
+        AUTH_FAILURES.labels('invalid_reset_token').inc()
         raise APIError("Invalid token.")
 
     user = uow.user.get_by_email(email, raise_ex=True)
@@ -10,24 +10,24 @@ from fastapi import Body
 from fastapi import Depends
 from fastapi import Query
 
-from app.api.utils.security import get_current_active_poweruser
+from app.api.utils.security import get_current_active_poweruser_auth
 from app.api.utils.storage import get_uow
+from app.core.security import UserAuth
 from app.crud.core import UnitOfWork
 from app.models.name import Name
 from app.models.name import NameCreate
 from app.models.name import NameUpdate
-from app.models.user import UserInDB
 
 
 router = APIRouter()
 
 
 @router.post("/", response_model=Name)
-async def create_name(
+def create_name(
     *,
     new_name: NameCreate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> Name:
     """Creates a new Name object.
 
@@ -51,11 +51,11 @@ async def create_name(
 
 
 @router.get("/{name_id}", response_model=Name)
-async def read_name_by_id(
+def read_name_by_id(
     name_id: UUID,
     *,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> Name:
     """Gets the name with the specified ID.
 
@@ -65,7 +65,7 @@ async def read_name_by_id(
         The name ID to get the name for.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The currently active poweruser making the request.
 
     Returns
@@ -78,12 +78,12 @@ async def read_name_by_id(
 
 
 @router.get("/", response_model=tp.List[Name])
-async def read_names(
+def read_names(
     *,
     skip: tp.Optional[int] = Query(None),
     limit: tp.Optional[int] = Query(None),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> tp.List[Name]:
     """Gets all the names specified.
 
@@ -95,7 +95,7 @@ async def read_names(
         The number of names to return in the results.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The currently active poweruser making the request.
 
     Returns
@@ -108,12 +108,12 @@ async def read_names(
 
 
 @router.put("/{name_id}", response_model=Name)
-async def update_name(
+def update_name(
     name_id: UUID,
     *,
     updated_name: NameUpdate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> Name:
     """Updates an existing Name object.
 
@@ -125,7 +125,7 @@ async def update_name(
         The updated name data to use.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current active poweruser making the request.
 
     Returns
@@ -9,11 +9,14 @@ from fastapi import APIRouter
 from fastapi import Body
 from fastapi import Depends
 from fastapi import Query
+from starlette.responses import Response
 
 from app import exceptions
+from app.api.utils.pagination import set_next_cursor
 from app.api.utils.security import get_current_active_user
-from app.api.utils.security import get_current_active_poweruser
+from app.api.utils.security import get_current_active_poweruser_auth
 from app.api.utils.storage import get_uow
+from app.core.security import UserAuth
 from app.crud.core import UnitOfWork
 from app.db.models.person import Person as DBPerson
 from app.models.person import Person
@@ -26,11 +29,11 @@ router = APIRouter()
 
 
 @router.post("/", response_model=Person)
-async def create_person(
+def create_person(
     *,
     new_person: PersonCreate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> DBPerson:
     """Creates a new Person object.
 
@@ -40,7 +43,7 @@ async def create_person(
         The new person data to create a new Person object with.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current poweruser making the call.
 
     Returns
@@ -62,12 +65,14 @@ async def create_person(
 
 
 @router.get("/", response_model=tp.List[Person])
-async def read_people(
+def read_people(
     *,
     skip: tp.Optional[int] = Query(None),
     limit: tp.Optional[int] = Query(None),
+    cursor: tp.Optional[str] = Query(None),
+    response: Response,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> tp.List[DBPerson]:
     """Gets all the people specified.
 
@@ -77,9 +82,14 @@ async def read_people(
         The number of people to skip in the results.
     limit : int, optional
         The number of people to return in the results.
+    cursor : str, optional
+        The cursor to start fetching people after (as given by the
+        previous page's ``X-Next-Cursor`` header).
+    response : Response
+        The response to set the next page's cursor on.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current power user making the request.
 
     Returns
@@ -88,11 +98,42 @@ async def read_people(
         The Person object(s) requested.
 
     """
-    return uow.person.all(skip=skip, limit=limit)
+    rv = uow.person.all(skip=skip, limit=limit, cursor=cursor,
+                        profile='full')
+    set_next_cursor(response, uow.person, rv, limit)
+    return rv
+
+
+@router.post("/batch", response_model=tp.List[Person])
+def read_people_batch(
+    *,
+    person_ids: tp.List[UUID] = Body(...),
+    uow: UnitOfWork = Depends(get_uow),
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
+) -> tp.List[DBPerson]:
+    """Gets the people with the specified IDs in a single request.
+
+    Parameters
+    ----------
+    person_ids : List[UUID]
+        The UUIDs of the people to get.
+    uow : UnitOfWork
+        The unit of work to use.
+    current_user : UserAuth
+        The current power user making the request.
+
+    Returns
+    -------
+    List[DBPerson]
+        The Person objects requested (in the order requested), any
+        which don't exist are omitted.
+
+    """
+    return uow.person.get_many(person_ids, profile='full')
 
 
 @router.get('/id/{person_id}', response_model=Person)
-async def read_person(
+def read_person(
     person_id: UUID,
     *,
     uow: UnitOfWork = Depends(get_uow),
@@ -123,7 +164,7 @@ async def read_person(
         other people.
 
     """
-    person = uow.person.get(person_id)
+    person = uow.person.get(person_id, profile='full')
     if not current_user.is_poweruser and current_user.person != person:
         raise exceptions.PrivilegeException()
     if not person:
@@ -142,7 +183,7 @@ def read_person_me(
 
 
 @router.put('/id/{person_id}', response_model=Person)
-async def update_person(
+def update_person(
     person_id: UUID,
     *,
     updated_person: PersonUpdate = Body(...),
@@ -186,7 +227,7 @@ async def update_person(
 
 
 @router.put("/me", response_model=Person)
-async def update_person_me(
+def update_person_me(
     *,
     updated_person: PersonUpdate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
@@ -221,13 +262,13 @@ async def update_person_me(
 
 
 @router.delete("/id/{person_id}", response_model=Person)
-async def delete_person(
+def delete_person(
     person_id: UUID,
     *,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> DBPerson:
     """Deletes the specified person."""
-    person = uow.person.get(person_id, raise_ex=True)
+    person = uow.person.get(person_id, raise_ex=True, profile='full')
     with uow:
         return uow.person.delete(person)
@@ -9,12 +9,17 @@ from fastapi import APIRouter
 from fastapi import Body
 from fastapi import Depends
 from fastapi import Query
+from starlette.responses import Response
 
 from app import exceptions
-from app.api.utils.security import get_current_active_superuser
+from app.api.utils.pagination import set_next_cursor
+from app.api.utils.security import get_current_active_superuser_auth
 from app.api.utils.security import get_current_active_user
+from app.api.utils.security import get_current_user_permissions
 from app.api.utils.storage import get_uow
 from app.core import config
+from app.core.security import PermissionMatrix
+from app.core.security import UserAuth
 from app.crud.core import UnitOfWork
 from app.db.models.user import User as DBUser
 from app.models.user import User
@@ -28,11 +33,11 @@ router = APIRouter()
 
 
 @router.post("/", response_model=User)
-async def create_user(
+def create_user(
     *,
     new_user: UserCreate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_superuser)
+    current_user: UserAuth = Depends(get_current_active_superuser_auth)
 ) -> DBUser:
     """Creates a new User object.
 
@@ -42,7 +47,7 @@ async def create_user(
         The new user data to create a new User object with.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the call.
 
     Returns
@@ -71,7 +76,7 @@ async def create_user(
 
 
 @router.post("/open", response_model=User)
-async def create_user_open(
+def create_user_open(
     *,
     new_user: UserCreate = Body(...),
     uow: UnitOfWork = Depends(get_uow)
@@ -108,12 +113,14 @@ async def create_user_open(
 
 
 @router.get("/", response_model=tp.List[User])
-async def read_users(
+def read_users(
     *,
     skip: tp.Optional[int] = Query(None),
     limit: tp.Optional[int] = Query(None),
+    cursor: tp.Optional[str] = Query(None),
+    response: Response,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_superuser)
+    current_user: UserAuth = Depends(get_current_active_superuser_auth)
 ) -> tp.List[DBUser]:
     """Gets all the users specified.
 
@@ -123,9 +130,14 @@ async def read_users(
         The number of users to skip in the results.
     limit : int, optional
         The number of users to return in the results.
+    cursor : str, optional
+        The cursor to start fetching users after (as given by the
+        previous page's ``X-Next-Cursor`` header).
+    response : Response
+        The response to set the next page's cursor on.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the request.
 
     Returns
@@ -134,11 +146,14 @@ async def read_users(
         The User object(s) requested.
 
     """
-    return uow.user.all(skip=skip, limit=limit)
+    rv = uow.user.all(skip=skip, limit=limit, cursor=cursor,
+                      profile='full')
+    set_next_cursor(response, uow.user, rv, limit)
+    return rv
 
 
 @router.get("/id/{user_id}", response_model=User)
-async def read_user(
+def read_user(
     user_id: UUID,
     *,
     uow: UnitOfWork = Depends(get_uow),
@@ -169,7 +184,7 @@ async def read_user(
         If the user with the specified `id` doesn't exist.
 
     """
-    user = uow.user.get(user_id)
+    user = uow.user.get(user_id, profile='full')
     if user == current_user:
         return user
     if not current_user.is_superuser:
@@ -200,13 +215,36 @@ async def read_user_me(
     return current_user
 
 
+@router.get("/me/permissions",
+            response_model=tp.Dict[str, tp.Dict[str, bool]])
+def read_user_me_permissions(
+    *,
+    permissions: PermissionMatrix = Depends(get_current_user_permissions)
+) -> tp.Dict[str, tp.Dict[str, bool]]:
+    """Gets the current user's resolved permissions.
+
+    Parameters
+    ----------
+    permissions : PermissionMatrix
+        The current user's permissions.
+
+    Returns
+    -------
+    Dict[str, Dict[str, bool]]
+        The actions allowed (``create``, ``read``, ``update`` and
+        ``delete``) for each permission.
+
+    """
+    return permissions.to_dict()
+
+
 @router.put("/id/{user_id}", response_model=User)
-async def update_user(
+def update_user(
     user_id: UUID,
     *,
     updated_user: UserUpdate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_superuser)
+    current_user: UserAuth = Depends(get_current_active_superuser_auth)
 ) -> DBUser:
     """Updates the given user object.
 
@@ -218,7 +256,7 @@ async def update_user(
         The updated user data object.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user doing the update.
 
     Returns
@@ -238,7 +276,7 @@ async def update_user(
 
 
 @router.put("/me", response_model=User)
-async def update_user_me(
+def update_user_me(
     *,
     current_password: str = Body(..., alias='currentPassword'),
     updated_user: UserUpdate = Body(..., alias='updatedUser'),
@@ -277,11 +315,11 @@ async def update_user_me(
 
 
 @router.delete("/id/{user_id}", response_model=User)
-async def delete_user(
+def delete_user(
     user_id: UUID,
     *,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_superuser)
+    current_user: UserAuth = Depends(get_current_active_superuser_auth)
 ) -> DBUser:
     """Deletes the specified User.
 
@@ -291,7 +329,7 @@ async def delete_user(
         The ID of the user to remove.
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current active superuser making the request.
 
     Returns
@@ -301,14 +339,14 @@ async def delete_user(
 
     Raises
     ------
-    APIException
+    APIError
         If the `current_user` is the user to delete.
     ObjectNotFoundException
         If no user is found for the given `id`.
 
     """
-    user = uow.user.get(user_id, raise_ex=True)
-    if user == current_user:
-        raise exceptions.APIException("Cannot remove yourself.")
+    user = uow.user.get(user_id, raise_ex=True, profile='full')
+    if user.uid == current_user.uid:
+        raise exceptions.APIError("Cannot remove yourself.")
     with uow:
         return uow.user.delete(user)
@@ -8,14 +8,14 @@ from fastapi import APIRouter
 from fastapi import Body
 from fastapi import Depends
 
-from app.api.utils.security import get_current_active_poweruser
-from app.api.utils.security import get_current_active_user
+from app.api.utils.security import get_current_active_poweruser_auth
+from app.api.utils.security import get_current_active_user_auth
 from app.api.utils.storage import get_uow
+from app.core.security import UserAuth
 from app.crud.core import UnitOfWork
 from app.db.models.wedding import WeddingInfo as DBWeddingInfo
 from app.db.models.person import Person as DBPerson
 from app.models.person import Person
-from app.models.user import UserInDB
 from app.models.wedding.wedding_info import WeddingInfo
 from app.models.wedding.wedding_info import WeddingInfoCreate
 from app.models.wedding.wedding_info import WeddingInfoUpdate
@@ -25,10 +25,10 @@ router = APIRouter()
 
 
 @router.get("/", response_model=WeddingInfo)
-async def read_wedding_info(
+def read_wedding_info(
     *,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_user)
+    current_user: UserAuth = Depends(get_current_active_user_auth)
 ) -> tp.Optional[DBWeddingInfo]:
     """Gets the wedding information object.
 
@@ -36,7 +36,7 @@ async def read_wedding_info(
     ----------
     uow : UnitOfWork
         The unit of work to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current user making the call.
 
     Returns
@@ -45,15 +45,15 @@ async def read_wedding_info(
         The wedding information requested.
 
     """
-    return uow.wedding.wedding_info.get()
+    return uow.wedding.wedding_info.get(profile='full')
 
 
 @router.post("/", response_model=WeddingInfo)
-async def create_wedding_info(
+def create_wedding_info(
     *,
     new_wedding_info: WeddingInfoCreate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> DBWeddingInfo:
     """Creates a new wedding information object.
 
@@ -64,7 +64,7 @@ async def create_wedding_info(
         object.
     uow : UnitOfWork
         The unit of work object to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current poweruser making the request.
 
     Returns
@@ -83,11 +83,11 @@ async def create_wedding_info(
 
 
 @router.put("/", response_model=WeddingInfo)
-async def update_wedding_info(
+def update_wedding_info(
     *,
     updated_wedding_info: WeddingInfoUpdate = Body(...),
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> DBWeddingInfo:
     """Updates the wedding information object.
 
@@ -97,7 +97,7 @@ async def update_wedding_info(
         The information to use to update the wedding information object.
     uow : UnitOfWork
         The unit of work object to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current poweruser making the request.
 
     Returns
@@ -117,11 +117,11 @@ async def update_wedding_info(
 
 
 @router.get("/party/{role}", response_model=tp.List[Person])
-async def get_party_person(
+def get_party_person(
     role: str,
     *,
     uow: UnitOfWork = Depends(get_uow),
-    current_user: UserInDB = Depends(get_current_active_poweruser)
+    current_user: UserAuth = Depends(get_current_active_poweruser_auth)
 ) -> tp.List[DBPerson]:
     """Gets the person associated with the `role` specified.
 
@@ -132,7 +132,7 @@ async def get_party_person(
         :obj:`Person` for.
     uow : UnitOfWork
         The unit of work object to use.
-    current_user : UserInDB
+    current_user : UserAuth
         The current poweruser making the request.
 
     Returns
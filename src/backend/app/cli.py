@@ -9,7 +9,9 @@ from datetime import datetime, timedelta
 import logging
 import os
 import sys
+import statistics
 import threading
+import time
 import traceback
 import typing as tp
 
@@ -200,6 +202,19 @@ def run_command_thread(
     return rv
 
 
+def summarize_timings(timings: tp.Sequence[float]) -> str:
+    """Formats a summary of the given timings (in seconds)."""
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"n={len(ordered)} "
+        f"mean={statistics.mean(ordered) * 1e3:.3f}ms "
+        f"p50={statistics.median(ordered) * 1e3:.3f}ms "
+        f"p95={p95 * 1e3:.3f}ms "
+        f"rate={len(ordered) / sum(ordered):.1f}/s"
+    )
+
+
 @retry(
     stop=stop_after_attempt(MAX_TRIES),
     wait=wait_fixed(WAIT_SECONDS)
@@ -289,12 +304,32 @@ def config_list(
             'SERVER_NAME',
             'SERVER_HOST',
             'SERVER_PORT',
+            'SERVER_TIMING_ENABLED',
+            'METRICS_ENABLED',
+            'METRICS_MULTIPROC_DIR',
+            'THREADPOOL_MAX_WORKERS',
+            'THREADPOOL_POOL_HEADROOM',
+            'PASSWORD_HASH_WORKERS',
         ],
         'Security': [
             'SECRET_KEY',
             'ALLOWED_ORIGINS',
             'ACCESS_TOKEN_EXPIRE_MINUTES',
             'EMAIL_RESET_TOKEN_EXPIRE_HOURS',
+            'AUTH_CACHE_SIZE',
+            'AUTH_CACHE_TTL',
+            'AUTH_CACHE_CHECK_INTERVAL',
+            'PASSWORD_SCHEMES',
+            'PASSWORD_BCRYPT_ROUNDS',
+            'PASSWORD_ARGON2_TIME_COST',
+            'PASSWORD_ARGON2_MEMORY_COST',
+            'LOGIN_RATE_LIMIT_ENABLED',
+            'LOGIN_RATE_LIMIT_STORE',
+            'LOGIN_RATE_LIMIT_PATH',
+            'LOGIN_RATE_LIMIT_PERIOD',
+            'LOGIN_RATE_LIMIT_IP',
+            'LOGIN_RATE_LIMIT_USER',
+            'TRUSTED_PROXIES',
         ],
         'Storage': [
             'STORAGE_TYPE',
@@ -306,6 +341,29 @@ def config_list(
             'DB_USER',
             'DB_PASSWORD',
             'DB_CONNECT_EXTRA',
+            'DB_POOL_SIZE',
+            'DB_POOL_MAX_OVERFLOW',
+            'DB_POOL_RECYCLE',
+            'DB_POOL_TIMEOUT',
+            'DB_POOL_PRE_PING',
+            'DB_POOL_USE_LIFO',
+            'DB_SQLITE_JOURNAL_MODE',
+            'DB_SQLITE_SYNCHRONOUS',
+            'DB_SQLITE_MMAP_SIZE',
+            'DB_SQLITE_CACHE_SIZE',
+            'DB_SQLITE_TEMP_STORE',
+            'DB_SQLITE_BUSY_TIMEOUT',
+            'DB_READ_ONLY_SAFE_METHODS',
+            'DB_REPLICA_URIS',
+            'DB_REPLICA_CHECK_INTERVAL',
+            'DB_REPEATED_QUERY_THRESHOLD',
+            'DB_REPEATED_QUERY_CHECK',
+            'DB_REPEATED_QUERY_RAISE',
+            'SETTINGS_STORAGE_LAYOUT',
+            'SETTINGS_CACHE_ENABLED',
+            'SETTINGS_CACHE_CHECK_INTERVAL',
+            'PERMISSIONS_CACHE_SIZE',
+            'PERMISSIONS_CACHE_CHECK_INTERVAL',
         ],
         'Emails': [
             'EMAILS_ENABLED',
@@ -334,6 +392,7 @@ def config_list(
             'DB_USER',
             'DB_PASSWORD',
             'DB_CONNECT_EXTRA',
+            'DB_REPLICA_URIS',
         ],
         'Emails': [
             'SMTP_HOST',
@@ -433,6 +492,95 @@ def init_all(ctx, **kwargs) -> None:
     return
 
 
+# Migrations
+
+@cli.group()
+@click.pass_context
+def migrate(ctx, **kwargs) -> None:
+    """
+    Data migration tools.
+    """
+    return
+
+
+@migrate.command('settings')
+@click.argument('target', type=click.Choice(['joined', 'single']))
+@click.option('--replace', is_flag=True, default=False,
+              help="Replace any settings already in the target layout.")
+@click.pass_context
+def migrate_settings(ctx, target: str, replace: bool) -> None:
+    """
+    Copies the settings into the given storage layout.
+
+    Once copied, set SETTINGS_STORAGE_LAYOUT to the new layout (and
+    restart the API) to switch over.
+    """
+    _migrate_log = get_log_fn()
+
+    source = 'single' if target == 'joined' else 'joined'
+    _migrate_log(f"Copying settings from the {source} to the {target} layout")
+    try:
+        count = db_utils.migrate_settings(db_session, source, target,
+                                          replace=replace)
+    except ValueError as ex:
+        db_session.rollback()
+        raise click.ClickException(str(ex))
+    _migrate_log(f"Copied {count} settings", depth=1)
+    return
+
+
+@migrate.command('schema')
+@click.pass_context
+def migrate_schema(ctx) -> None:
+    """
+    Upgrades the schema of an existing database.
+
+    Adds the tables (and columns) the models gained since the database
+    was created, e.g. the cache version counters and the permissions'
+    default actions.
+    """
+    from app.db.session import engine
+
+    _migrate_log = get_log_fn()
+
+    _migrate_log("Upgrading the database schema")
+    changes = db_utils.upgrade_database(engine)
+    for x in changes:
+        _migrate_log(x, depth=1)
+    if not changes:
+        _migrate_log("Database schema is up to date", depth=1)
+    return
+
+
+@migrate.command('replicas')
+@click.pass_context
+def migrate_replicas(ctx) -> None:
+    """
+    Copies the (SQLite) database to the (SQLite) replicas.
+
+    For trying out read-replica routing locally, e.g. with
+    DB_REPLICA_URIS=sqlite:///replica-1.sqlite3,sqlite:///replica-2.sqlite3
+    - run again after changes to see them on the replicas.
+    """
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from app.db.session import engine
+    from app.db.session import replica_engines
+
+    _migrate_log = get_log_fn()
+
+    if not replica_engines:
+        raise click.ClickException("No replicas configured (DB_REPLICA_URIS)")
+    _migrate_log(f"Copying the database to {len(replica_engines)} replicas")
+    try:
+        db_utils.copy_sqlite_database(engine, replica_engines)
+    except (ValueError, SQLAlchemyError) as ex:
+        raise click.ClickException(str(ex))
+    for x in replica_engines:
+        _migrate_log(f"Copied to {x.url!r}", depth=1)
+    return
+
+
 # Checks
 
 @cli.group(chain=True, invoke_without_command=True)
@@ -461,6 +609,25 @@ def check_db(ctx) -> None:
     return
 
 
+@check.command('replicas')
+@click.pass_context
+def check_replicas(ctx) -> None:
+    """
+    Checks which of the database replicas are available.
+    """
+    from app.db.session import replica_router
+
+    _chk_log = get_log_fn()
+    _chk_log('Checking database replicas')
+    if replica_router is None:
+        _chk_log('No replicas configured', depth=1)
+        return
+    for engine, healthy in replica_router.status():
+        state = 'available' if healthy else 'unavailable'
+        _chk_log(f"{engine.url!r}: {state}", depth=1,
+                 level=logging.INFO if healthy else logging.WARN)
+    return
+
 
 @check.command('api')
 @click.pass_context
@@ -492,6 +659,238 @@ def check_all(ctx, **kwargs) -> None:
     return
 
 
+# Benchmarks
+
+@cli.group()
+@click.pass_context
+def bench(ctx, **kwargs) -> None:
+    """
+    Performance benchmarks.
+    """
+    return
+
+
+@bench.command('api')
+@click.argument('path', type=click.STRING, default='/api/openapi.json')
+@click.option('-n', '--requests', 'n_requests', type=click.INT, default=1000,
+              show_default=True, help="Number of requests to time.")
+@click.option('--login', is_flag=True, default=False,
+              help="Authenticate as the initial superuser first.")
+@click.pass_context
+def bench_api(ctx, path: str, n_requests: int, login: bool) -> None:
+    """
+    Times (in-process) GET requests to an API path.
+    """
+    from starlette.testclient import TestClient
+
+    _bench_log = get_log_fn()
+    client = TestClient(fastapi_app)
+
+    headers = {}
+    if login:
+        _bench_log("Logging in as initial superuser", depth=1)
+        rv = client.post(
+            fastapi_app.url_path_for('login_access_token'),
+            data={
+                'username': config.SUPERUSER_EMAIL,
+                'password': config.SUPERUSER_PASSWORD,
+            }
+        )
+        rv.raise_for_status()
+        headers['Authorization'] = f"Bearer {rv.json()['accessToken']}"
+
+    _bench_log(f"Timing {n_requests} requests to: {path}")
+    client.get(path, headers=headers).raise_for_status()
+    timings = []
+    for _ in range(n_requests):
+        start = time.perf_counter()
+        client.get(path, headers=headers)
+        timings.append(time.perf_counter() - start)
+    _bench_log(summarize_timings(timings), depth=1)
+    return
+
+
+@bench.command('login')
+@click.option('-n', '--logins', 'n_logins', type=click.INT, default=100,
+              show_default=True, help="Number of logins to time.")
+@click.option('-c', '--concurrency', type=click.INT, default=None,
+              help="Number of concurrent logins (default is the API's"
+                   " threadpool size).")
+@click.pass_context
+def bench_login(ctx, n_logins: int, concurrency: tp.Optional[int]) -> None:
+    """
+    Times (in-process) concurrent logins as the initial superuser.
+
+    This is the login throughput of a single API worker process, which
+    is bound by the password hashing executor.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from app.core.security import get_hash_executor
+    from app.db.crud.core import SQLUnitOfWork
+    from app.db.session import Session as SessionFactory
+    from app.db.session import engine
+    from app.db.session import get_pool_capacity
+
+    _bench_log = get_log_fn()
+
+    if concurrency is None:
+        concurrency = (
+            config.THREADPOOL_MAX_WORKERS or get_pool_capacity(engine) or 1
+        )
+
+    def _login() -> float:
+        start = time.perf_counter()
+        db = SessionFactory()
+        try:
+            uow = SQLUnitOfWork(db)
+            user = uow.user.authenticate(config.SUPERUSER_EMAIL,
+                                         config.SUPERUSER_PASSWORD)
+        finally:
+            db.close()
+        if user is None:
+            raise click.ClickException("Invalid superuser credentials")
+        return time.perf_counter() - start
+
+    hash_workers = get_hash_executor().max_workers
+    _bench_log(
+        f"Timing {n_logins} logins ({concurrency} concurrent, "
+        f"{hash_workers} hashing workers)"
+    )
+    _login()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        start = time.perf_counter()
+        timings = list(executor.map(lambda _: _login(), range(n_logins)))
+        elapsed = time.perf_counter() - start
+    _bench_log(summarize_timings(timings), depth=1)
+    _bench_log(f"throughput={n_logins / elapsed:.1f} logins/s", depth=1)
+    return
+
+
+@bench.command('hash')
+@click.argument('costs', nargs=-1, type=click.INT)
+@click.option('--scheme', type=click.Choice(['bcrypt', 'argon2']),
+              default='bcrypt', show_default=True,
+              help="Password hashing scheme to time.")
+@click.option('-n', '--hashes', 'n_hashes', type=click.INT, default=10,
+              show_default=True, help="Number of hashes to time per cost.")
+@click.pass_context
+def bench_hash(ctx, costs: tp.Sequence[int], scheme: str,
+               n_hashes: int) -> None:
+    """
+    Times password hashing/verification for each of the given costs.
+
+    The costs are bcrypt's rounds, or argon2's time cost (defaults to
+    the configured cost).
+    """
+    from passlib.exc import MissingBackendError
+
+    from app.core.security import build_pwd_context
+
+    _bench_log = get_log_fn()
+
+    if not costs:
+        if scheme == 'bcrypt':
+            costs = [config.PASSWORD_BCRYPT_ROUNDS]
+        else:
+            costs = [config.PASSWORD_ARGON2_TIME_COST or 2]
+
+    for cost in costs:
+        if scheme == 'bcrypt':
+            context = build_pwd_context([scheme], bcrypt_rounds=cost)
+        else:
+            context = build_pwd_context(
+                [scheme], argon2_time_cost=cost,
+                argon2_memory_cost=config.PASSWORD_ARGON2_MEMORY_COST
+            )
+
+        hash_timings = []
+        verify_timings = []
+        for _ in range(n_hashes):
+            start = time.perf_counter()
+            try:
+                hashed = context.hash(config.SUPERUSER_PASSWORD)
+            except MissingBackendError as ex:
+                raise click.ClickException(str(ex))
+            hash_timings.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            context.verify(config.SUPERUSER_PASSWORD, hashed)
+            verify_timings.append(time.perf_counter() - start)
+
+        _bench_log(f"{scheme} (cost={cost}):")
+        _bench_log(f"hash: {summarize_timings(hash_timings)}", depth=1)
+        _bench_log(f"verify: {summarize_timings(verify_timings)}", depth=1)
+    return
+
+
+@bench.command('settings')
+@click.option('-n', '--settings', 'n_settings', type=click.INT, default=100,
+              show_default=True, help="Number of settings to time.")
+@click.pass_context
+def bench_settings(ctx, n_settings: int) -> None:
+    """
+    Times (uncached) setting operations for each storage layout.
+
+    Temporary settings are created (and removed afterwards) in each
+    layout, creating the layout's tables first if needed.
+    """
+    from app.db.crud.config.setting import get_setting_repository_type
+    from app.db.crud.core import SQLUnitOfWork
+    from app.db.session import Session as SessionFactory
+    from app.db.session import engine
+    from app.models.config.setting import SettingCreate
+
+    _bench_log = get_log_fn()
+
+    for layout in ('joined', 'single'):
+        repo_cls = get_setting_repository_type(layout)
+        obj_cls = repo_cls.__obj_cls__
+        for mapper in obj_cls.__mapper__.self_and_descendants:
+            mapper.local_table.create(bind=engine, checkfirst=True)
+
+        names = [f'bench-{layout}-{i}' for i in range(n_settings)]
+        timings = defaultdict(list)
+        db = SessionFactory()
+        try:
+            uow = SQLUnitOfWork(db)
+            repo = repo_cls(uow, db)
+            for i, name in enumerate(names):
+                start = time.perf_counter()
+                with uow:
+                    repo.create(SettingCreate(name=name, value=i))
+                timings['create'].append(time.perf_counter() - start)
+
+            for name in names:
+                db.expunge_all()
+                start = time.perf_counter()
+                repo.get_by_name(name).value
+                timings['read'].append(time.perf_counter() - start)
+
+            for i, name in enumerate(names):
+                start = time.perf_counter()
+                with uow:
+                    repo.update_value(name, -i)
+                timings['update'].append(time.perf_counter() - start)
+
+            for _ in range(10):
+                db.expunge_all()
+                start = time.perf_counter()
+                [x.value for x in repo.all()]
+                timings['list'].append(time.perf_counter() - start)
+        finally:
+            db.rollback()
+            for obj in db.query(obj_cls).filter(obj_cls.name.in_(names)):
+                db.delete(obj)
+            db.commit()
+            db.close()
+
+        _bench_log(f"{layout} layout:")
+        for op, op_timings in timings.items():
+            _bench_log(f"{op}: {summarize_timings(op_timings)}", depth=1)
+    return
+
+
 # Running
 
 @cli.group(invoke_without_command=True)
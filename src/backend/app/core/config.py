@@ -36,7 +36,12 @@ def getenv_bool(name: str, default: bool = False) -> bool:
     return rv
 
 
-def getenv_int(name: str, default: tp.Optional[int] = None) -> int:
+def getenv_int(
+    name: str,
+    default: tp.Optional[int] = None,
+    *,
+    allow_empty: bool = False
+) -> int:
     """Gets an integer-valued environment variable.
 
     Parameters
@@ -46,6 +51,9 @@ def getenv_int(name: str, default: tp.Optional[int] = None) -> int:
     default : int, optional
         The default value to use (if the `name` variable doesn't exist),
         the default value is ``None``.
+    allow_empty : bool, optional
+        Whether or not to allow the `name` variable to be set to an empty
+        value, giving ``None`` (default is ``False``).
 
     Returns
     -------
@@ -56,7 +64,10 @@ def getenv_int(name: str, default: tp.Optional[int] = None) -> int:
     rv = default
     env_value = os.getenv(name)
     if env_value is not None:
-        rv = int(env_value)
+        if allow_empty and not env_value.strip():
+            rv = None
+        else:
+            rv = int(env_value)
     return rv
 
 
@@ -162,12 +173,34 @@ PROJECT_NAME = getenv_quotestr('PROJECT_NAME')
 SERVER_NAME = os.getenv('SERVER_NAME')
 SERVER_HOST = os.getenv('SERVER_HOST')
 SERVER_PORT = getenv_int('SERVER_PORT')
+SERVER_TIMING_ENABLED = getenv_bool('SERVER_TIMING_ENABLED', True)
+
+METRICS_ENABLED = getenv_bool('METRICS_ENABLED')
+METRICS_MULTIPROC_DIR = os.getenv('PROMETHEUS_MULTIPROC_DIR')
 
 # Security
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 8  # 8 days
 ALLOWED_ORIGINS = getenv_list('ALLOWED_ORIGINS')
 EMAIL_RESET_TOKEN_EXPIRE_HOURS = 24
 
+AUTH_CACHE_SIZE = getenv_int('AUTH_CACHE_SIZE', 1024)
+AUTH_CACHE_TTL = getenv_int('AUTH_CACHE_TTL', 60)
+AUTH_CACHE_CHECK_INTERVAL = getenv_int('AUTH_CACHE_CHECK_INTERVAL', 5)
+
+PASSWORD_SCHEMES = getenv_list('PASSWORD_SCHEMES', ['bcrypt'])
+PASSWORD_BCRYPT_ROUNDS = getenv_int('PASSWORD_BCRYPT_ROUNDS', 12)
+PASSWORD_ARGON2_TIME_COST = getenv_int('PASSWORD_ARGON2_TIME_COST')
+PASSWORD_ARGON2_MEMORY_COST = getenv_int('PASSWORD_ARGON2_MEMORY_COST')
+
+LOGIN_RATE_LIMIT_ENABLED = getenv_bool('LOGIN_RATE_LIMIT_ENABLED', True)
+LOGIN_RATE_LIMIT_STORE = os.getenv('LOGIN_RATE_LIMIT_STORE', 'memory')
+LOGIN_RATE_LIMIT_PATH = os.getenv('LOGIN_RATE_LIMIT_PATH')
+LOGIN_RATE_LIMIT_PERIOD = getenv_int('LOGIN_RATE_LIMIT_PERIOD', 60)
+LOGIN_RATE_LIMIT_IP = getenv_int('LOGIN_RATE_LIMIT_IP', 30)
+LOGIN_RATE_LIMIT_USER = getenv_int('LOGIN_RATE_LIMIT_USER', 10)
+
+TRUSTED_PROXIES = getenv_list('TRUSTED_PROXIES')
+
 SECRET_KEY = os.getenv('SECRET_KEY')
 if SECRET_KEY is None:
     if not DEBUG:
@@ -189,6 +222,47 @@ DB_PORT = getenv_int('DB_PORT')
 DB_USER = os.getenv('DB_USER')
 DB_CONNECT_EXTRA = getenv_dict('DB_CONNECT_EXTRA')
 
+DB_POOL_SIZE = getenv_int('DB_POOL_SIZE')
+DB_POOL_MAX_OVERFLOW = getenv_int('DB_POOL_MAX_OVERFLOW')
+DB_POOL_RECYCLE = getenv_int('DB_POOL_RECYCLE')
+DB_POOL_TIMEOUT = getenv_int('DB_POOL_TIMEOUT')
+DB_POOL_PRE_PING = getenv_bool('DB_POOL_PRE_PING', True)
+DB_POOL_USE_LIFO = getenv_bool('DB_POOL_USE_LIFO')
+
+DB_SQLITE_JOURNAL_MODE = os.getenv('DB_SQLITE_JOURNAL_MODE', 'WAL')
+DB_SQLITE_SYNCHRONOUS = os.getenv('DB_SQLITE_SYNCHRONOUS', 'NORMAL')
+DB_SQLITE_MMAP_SIZE = getenv_int(
+    'DB_SQLITE_MMAP_SIZE', 268435456, allow_empty=True
+)
+DB_SQLITE_CACHE_SIZE = getenv_int(
+    'DB_SQLITE_CACHE_SIZE', -65536, allow_empty=True
+)
+DB_SQLITE_TEMP_STORE = os.getenv('DB_SQLITE_TEMP_STORE', 'MEMORY')
+DB_SQLITE_BUSY_TIMEOUT = getenv_int(
+    'DB_SQLITE_BUSY_TIMEOUT', 5000, allow_empty=True
+)
+
+DB_READ_ONLY_SAFE_METHODS = getenv_bool('DB_READ_ONLY_SAFE_METHODS', True)
+DB_REPLICA_URIS = getenv_list('DB_REPLICA_URIS')
+DB_REPLICA_CHECK_INTERVAL = getenv_int('DB_REPLICA_CHECK_INTERVAL', 10)
+
+DB_REPEATED_QUERY_THRESHOLD = getenv_int('DB_REPEATED_QUERY_THRESHOLD', 10)
+DB_REPEATED_QUERY_CHECK = getenv_bool('DB_REPEATED_QUERY_CHECK', DEBUG)
+DB_REPEATED_QUERY_RAISE = getenv_bool('DB_REPEATED_QUERY_RAISE')
+
+SETTINGS_STORAGE_LAYOUT = os.getenv('SETTINGS_STORAGE_LAYOUT', 'joined')
+SETTINGS_CACHE_ENABLED = getenv_bool('SETTINGS_CACHE_ENABLED', True)
+SETTINGS_CACHE_CHECK_INTERVAL = getenv_int('SETTINGS_CACHE_CHECK_INTERVAL', 5)
+PERMISSIONS_CACHE_SIZE = getenv_int('PERMISSIONS_CACHE_SIZE', 1024)
+PERMISSIONS_CACHE_CHECK_INTERVAL = getenv_int(
+    'PERMISSIONS_CACHE_CHECK_INTERVAL', 5
+)
+
+# Concurrency
+THREADPOOL_MAX_WORKERS = getenv_int('THREADPOOL_MAX_WORKERS')
+THREADPOOL_POOL_HEADROOM = getenv_int('THREADPOOL_POOL_HEADROOM')
+PASSWORD_HASH_WORKERS = getenv_int('PASSWORD_HASH_WORKERS')
+
 # Emails
 EMAILS_ENABLED = getenv_bool("EMAILS_ENABLED")
 
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Application (Prometheus) metrics.
+
+When running multiple worker processes the ``PROMETHEUS_MULTIPROC_DIR``
+environment variable must point to a (writable, initially empty) local
+directory so the metrics from each process can be aggregated.
+"""
+import functools
+import typing as tp
+
+from prometheus_client import CollectorRegistry
+from prometheus_client import CONTENT_TYPE_LATEST
+from prometheus_client import Counter
+from prometheus_client import Gauge
+from prometheus_client import Histogram
+from prometheus_client import REGISTRY
+from prometheus_client import generate_latest
+from prometheus_client import multiprocess
+
+from app.core import config
+
+
+# Metrics
+
+# - Requests
+REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    "HTTP request handling time.",
+    ['method', 'route', 'status']
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    'http_requests_in_progress',
+    "HTTP requests currently being handled.",
+    multiprocess_mode='livesum'
+)
+
+# - Executor
+EXECUTOR_QUEUED = Gauge(
+    'executor_queued_tasks',
+    "Blocking tasks waiting for a worker thread.",
+    multiprocess_mode='livesum'
+)
+EXECUTOR_RUNNING = Gauge(
+    'executor_running_tasks',
+    "Blocking tasks currently running on a worker thread.",
+    multiprocess_mode='livesum'
+)
+
+# - Database
+DB_POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out_connections',
+    "Database connections currently checked out from the pool.",
+    multiprocess_mode='livesum'
+)
+DB_POOL_OVERFLOW = Gauge(
+    'db_pool_overflow_connections',
+    "Database connections currently open in excess of the pool size.",
+    multiprocess_mode='livesum'
+)
+
+# - Storage
+REPOSITORY_CALLS = Counter(
+    'repository_calls',
+    "Calls made to storage repository methods.",
+    ['repository', 'method']
+)
+
+# - Security
+AUTH_FAILURES = Counter(
+    'auth_failures',
+    "Failed authentication/authorization attempts.",
+    ['reason']
+)
+
+
+# Functions
+
+def count_calls(
+    repository: str,
+    method: str,
+    func: tp.Callable
+) -> tp.Callable:
+    """Wraps a repository method to count the calls made to it.
+
+    Parameters
+    ----------
+    repository : str
+        The name of the repository the method belongs to.
+    method : str
+        The name of the method.
+    func : Callable
+        The method function to wrap.
+
+    Returns
+    -------
+    Callable
+        The wrapped method function.
+
+    """
+    counter = REPOSITORY_CALLS.labels(repository, method)
+
+    @functools.wraps(func)
+    def _counted(*args, **kwargs):
+        counter.inc()
+        return func(*args, **kwargs)
+
+    return _counted
+
+
+def generate_metrics() -> tp.Tuple[bytes, str]:
+    """Generates the current metrics in the Prometheus text format.
+
+    Returns
+    -------
+    bytes
+        The metrics output (aggregated across all worker processes if
+        running in multiprocess mode).
+    str
+        The content type of the output.
+
+    """
+    if config.METRICS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(
+            registry, path=config.METRICS_MULTIPROC_DIR
+        )
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -2,13 +2,169 @@
 """
 Core security functionality for the backend API.
 """
+from enum import IntFlag
+import os
 import typing as tp
+from uuid import UUID
 
 from passlib.context import CryptContext
 from pydantic import SecretStr
 
+from app.core import config
+from app.utils.concurrency import MonitoredThreadPoolExecutor
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def build_pwd_context(
+    schemes: tp.Sequence[str],
+    *,
+    bcrypt_rounds: tp.Optional[int] = None,
+    argon2_time_cost: tp.Optional[int] = None,
+    argon2_memory_cost: tp.Optional[int] = None
+) -> CryptContext:
+    """Creates the password hashing context to use.
+
+    Parameters
+    ----------
+    schemes : Sequence[str]
+        The password hashing schemes to support, the first is used for
+        new hashes while the others are deprecated (only used to verify
+        existing hashes, which are then upgraded).  The ``bcrypt``
+        scheme is always supported.
+    bcrypt_rounds : int, optional
+        The (log2) cost factor to use for new bcrypt hashes.
+    argon2_time_cost : int, optional
+        The number of iterations to use for new argon2 hashes (the
+        ``argon2`` scheme requires the ``argon2-cffi`` package).
+    argon2_memory_cost : int, optional
+        The memory (in KiB) to use for new argon2 hashes.
+
+    Returns
+    -------
+    CryptContext
+        The new password hashing context.  Existing hashes made with a
+        deprecated scheme, or with different costs, need updating.
+
+    """
+    schemes = [x.strip().lower() for x in schemes if x.strip()]
+    if 'bcrypt' not in schemes:
+        schemes.append('bcrypt')
+
+    settings = {}
+    if bcrypt_rounds is not None:
+        settings['bcrypt__rounds'] = bcrypt_rounds
+    if argon2_time_cost is not None:
+        settings['argon2__time_cost'] = argon2_time_cost
+    if argon2_memory_cost is not None:
+        settings['argon2__memory_cost'] = argon2_memory_cost
+    return CryptContext(schemes=schemes, deprecated="auto", **settings)
+
+
+pwd_context = build_pwd_context(
+    config.PASSWORD_SCHEMES,
+    bcrypt_rounds=config.PASSWORD_BCRYPT_ROUNDS,
+    argon2_time_cost=config.PASSWORD_ARGON2_TIME_COST,
+    argon2_memory_cost=config.PASSWORD_ARGON2_MEMORY_COST
+)
+
+# - Password hashing is deliberately slow (and CPU-bound), so it's run on
+#   its own bounded pool: concurrent logins queue up here rather than
+#   oversubscribing the CPUs and tying up the request threads.
+_hash_executor = MonitoredThreadPoolExecutor(
+    max_workers=config.PASSWORD_HASH_WORKERS or os.cpu_count(),
+    thread_name_prefix='password-hash'
+)
+
+
+class UserAuth(tp.NamedTuple):
+    """
+    Snapshot of a user's authorization-related fields.
+    """
+    uid: UUID
+    is_active: bool
+    is_poweruser: bool
+    is_superuser: bool
+
+    @classmethod
+    def from_user(cls, user: tp.Any) -> 'UserAuth':
+        """Creates the authorization snapshot of the given user."""
+        return cls(user.uid, user.is_active, user.is_poweruser,
+                   user.is_superuser)
+
+
+class PermissionAction(IntFlag):
+    """
+    Actions controlled by permissions.
+    """
+    CREATE = 1
+    READ = 2
+    UPDATE = 4
+    DELETE = 8
+
+
+class PermissionMatrix(object):
+    """
+    A user's resolved permissions (the actions allowed for each).
+
+    Parameters
+    ----------
+    actions : Mapping[str, PermissionAction], optional
+        The actions allowed, by permission name (permissions not given
+        allow nothing).
+
+    """
+    __slots__ = ('_actions',)
+
+    def __init__(
+        self,
+        actions: tp.Optional[tp.Mapping[str, PermissionAction]] = None
+    ) -> None:
+        self._actions = dict(actions or {})
+        return
+
+    def __getitem__(self, permission: str) -> PermissionAction:
+        return self._actions.get(permission, PermissionAction(0))
+
+    def __iter__(self) -> tp.Iterator[str]:
+        return iter(self._actions)
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    def allows(self, permission: str, action: PermissionAction) -> bool:
+        """Whether or not the action(s) are allowed for a permission.
+
+        Parameters
+        ----------
+        permission : str
+            The name of the permission to check.
+        action : PermissionAction
+            The action(s) to check are allowed.
+
+        Returns
+        -------
+        bool
+            Whether or not all the given action(s) are allowed.
+
+        """
+        return self[permission] & action == action
+
+    def to_dict(self) -> tp.Dict[str, tp.Dict[str, bool]]:
+        """Gets the allowed actions as a mapping of flags."""
+        return {
+            k: {a.name.lower(): bool(v & a) for a in PermissionAction}
+            for k, v in self._actions.items()
+        }
+
+
+def get_hash_executor() -> MonitoredThreadPoolExecutor:
+    """Gets the executor password hashing/verification is run on."""
+    return _hash_executor
+
+
+def _get_secret(value: tp.Union[str, SecretStr]) -> str:
+    if isinstance(value, SecretStr):
+        return value.get_secret_value()
+    return value
 
 
 def verify_password(
@@ -17,6 +173,36 @@ def verify_password(
 ) -> bool:
     """Verifies the given plaintext password against the hash.
 
+    The verification is run on the password hashing executor, blocking
+    the calling thread until done.
+
+    Parameters
+    ----------
+    plain_password : str
+        The plaintext password to verify.
+    hashed_password : str
+        The password hash to verify the given `plain_password` against.
+
+    Returns
+    -------
+    bool
+        Whether or not the given password matches the given hash.
+
+    """
+    return _hash_executor.submit(
+        pwd_context.verify, _get_secret(plain_password), hashed_password
+    ).result()
+
+
+def verify_and_update_password(
+    plain_password: tp.Union[str, SecretStr],
+    hashed_password: str
+) -> tp.Tuple[bool, tp.Optional[str]]:
+    """Verifies the given plaintext password, rehashing it if needed.
+
+    The verification is run on the password hashing executor, blocking
+    the calling thread until done.
+
     Parameters
     ----------
     plain_password : str
@@ -28,16 +214,24 @@ def verify_password(
     -------
     bool
         Whether or not the given password matches the given hash.
+    str or None
+        The new hash to replace `hashed_password` with, if it was
+        verified but made with a deprecated scheme or different costs
+        (``None`` otherwise).
 
     """
-    if isinstance(plain_password, SecretStr):
-        plain_password = plain_password.get_secret_value()
-    return pwd_context.verify(plain_password, hashed_password)
+    return _hash_executor.submit(
+        pwd_context.verify_and_update, _get_secret(plain_password),
+        hashed_password
+    ).result()
 
 
 def get_password_hash(password: tp.Union[str, SecretStr]) -> str:
     """Gets the hashed password from the given plaintext.
 
+    The hash is computed on the password hashing executor, blocking the
+    calling thread until done.
+
     Parameters
     ----------
     password : str
@@ -49,6 +243,6 @@ def get_password_hash(password: tp.Union[str, SecretStr]) -> str:
         The hashed password.
 
     """
-    if isinstance(password, SecretStr):
-        password = password.get_secret_value()
-    return pwd_context.hash(password)
+    return _hash_executor.submit(
+        pwd_context.hash, _get_secret(password)
+    ).result()
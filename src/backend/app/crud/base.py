@@ -5,9 +5,12 @@ Base class for CRUD repositories.
 from abc import ABC
 from abc import ABCMeta
 from abc import abstractmethod
+import inspect
 import typing as tp
 from uuid import UUID
 
+from app.core import config
+from app.core.metrics import count_calls
 from app.exceptions import ObjectExistsError
 
 if tp.TYPE_CHECKING:
@@ -31,12 +34,30 @@ class BaseRepository(tp.Generic[T, C, U], metaclass=ABCMeta):
     """
     __obj_cls__: tp.Type[T]
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # - Count the calls made to (concrete) repositories' methods, those
+        #   inherited from another concrete repository are already counted
+        if not config.METRICS_ENABLED or '__obj_cls__' not in cls.__dict__:
+            return
+        for name, func in inspect.getmembers(cls, inspect.isfunction):
+            if name.startswith('_') or hasattr(func, '__wrapped__'):
+                continue
+            setattr(cls, name,
+                    count_calls(cls.__obj_cls__.__name__, name, func))
+        return
+
     def __init__(self, unit_of_work: 'UnitOfWork') -> None:
         self._uow = unit_of_work
         return
 
     @abstractmethod
-    def get(self, *, raise_ex: bool = False) -> tp.Optional[T]:
+    def get(
+        self,
+        *,
+        raise_ex: bool = False,
+        profile: tp.Optional[str] = None
+    ) -> tp.Optional[T]:
         """Gets an object from the repository.
 
         Parameters
@@ -44,6 +65,9 @@ class BaseRepository(tp.Generic[T, C, U], metaclass=ABCMeta):
         raise_ex : bool, optional
             Whether or not to raise an exception if no object is
             retrieved (default is ``False``).
+        profile : str, optional
+            The loading profile to use for the object's related objects
+            (by default these are only loaded when accessed).
 
         Returns
         -------
@@ -122,6 +146,57 @@ class BaseRepository(tp.Generic[T, C, U], metaclass=ABCMeta):
         """
         pass
 
+    def create_many(self, objs: tp.Iterable[C]) -> tp.List[T]:
+        """Creates and stores multiple new objects.
+
+        Parameters
+        ----------
+        objs : Iterable[C]
+            The data for each of the new objects to create.
+
+        Returns
+        -------
+        List[T]
+            The newly created objects (in the same order as `objs`).
+
+        """
+        return [self.create(x) for x in objs]
+
+    def update_many(
+        self,
+        updates: tp.Iterable[tp.Tuple[T, U]]
+    ) -> tp.List[T]:
+        """Updates multiple existing objects with new data.
+
+        Parameters
+        ----------
+        updates : Iterable[Tuple[T, U]]
+            The pairs of current object and the data to update it with.
+
+        Returns
+        -------
+        List[T]
+            The updated objects (in the same order as `updates`).
+
+        """
+        return [self.update(obj, updated) for obj, updated in updates]
+
+    def delete_many(self, objs: tp.Iterable[T]) -> tp.List[T]:
+        """Deletes multiple objects from this repository.
+
+        Parameters
+        ----------
+        objs : Iterable[T]
+            The objects to remove.
+
+        Returns
+        -------
+        List[T]
+            The removed objects.
+
+        """
+        return [self.delete(x) for x in objs]
+
 
 class Repository(BaseRepository[T, C, U], metaclass=ABCMeta):
     """
@@ -133,7 +208,8 @@ class Repository(BaseRepository[T, C, U], metaclass=ABCMeta):
         self,
         id: UUID,
         *,
-        raise_ex: bool = False
+        raise_ex: bool = False,
+        profile: tp.Optional[str] = None
     ) -> tp.Optional[T]:
         """Gets the object with the specified UUID.
 
@@ -145,6 +221,9 @@ class Repository(BaseRepository[T, C, U], metaclass=ABCMeta):
         raise_ex : bool, optional
             Whether or not to raise an exception if the object isn't
             found (default is ``False``).
+        profile : str, optional
+            The loading profile to use for the object's related objects
+            (by default these are only loaded when accessed).
 
         Returns
         -------
@@ -196,27 +275,97 @@ class Repository(BaseRepository[T, C, U], metaclass=ABCMeta):
         """
         pass
 
+    @abstractmethod
+    def get_many(
+        self,
+        ids: tp.Sequence[UUID],
+        *,
+        raise_missing: bool = False,
+        profile: tp.Optional[str] = None
+    ) -> tp.List[T]:
+        """Gets the objects with the specified UUIDs.
+
+        Parameters
+        ----------
+        ids : Sequence[UUID]
+            The UUID identifiers of the objects to get (corresponding to
+            the objects' ``uid`` fields).
+        raise_missing : bool, optional
+            Whether or not to raise an exception if any of the objects
+            aren't found (default is ``False``, in which case they are
+            left out of the results).
+        profile : str, optional
+            The loading profile to use for the objects's related objects
+            (by default these are only loaded when accessed).
+
+        Returns
+        -------
+        List[T]
+            The objects found, in the same order as the `ids` given.
+
+        Raises
+        ------
+        ObjectNotFoundError
+            If any of the objects weren't found and the `raise_missing`
+            parameter is set to ``True``.
+
+        """
+        pass
+
     @abstractmethod
     def all(
         self,
         *,
         skip: tp.Optional[int] = None,
-        limit: tp.Optional[int] = None
+        limit: tp.Optional[int] = None,
+        cursor: tp.Optional[str] = None,
+        profile: tp.Optional[str] = None
     ) -> tp.List[T]:
         """Gets all objects in the repository.
 
+        Results are always returned in the repository's sort order, so
+        pages are stable. Prefer the `cursor` (from :meth:`get_cursor`)
+        over `skip` for paging through large repositories.
+
         Parameters
         ----------
         skip : int, optional
             The number of items to skip when fetching all.
         limit : int, optional
             The number of items to limit results to when fetching all.
+        cursor : str, optional
+            The cursor to start fetching results after.
+        profile : str, optional
+            The loading profile to use for the objects's related objects
+            (by default these are only loaded when accessed).
 
         Returns
         -------
         List[T]
             The list of objects requested.
 
+        Raises
+        ------
+        InvalidCursorError
+            If the given `cursor` is invalid.
+
+        """
+        pass
+
+    @abstractmethod
+    def get_cursor(self, obj: T) -> str:
+        """Gets the pagination cursor for the results after `obj`.
+
+        Parameters
+        ----------
+        obj : T
+            The last object of the current page of results.
+
+        Returns
+        -------
+        str
+            The cursor to pass to :meth:`all` to get the next page.
+
         """
         pass
 
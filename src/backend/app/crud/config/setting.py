@@ -9,6 +9,7 @@ import typing as tp
 from app.crud.base import Repository
 from app.crud.base import T
 from app.models.config.setting import DataT
+from app.models.config.setting import Setting as SettingModel
 from app.models.config.setting import SettingCreate
 from app.models.config.setting import SettingUpdate
 from app.models.config.setting import ValueType
@@ -67,6 +68,69 @@ class SettingRepository(
         """
         pass
 
+    def get_snapshot(
+        self,
+        name: str,
+        *,
+        raise_ex: bool = False
+    ) -> tp.Optional[SettingModel]:
+        """Gets a read-only snapshot of a setting from the name given.
+
+        Implementations may serve snapshots from a cache, so they should
+        be used (rather than :meth:`get_by_name`) for reads which don't
+        lead to changes.
+
+        Parameters
+        ----------
+        name : str
+            The name of the setting to get.
+        raise_ex : bool, optional
+            Whether or not to raise an exception if the setting is not
+            found (default is ``False``).
+
+        Returns
+        -------
+        SettingModel or None
+            The snapshot of the setting with the `name` given (if found,
+            ``None`` otherwise).
+
+        Raises
+        ------
+        ObjectNotFoundError
+            If the setting with the specified `name` couldn't be found
+            and `raise_ex` is set to ``True``.
+
+        """
+        rv = self.get_by_name(name, raise_ex=raise_ex)
+        if rv is None:
+            return None
+        return SettingModel.from_orm(rv)
+
+    def get_values(
+        self,
+        names: tp.Iterable[str]
+    ) -> tp.Dict[str, tp.Optional[DataT]]:
+        """Gets the values of multiple settings from the names given.
+
+        Parameters
+        ----------
+        names : Iterable[str]
+            The names of the settings to get the values of.
+
+        Returns
+        -------
+        Dict[str, Optional[DataT]]
+            The values of the settings, by name (any which don't exist
+            are omitted).
+
+        """
+        rv = {}
+        for name in names:
+            setting = self.get_snapshot(name)
+            if setting is not None:
+                rv[name] = setting.value
+        return rv
+
     def update_value(
         self,
         name: str,
@@ -3,7 +3,10 @@
 Permission specification object storage repository.
 """
 from abc import ABCMeta
+from abc import abstractmethod
+from uuid import UUID
 
+from app.core.security import PermissionMatrix
 from app.crud.base import Repository
 from app.crud.base import T
 from app.models.config.user import UserPermissionCreate
@@ -17,4 +20,24 @@ class UserPermissionRepository(
     """
     User Permission object repository base class.
     """
-    pass
+
+    @abstractmethod
+    def get_matrix(self, user_uid: UUID) -> PermissionMatrix:
+        """Gets the resolved permissions of a user.
+
+        The user's own permission settings take precedence over each
+        permission's defaults.  Implementations may cache the result
+        (until any permissions change).
+
+        Parameters
+        ----------
+        user_uid : UUID
+            The UID of the user to get the permissions of.
+
+        Returns
+        -------
+        PermissionMatrix
+            The actions allowed for the user, by permission name.
+
+        """
+        pass
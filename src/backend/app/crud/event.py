@@ -80,7 +80,8 @@ class EventRepository(
         start_date: tp.Optional[datetime.date] = None,
         end_date: tp.Optional[datetime.date] = None,
         skip: tp.Optional[int] = None,
-        limit: tp.Optional[int] = None
+        limit: tp.Optional[int] = None,
+        profile: tp.Optional[str] = None
     ) -> tp.List[T]:
         """Gets the event(s) with dates in the specified range.
 
@@ -90,6 +91,13 @@ class EventRepository(
             The starting date to use to get events (inclusive).
         end_date : datetime.date, optional
             The ending date to use to get events (exclusive).
+        skip : int, optional
+            The number of events to skip in the results.
+        limit : int, optional
+            The number of events to limit the results to.
+        profile : str, optional
+            The loading profile to use for the events' related objects
+            (by default these are only loaded when accessed).
 
         Returns
         -------
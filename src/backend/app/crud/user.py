@@ -4,21 +4,39 @@ User repository.
 """
 from abc import ABCMeta
 from abc import abstractmethod
+import hashlib
 import typing as tp
 
+from app.core.security import UserAuth
 from app.core.security import get_password_hash
-from app.core.security import verify_password
+from app.core.security import verify_and_update_password
 from app.crud.base import Repository
 from app.crud.base import T
 from app.models.user import UserCreate
 from app.models.user import UserUpdate
+from app.utils.cache import TTLCache
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
 
 
 class UserRepository(Repository[T, UserCreate, UserUpdate], metaclass=ABCMeta):
     """
     User object storage repository mixin.
+
+    Authorization snapshots of users are cached by (valid) access token
+    in the cache given by :attr:`_auth_cache`, which implementations
+    must drop once changes to any user's authorization fields (or the
+    removal of a user) are committed.
     """
 
+    @property
+    @abstractmethod
+    def _auth_cache(self) -> TTLCache[str, UserAuth]:
+        """TTLCache: The (current) cache of authorization snapshots."""
+        pass
+
     @abstractmethod
     def get_by_email(
         self,
@@ -95,6 +113,10 @@ class UserRepository(Repository[T, UserCreate, UserUpdate], metaclass=ABCMeta):
     def authenticate(self, email: str, password: str) -> tp.Optional[T]:
         """Authenticates (and returns) the user with given credentials.
 
+        If the user's password hash was made with a deprecated scheme
+        (or different costs than currently configured) it's replaced
+        with an up-to-date hash of the verified password.
+
         Parameters
         ----------
         email : str
@@ -112,6 +134,52 @@ class UserRepository(Repository[T, UserCreate, UserUpdate], metaclass=ABCMeta):
         user = self.get_by_email(email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = verify_and_update_password(
+            password, user.hashed_password
+        )
+        if not verified:
             return None
+        if new_hash:
+            with self._uow:
+                user.hashed_password = new_hash
         return user
+
+    def get_cached_auth(self, token: str) -> tp.Optional[UserAuth]:
+        """Gets the cached user authorization snapshot for a token.
+
+        Parameters
+        ----------
+        token : str
+            The access token to get the cached snapshot for.
+
+        Returns
+        -------
+        UserAuth or None
+            The snapshot of the token's user (if cached and unexpired,
+            ``None`` otherwise).
+
+        """
+        return self._auth_cache.get(_token_key(token))
+
+    def cache_auth(
+        self,
+        token: str,
+        auth: UserAuth,
+        *,
+        expires: float
+    ) -> None:
+        """Caches the user authorization snapshot for a validated token.
+
+        Parameters
+        ----------
+        token : str
+            The (validated) access token to cache the snapshot for.
+        auth : UserAuth
+            The authorization snapshot of the token's user.
+        expires : float
+            The token's expiry (UNIX) timestamp, the cached entry never
+            outlives it.
+
+        """
+        self._auth_cache.set(_token_key(token), auth, expires=expires)
+        return
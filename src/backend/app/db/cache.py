@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Process-wide caches of database data.
+"""
+import threading
+import time
+import typing as tp
+
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import Insert
+
+from app.db.models.config.version import CacheVersion
+
+
+V = tp.TypeVar('V')
+
+
+def get_cache_version(session: Session, name: str) -> int:
+    """Gets the current version of the given cache's data.
+
+    Parameters
+    ----------
+    session : Session
+        The database session to use.
+    name : str
+        The name of the cache to get the data version for.
+
+    Returns
+    -------
+    int
+        The number of changes made to the cache's data.
+
+    """
+    rv = session.query(CacheVersion.version) \
+        .filter(CacheVersion.name == name) \
+        .scalar()
+    return rv or 0
+
+
+def bump_cache_version(session: Session, name: str) -> None:
+    """Increments the version of the given cache's data.
+
+    The change is made as part of the `session`'s current transaction,
+    so it's only seen by other processes along with the changes made to
+    the data itself.
+
+    Parameters
+    ----------
+    session : Session
+        The database session to use.
+    name : str
+        The name of the cache to increment the data version for.
+
+    """
+    def _increment() -> int:
+        return session.query(CacheVersion) \
+            .filter(CacheVersion.name == name) \
+            .update({CacheVersion.version: CacheVersion.version + 1},
+                    synchronize_session=False)
+
+    if not _increment():
+        # - Another process may be creating the counter at the same time,
+        #   so it's only created if still missing (then incremented).
+        session.execute(_insert_missing(session.get_bind(), name))
+        _increment()
+    return
+
+
+def _insert_missing(bind: Engine, name: str) -> Insert:
+    """Creates the statement adding a (zero) counter if it's missing."""
+    table = CacheVersion.__table__
+    if bind.dialect.name == 'postgresql':
+        return postgresql.insert(table) \
+            .values(name=name, version=0) \
+            .on_conflict_do_nothing(index_elements=[table.c.name])
+    stmt = table.insert().values(name=name, version=0)
+    if bind.dialect.name == 'sqlite':
+        return stmt.prefix_with('OR IGNORE')
+    elif bind.dialect.name == 'mysql':
+        return stmt.prefix_with('IGNORE')
+    return stmt
+
+
+class VersionedCache(tp.Generic[V]):
+    """
+    Process-wide cache of data loaded from the database.
+
+    The data is loaded in full (by the `loader`) and kept until its
+    version counter in the database changes, i.e. until any process
+    calls :meth:`changed` for it and commits.
+
+    Parameters
+    ----------
+    name : str
+        The name of the cache (and its version counter).
+    loader : Callable[[Session], V]
+        The function to load the (detached) data to cache with.
+    check_interval : float, optional
+        The time (in seconds) between checks of the data's version, up
+        to which changes made by other processes may not be seen
+        (default is 0, to check on every access).
+    timer : Callable[[], float], optional
+        The clock to use (default is :func:`time.monotonic`).
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: tp.Callable[[Session], V],
+        *,
+        check_interval: float = 0.0,
+        timer: tp.Callable[[], float] = time.monotonic
+    ) -> None:
+        self.name = name
+        self.loader = loader
+        self.check_interval = check_interval
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._data: tp.Optional[V] = None
+        self._version: tp.Optional[int] = None
+        self._checked: tp.Optional[float] = None
+        return
+
+    def get(self, session: Session) -> V:
+        """Gets the (current) cached data.
+
+        Parameters
+        ----------
+        session : Session
+            The database session to use to check the data's version and
+            (re)load it, if needed.
+
+        Returns
+        -------
+        V
+            The cached data.
+
+        """
+        now = self._timer()
+        with self._lock:
+            if self._data is not None and self._checked is not None \
+                    and now - self._checked < self.check_interval:
+                return self._data
+            version = get_cache_version(session, self.name)
+            if self._data is None or version != self._version:
+                self._data = self.loader(session)
+                self._version = version
+            self._checked = now
+            return self._data
+
+    def expire(self) -> None:
+        """Makes the next access check the data's version."""
+        with self._lock:
+            self._checked = None
+        return
+
+    def clear(self) -> None:
+        """Removes the cached data."""
+        with self._lock:
+            self._data = None
+            self._version = None
+            self._checked = None
+        return
+
+    def changed(self, session: Session) -> None:
+        """Marks the cached data as changed by the given session.
+
+        The data's version is incremented in the session's transaction,
+        and the data in this process is checked again once it commits.
+
+        Parameters
+        ----------
+        session : Session
+            The database session making the changes.
+
+        """
+        bump_cache_version(session, self.name)
+
+        key = f'{self.name}_cache_changed'
+        if not session.info.get(key):
+            session.info[key] = True
+
+            def _after_commit(session: Session) -> None:
+                session.info.pop(key, None)
+                self.expire()
+                return
+
+            event.listen(session, 'after_commit', _after_commit, once=True)
+        return
@@ -7,10 +7,15 @@ from abc import ABCMeta
 import typing as tp
 from uuid import UUID
 
+from sqlalchemy import inspect
+from sqlalchemy.orm import Query
 from sqlalchemy.orm import Session
 
 from app.crud.base import (T, C, U)
+from app.exceptions import InvalidCursorError
 from app.exceptions import ObjectNotFoundError
+from app.utils.pagination import decode_cursor
+from app.utils.pagination import encode_cursor
 
 if tp.TYPE_CHECKING:
     from app.crud.core import UnitOfWork
@@ -20,6 +25,10 @@ class BaseSQLRepositoryMixin(ABC):
     """
     SQLAlchemy-based object storage repository base mixin class.
 
+    Loading profiles for related objects are declared in the
+    ``__load_profiles__`` mapping of profile name to the SQLAlchemy
+    loader options to apply (e.g. ``selectinload``/``joinedload``).
+
     Parameters
     ----------
     unit_of_work : UnitOfWork
@@ -28,6 +37,7 @@ class BaseSQLRepositoryMixin(ABC):
         The SQL Alchemy session object to use.
 
     """
+    __load_profiles__: tp.Dict[str, tp.Sequence[tp.Any]] = {}
 
     def __init__(
         self,
@@ -37,42 +47,161 @@ class BaseSQLRepositoryMixin(ABC):
         self._session = db_session
         return super().__init__(unit_of_work)
 
+    def _query(self, profile: tp.Optional[str] = None) -> Query:
+        """Creates a new query for this repository's objects.
+
+        Parameters
+        ----------
+        profile : str, optional
+            The loading profile to apply to the query (if any).
+
+        Returns
+        -------
+        Query
+            The new query object.
+
+        Raises
+        ------
+        ValueError
+            If the given `profile` isn't defined for this repository.
+
+        """
+        rv = self._session.query(self.__obj_cls__)
+        if profile is not None:
+            try:
+                options = self.__load_profiles__[profile]
+            except KeyError:
+                raise ValueError(
+                    f"Unknown loading profile for {type(self).__name__}: "
+                    f"{profile}"
+                )
+            rv = rv.options(*options)
+        return rv
+
+    @property
+    def _identity_map(self) -> tp.Dict[UUID, tp.Any]:
+        """Dict[UUID, Any]: The unit of work's UID to object mapping."""
+        return self._uow.identity_map
+
     def create(self, obj: C) -> T:
         new_obj = super().create(obj)
         self._session.add(new_obj)
-        self._session.flush()
+        self._uow.flush()
         return new_obj
 
     def update(self, obj: T, update: U) -> T:
         obj = super().update(obj, update)
         self._session.add(obj)
-        self._session.flush()
+        self._uow.flush()
         return obj
 
     def delete(self, obj: T) -> T:
+        self._identity_map.pop(getattr(obj, 'uid', None), None)
         self._session.delete(obj)
-        self._session.flush()
+        self._uow.flush()
         return obj
 
+    def create_many(self, objs: tp.Iterable[C]) -> tp.List[T]:
+        with self._uow.deferred_flush():
+            return super().create_many(objs)
+
+    def update_many(
+        self,
+        updates: tp.Iterable[tp.Tuple[T, U]]
+    ) -> tp.List[T]:
+        with self._uow.deferred_flush():
+            return super().update_many(updates)
+
+    def delete_many(self, objs: tp.Iterable[T]) -> tp.List[T]:
+        with self._uow.deferred_flush():
+            return super().delete_many(objs)
+
 
 class SQLRepositoryMixin(BaseSQLRepositoryMixin, metaclass=ABCMeta):
     """
     SQLAlchemy-based ID object storage repository mixin class.
     """
+    __max_in_size__: int = 500
 
     def get(
         self,
         id: UUID,
         *,
-        raise_ex: bool = False
+        raise_ex: bool = False,
+        profile: tp.Optional[str] = None
     ) -> tp.Optional[T]:
-        rv = self._session.query(self.__obj_cls__) \
-            .filter(self.__obj_cls__.uid == id) \
-            .first()
+        rv = self._get_loaded(id, profile)
+        if rv is None:
+            rv = self._query(profile) \
+                .filter(self.__obj_cls__.uid == id) \
+                .first()
+            if rv is not None:
+                self._identity_map[id] = rv
         if not rv and raise_ex:
             raise ObjectNotFoundError(self.__obj_cls__, 'id')
         return rv
 
+    def get_many(
+        self,
+        ids: tp.Sequence[UUID],
+        *,
+        raise_missing: bool = False,
+        profile: tp.Optional[str] = None
+    ) -> tp.List[T]:
+        found = {}
+        to_load = []
+        for id in ids:
+            if id in found:
+                continue
+            obj = self._get_loaded(id, profile)
+            if obj is None:
+                to_load.append(id)
+            else:
+                found[id] = obj
+
+        # - Load the rest in as few IN (...) queries as possible
+        to_load = list(dict.fromkeys(to_load))
+        col = self.__obj_cls__.uid
+        for i in range(0, len(to_load), self.__max_in_size__):
+            chunk = to_load[i:i + self.__max_in_size__]
+            for obj in self._query(profile).filter(col.in_(chunk)):
+                found[obj.uid] = obj
+                self._identity_map[obj.uid] = obj
+
+        if raise_missing:
+            for id in ids:
+                if id not in found:
+                    raise ObjectNotFoundError(
+                        self.__obj_cls__, 'id', str(id)
+                    )
+        return [found[x] for x in ids if x in found]
+
+    def _get_loaded(
+        self,
+        id: UUID,
+        profile: tp.Optional[str] = None
+    ) -> tp.Optional[T]:
+        """Gets the object with the given UID if it's already loaded.
+
+        If a loading `profile` is given, objects with any attributes
+        not loaded yet aren't returned, so they're queried (again) with
+        the profile's loader options - which fills in just the unloaded
+        attributes, leaving any changes made to the object as-is.
+        """
+        rv = self._identity_map.get(id)
+        if rv is None or not isinstance(rv, self.__obj_cls__):
+            return None
+        state = inspect(rv)
+        if state.session_id != self._session.hash_key or state.deleted \
+                or state.was_deleted:
+            # - Removed from the session outside of this repository
+            #   (e.g. via a cascading delete).
+            del self._identity_map[id]
+            return None
+        if profile is not None and state.unloaded:
+            return None
+        return rv
+
     def get_by_id(
         self,
         id: int,
@@ -90,12 +219,21 @@ class SQLRepositoryMixin(BaseSQLRepositoryMixin, metaclass=ABCMeta):
         self,
         *,
         skip: tp.Optional[int] = None,
-        limit: tp.Optional[int] = None
+        limit: tp.Optional[int] = None,
+        cursor: tp.Optional[str] = None,
+        profile: tp.Optional[str] = None
     ) -> tp.List[T]:
-        return self._session.query(self.__obj_cls__) \
-            .offset(skip) \
-            .limit(limit) \
-            .all()
+        cls = self.__obj_cls__
+        rv = self._query(profile).order_by(cls.id)
+        if cursor is not None:
+            last_id = decode_cursor(cursor)
+            if not isinstance(last_id, int):
+                raise InvalidCursorError(cursor)
+            rv = rv.filter(cls.id > last_id)
+        return rv.offset(skip).limit(limit).all()
+
+    def get_cursor(self, obj: T) -> str:
+        return encode_cursor(obj.id)
 
 
 class SQLSingletonRepositoryMixin(BaseSQLRepositoryMixin, metaclass=ABCMeta):
@@ -103,8 +241,13 @@ class SQLSingletonRepositoryMixin(BaseSQLRepositoryMixin, metaclass=ABCMeta):
     SQL-based singleton object storage repository mixin class.
     """
 
-    def get(self, *, raise_ex: bool = False) -> tp.Optional[T]:
-        rv = self._session.query(self.__obj_cls__).first()
+    def get(
+        self,
+        *,
+        raise_ex: bool = False,
+        profile: tp.Optional[str] = None
+    ) -> tp.Optional[T]:
+        rv = self._query(profile).first()
         if not rv and raise_ex:
             raise ObjectNotFoundError(self.__obj_cls__)
         return rv
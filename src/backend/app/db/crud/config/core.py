@@ -6,6 +6,7 @@ from app.crud.config.core import ConfigRepositoryGroup
 from app.db.crud.base import SQLRepositoryGroupMixin
 from app.db.crud.config.permission import PermissionSQLRepository
 from app.db.crud.config.setting import SettingSQLRepository
+from app.db.crud.config.setting import get_setting_repository_type
 from app.db.crud.config.user import UserPermissionSQLRepository
 from app.utils.proputils import lazy_property
 
@@ -28,8 +29,9 @@ class ConfigSQLRepositoryGroup(
 
     @lazy_property
     def setting(self) -> SettingSQLRepository:
-        """SettingSQLRepository: Setting storage repository."""
-        return SettingSQLRepository(
+        """SettingSQLRepository: Setting storage repository (for the
+        configured storage layout)."""
+        return get_setting_repository_type()(
             self._uow, self._session, *self._args, **self._kwargs
         )
 
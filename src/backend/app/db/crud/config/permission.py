@@ -2,9 +2,33 @@
 """
 Permission specification SQL-based object repository.
 """
+import math
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core import config
+from app.core.security import PermissionMatrix
 from app.crud.config.permission import PermissionRepository
+from app.db.cache import VersionedCache
 from app.db.crud.base import SQLRepositoryMixin
 from app.db.models.config.permission import Permission
+from app.models.config.permission import PermissionCreate
+from app.models.config.permission import PermissionUpdate
+from app.utils.cache import TTLCache
+
+
+def _new_matrices(session: Session) -> TTLCache[UUID, PermissionMatrix]:
+    # - Entries don't expire, they're only evicted to stay within the size
+    return TTLCache(config.PERMISSIONS_CACHE_SIZE, math.inf)
+
+
+# - Resolved permission matrices by user UID, filled in as each user's
+#   is needed (up to the configured size) and dropped in full on any
+#   permission change.
+matrix_cache: VersionedCache[TTLCache[UUID, PermissionMatrix]] = \
+    VersionedCache('permissions', _new_matrices,
+                   check_interval=config.PERMISSIONS_CACHE_CHECK_INTERVAL)
 
 
 class PermissionSQLRepository(
@@ -15,3 +39,18 @@ class PermissionSQLRepository(
     Permission SQL-based object storage repository.
     """
     __obj_cls__ = Permission
+
+    def create(self, obj: PermissionCreate) -> Permission:
+        rv = super().create(obj)
+        matrix_cache.changed(self._session)
+        return rv
+
+    def update(self, obj: Permission, updated: PermissionUpdate) -> Permission:
+        rv = super().update(obj, updated)
+        matrix_cache.changed(self._session)
+        return rv
+
+    def delete(self, obj: Permission) -> Permission:
+        rv = super().delete(obj)
+        matrix_cache.changed(self._session)
+        return rv
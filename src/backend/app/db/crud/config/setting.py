@@ -2,10 +2,23 @@
 """
 SQL-based configuration Setting storage repository implementation.
 """
+import typing as tp
+
+from sqlalchemy.orm import Session
+
+from app.core import config
 from app.crud.config.setting import SettingRepository
+from app.db.cache import VersionedCache
 from app.db.crud.base import SQLRepositoryMixin
+from app.db.models.config.setting import FlatSetting
 from app.db.models.config.setting import Setting
 from app.db.models.config.setting import (
+    FlatSettingBoolean,
+    FlatSettingDatetime,
+    FlatSettingFloat,
+    FlatSettingInteger,
+    FlatSettingString,
+    FlatSettingUUID,
     SettingBoolean,
     SettingDatetime,
     SettingFloat,
@@ -13,7 +26,11 @@ from app.db.models.config.setting import (
     SettingString,
     SettingUUID,
 )
+from app.exceptions import ObjectNotFoundError
+from app.models.config.setting import DataT
+from app.models.config.setting import Setting as SettingModel
 from app.models.config.setting import SettingCreate
+from app.models.config.setting import SettingUpdate
 from app.models.config.setting import ValueType
 
 
@@ -26,6 +43,40 @@ _type_mapping = {
     ValueType.UUID: SettingUUID,
 }
 
+_flat_type_mapping = {
+    ValueType.BOOLEAN: FlatSettingBoolean,
+    ValueType.DATETIME: FlatSettingDatetime,
+    ValueType.FLOAT: FlatSettingFloat,
+    ValueType.INTEGER: FlatSettingInteger,
+    ValueType.STRING: FlatSettingString,
+    ValueType.UUID: FlatSettingUUID,
+}
+
+
+def _load_settings(session: Session) -> tp.Dict[str, SettingModel]:
+    """Loads snapshots of all the settings (in a single query)."""
+    query = session.query(get_setting_repository_type().__obj_cls__)
+    return {x.name: SettingModel.from_orm(x) for x in query}
+
+
+_settings_cache: VersionedCache[tp.Dict[str, SettingModel]] = \
+    VersionedCache('settings', _load_settings,
+                   check_interval=config.SETTINGS_CACHE_CHECK_INTERVAL)
+
+
+def warm_settings_cache(session: Session) -> None:
+    """Loads the settings cache (if enabled) ahead of its first use.
+
+    Parameters
+    ----------
+    session : Session
+        The database session to load the settings with.
+
+    """
+    if config.SETTINGS_CACHE_ENABLED:
+        _settings_cache.get(session)
+    return
+
 
 class SettingSQLRepository(
     SQLRepositoryMixin,
@@ -33,13 +84,130 @@ class SettingSQLRepository(
 ):
     """
     Setting SQL-based object storage repository.
+
+    Setting snapshots are served from a process-wide cache (if enabled
+    via ``SETTINGS_CACHE_ENABLED``), which every change made through
+    this repository invalidates - in other processes too, once they next
+    check the settings' version (see ``SETTINGS_CACHE_CHECK_INTERVAL``).
     """
     __obj_cls__ = Setting
+    __type_mapping__ = _type_mapping
 
     def _create_obj(self, obj: SettingCreate) -> Setting:
-        return _type_mapping[obj.type](**dict(obj))
+        return self.__type_mapping__[obj.type](**dict(obj))
+
+    def _changed(self) -> None:
+        if config.SETTINGS_CACHE_ENABLED:
+            _settings_cache.changed(self._session)
+        return
+
+    def create(self, obj: SettingCreate) -> Setting:
+        rv = super().create(obj)
+        self._changed()
+        return rv
+
+    def update(self, obj: Setting, updated: SettingUpdate) -> Setting:
+        rv = super().update(obj, updated)
+        self._changed()
+        return rv
+
+    def update_value(
+        self,
+        name: str,
+        value: tp.Optional[DataT],
+        *,
+        raise_ex: bool = True
+    ) -> Setting:
+        rv = super().update_value(name, value, raise_ex=raise_ex)
+        self._changed()
+        return rv
+
+    def delete(self, obj: Setting) -> Setting:
+        rv = super().delete(obj)
+        self._changed()
+        return rv
 
     def get_by_name(self, name: str, *, raise_ex: bool = False) -> Setting:
-        return self._session.query(self.__obj_cls__) \
+        rv = self._session.query(self.__obj_cls__) \
             .filter(self.__obj_cls__.name == name) \
             .first()
+        if not rv and raise_ex:
+            raise ObjectNotFoundError('Setting', 'name', name)
+        return rv
+
+    def get_snapshot(
+        self,
+        name: str,
+        *,
+        raise_ex: bool = False
+    ) -> tp.Optional[SettingModel]:
+        if not config.SETTINGS_CACHE_ENABLED:
+            return super().get_snapshot(name, raise_ex=raise_ex)
+        rv = _settings_cache.get(self._session).get(name)
+        if rv is None and raise_ex:
+            raise ObjectNotFoundError('Setting', 'name', name)
+        return rv
+
+    def get_values(
+        self,
+        names: tp.Iterable[str]
+    ) -> tp.Dict[str, tp.Optional[DataT]]:
+        names = list(dict.fromkeys(names))
+        if config.SETTINGS_CACHE_ENABLED:
+            cached = _settings_cache.get(self._session)
+            return {x: cached[x].value for x in names if x in cached}
+
+        found = {}
+        for i in range(0, len(names), self.__max_in_size__):
+            chunk = names[i:i + self.__max_in_size__]
+            query = self._query().filter(self.__obj_cls__.name.in_(chunk))
+            for obj in query:
+                found[obj.name] = obj.value
+        return {x: found[x] for x in names if x in found}
+
+
+class FlatSettingSQLRepository(SettingSQLRepository):
+    """
+    Setting SQL-based object storage repository, using the single-table
+    storage layout.
+    """
+    __obj_cls__ = FlatSetting
+    __type_mapping__ = _flat_type_mapping
+
+
+_repository_types = {
+    'joined': SettingSQLRepository,
+    'single': FlatSettingSQLRepository,
+}
+
+
+def get_setting_repository_type(
+    layout: tp.Optional[str] = None
+) -> tp.Type[SettingSQLRepository]:
+    """Gets the setting repository class for a storage layout.
+
+    Parameters
+    ----------
+    layout : str, optional
+        The storage layout to get the repository class for, either
+        ``joined`` (a table per value type) or ``single`` (one table for
+        all value types), the default is the configured
+        ``SETTINGS_STORAGE_LAYOUT``.
+
+    Returns
+    -------
+    Type[SettingSQLRepository]
+        The setting repository class to use for the `layout`.
+
+    Raises
+    ------
+    ValueError
+        If the given `layout` isn't supported.
+
+    """
+    if layout is None:
+        layout = config.SETTINGS_STORAGE_LAYOUT
+    try:
+        return _repository_types[layout.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported settings storage layout: {layout}")
@@ -2,9 +2,20 @@
 """
 User Permission settings SQL-based object repository.
 """
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from app.core.security import PermissionAction
+from app.core.security import PermissionMatrix
 from app.crud.config.user import UserPermissionRepository
 from app.db.crud.base import SQLRepositoryMixin
+from app.db.crud.config.permission import matrix_cache
+from app.db.models.config.permission import Permission
 from app.db.models.config.user import UserPermission
+from app.db.models.user import User
+from app.models.config.user import UserPermissionCreate
+from app.models.config.user import UserPermissionUpdate
 
 
 class UserPermissionSQLRepository(
@@ -15,3 +26,61 @@ class UserPermissionSQLRepository(
     User Permission SQL-based object storage repository.
     """
     __obj_cls__ = UserPermission
+
+    def create(self, obj: UserPermissionCreate) -> UserPermission:
+        rv = super().create(obj)
+        matrix_cache.changed(self._session)
+        return rv
+
+    def update(
+        self,
+        obj: UserPermission,
+        updated: UserPermissionUpdate
+    ) -> UserPermission:
+        rv = super().update(obj, updated)
+        matrix_cache.changed(self._session)
+        return rv
+
+    def delete(self, obj: UserPermission) -> UserPermission:
+        rv = super().delete(obj)
+        matrix_cache.changed(self._session)
+        return rv
+
+    def get_matrix(self, user_uid: UUID) -> PermissionMatrix:
+        matrices = matrix_cache.get(self._session)
+        rv = matrices.get(user_uid)
+        if rv is None:
+            rv = self._build_matrix(user_uid)
+            matrices.set(user_uid, rv)
+        return rv
+
+    def _build_matrix(self, user_uid: UUID) -> PermissionMatrix:
+        """Resolves the permissions of a user (in a single query)."""
+        user_id = self._session.query(User.id) \
+            .filter(User.uid == user_uid) \
+            .as_scalar()
+        query = self._session.query(
+            Permission.name,
+            Permission.create_default,
+            Permission.read_default,
+            Permission.update_default,
+            Permission.delete_default,
+            UserPermission.create,
+            UserPermission.read,
+            UserPermission.update,
+            UserPermission.delete,
+        ).outerjoin(
+            UserPermission,
+            sa.and_(UserPermission.permission_id == Permission.id,
+                    UserPermission.user_id == user_id)
+        )
+
+        actions = {}
+        for name, *defaults, c, r, u, d in query:
+            allowed = PermissionAction(0)
+            for action, default, value in zip(PermissionAction, defaults,
+                                              (c, r, u, d)):
+                if (default if value is None else value):
+                    allowed |= action
+            actions[name] = allowed
+        return PermissionMatrix(actions)
@@ -2,9 +2,14 @@
 """
 Core functionality for the actions module.
 """
+from contextlib import contextmanager
+import typing as tp
+from uuid import UUID
+
 from sqlalchemy.orm import Session
 
 from app.crud.core import UnitOfWork
+from app.exceptions import ReadOnlyError
 from app.utils.proputils import lazy_property
 
 from app.db.crud.address import AddressSQLRepository
@@ -28,12 +33,20 @@ class SQLUnitOfWork(UnitOfWork):
         The database session object to use for this interaction.
 
     """
-    __slots__ = ('_session',)
+    __slots__ = ('_session', '_identity_map', '_flush_deferred')
 
     def __init__(self, db_session: Session) -> None:
         self._session = db_session
+        self._identity_map = {}
+        self._flush_deferred = 0
         return super().__init__()
 
+    @property
+    def identity_map(self) -> tp.Dict[UUID, tp.Any]:
+        """Dict[UUID, Any]: Objects loaded in this unit of work, by UID.
+        """
+        return self._identity_map
+
     # Repositories
 
     @lazy_property
@@ -70,10 +83,90 @@ class SQLUnitOfWork(UnitOfWork):
     def config(self) -> ConfigSQLRepositoryGroup:
         return ConfigSQLRepositoryGroup(self, self._session)
 
+    # Flushing
+
+    def flush(self) -> None:
+        """Flushes pending changes to the database (unless deferred)."""
+        if not self._flush_deferred:
+            self._session.flush()
+        return
+
+    @contextmanager
+    def deferred_flush(self) -> tp.Iterator['SQLUnitOfWork']:
+        """Defers flushing changes until the end of the block.
+
+        Repositories flush after every change they make, within this
+        block (which may be nested) all the changes made - including
+        those to related objects by other repositories - are instead
+        flushed together once it exits.
+
+        """
+        self._flush_deferred += 1
+        try:
+            yield self
+        finally:
+            self._flush_deferred -= 1
+        self.flush()
+        return
+
     # Commit/rollback
 
     def commit(self) -> None:
         return self._session.commit()
 
     def rollback(self) -> None:
+        self._identity_map.clear()
+        return self._session.rollback()
+
+
+class ReadOnlySQLUnitOfWork(SQLUnitOfWork):
+    """
+    Unit of Work for (database) reads only.
+
+    Changes aren't tracked for flushing, any made through the
+    repositories raise a :obj:`ReadOnlyError` instead, as does
+    committing any other changes made to the loaded objects.
+
+    Sessions reading from a replica database switch to the primary for
+    (and from) the first ``with`` block, so reads made in transactions
+    see the latest data.
+
+    Parameters
+    ----------
+    db_session : Session
+        The database session object to use for this interaction (which
+        should be a read-only one, see :obj:`ReadOnlySession`).
+
+    """
+    __slots__ = ()
+
+    def _check_unchanged(self) -> None:
+        """Raises an error if the session has any changes pending."""
+        if self._session.new or self._session.dirty \
+                or self._session.deleted:
+            raise ReadOnlyError()
+        return
+
+    # Context-manager
+
+    def __enter__(self) -> 'ReadOnlySQLUnitOfWork':
+        if not self._level and hasattr(self._session, 'use_primary'):
+            self._session.use_primary()
+        return super().__enter__()
+
+    # Flushing
+
+    def flush(self) -> None:
+        return self._check_unchanged()
+
+    @contextmanager
+    def deferred_flush(self) -> tp.Iterator['ReadOnlySQLUnitOfWork']:
+        yield self
+        self._check_unchanged()
+        return
+
+    # Commit/rollback
+
+    def commit(self) -> None:
+        self._check_unchanged()
         return self._session.rollback()
@@ -6,6 +6,8 @@ import datetime
 import typing as tp
 from uuid import UUID
 
+from sqlalchemy.orm import joinedload
+
 from app.crud.event import EventRepository
 from app.db.crud.base import SQLRepositoryMixin
 from app.db.models.address import Address
@@ -18,6 +20,11 @@ class EventSQLRepository(SQLRepositoryMixin, EventRepository[Event]):
     Event object database storage repository.
     """
     __obj_cls__ = Event
+    __load_profiles__ = {
+        'full': (
+            joinedload(Event.address),
+        ),
+    }
 
     def get_by_address_id(
         self,
@@ -51,9 +58,10 @@ class EventSQLRepository(SQLRepositoryMixin, EventRepository[Event]):
         start_date: tp.Optional[datetime.date] = None,
         end_date: tp.Optional[datetime.date] = None,
         skip: tp.Optional[int] = None,
-        limit: tp.Optional[int] = None
+        limit: tp.Optional[int] = None,
+        profile: tp.Optional[str] = None
     ) -> tp.List[Event]:
-        rv = self._session.query(Event)
+        rv = self._query(profile)
         if start_date:
             rv = rv.filter(start_date <= Event.date)
         if end_date:
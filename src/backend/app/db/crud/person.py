@@ -5,6 +5,8 @@ Person object storage repository.
 import typing as tp
 from uuid import UUID
 
+from sqlalchemy.orm import joinedload
+
 from app.crud.person import PersonRepository
 from app.db.crud.base import SQLRepositoryMixin
 from app.db.models.name import Name
@@ -17,6 +19,13 @@ class PersonSQLRepository(SQLRepositoryMixin, PersonRepository[Person]):
     Person object database storage repository.
     """
     __obj_cls__ = Person
+    __load_profiles__ = {
+        'full': (
+            joinedload(Person.name),
+            joinedload(Person.contact),
+            joinedload(Person.address),
+        ),
+    }
 
     def get_by_name_id(
         self,
@@ -4,10 +4,31 @@ User repository.
 """
 import typing as tp
 
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import joinedload
+
+from app.core import config
+from app.core.security import UserAuth
 from app.crud.user import UserRepository
+from app.db.cache import VersionedCache
 from app.db.crud.base import SQLRepositoryMixin
+from app.db.models.person import Person
 from app.db.models.user import User
 from app.exceptions import ObjectNotFoundError
+from app.models.user import UserUpdate
+from app.utils.cache import TTLCache
+
+
+def _new_auth_cache(session: Session) -> TTLCache[str, UserAuth]:
+    return TTLCache(config.AUTH_CACHE_SIZE, config.AUTH_CACHE_TTL)
+
+
+# - Authorization snapshots by access token, dropped in full once a change
+#   to any user's authorization fields (or a user's removal) is committed
+#   (by any process).
+auth_cache: VersionedCache[TTLCache[str, UserAuth]] = \
+    VersionedCache('users', _new_auth_cache,
+                   check_interval=config.AUTH_CACHE_CHECK_INTERVAL)
 
 
 class UserSQLRepository(SQLRepositoryMixin, UserRepository[User]):
@@ -15,6 +36,29 @@ class UserSQLRepository(SQLRepositoryMixin, UserRepository[User]):
     User object storage repository.
     """
     __obj_cls__ = User
+    __load_profiles__ = {
+        'full': (
+            joinedload(User.person).joinedload(Person.name),
+            joinedload(User.person).joinedload(Person.contact),
+            joinedload(User.person).joinedload(Person.address),
+        ),
+    }
+
+    @property
+    def _auth_cache(self) -> TTLCache[str, UserAuth]:
+        return auth_cache.get(self._session)
+
+    def update(self, obj: User, updated: UserUpdate) -> User:
+        old_auth = UserAuth.from_user(obj)
+        rv = super().update(obj, updated)
+        if UserAuth.from_user(rv) != old_auth:
+            auth_cache.changed(self._session)
+        return rv
+
+    def delete(self, obj: User) -> User:
+        rv = super().delete(obj)
+        auth_cache.changed(self._session)
+        return rv
 
     def get_by_email(
         self,
@@ -2,11 +2,26 @@
 """
 Wedding information SQL-based object repository.
 """
+from sqlalchemy.orm import joinedload
+
 from app.crud.wedding.wedding_info import WeddingInfoRepository
 from app.db.crud.base import SQLSingletonRepositoryMixin
+from app.db.models.event import Event
+from app.db.models.person import Person
 from app.db.models.wedding.wedding_info import WeddingInfo
 
 
+_people = (WeddingInfo.bride, WeddingInfo.groom)
+_events = (
+    WeddingInfo.engagement_party,
+    WeddingInfo.welcome,
+    WeddingInfo.rehearsal_dinner,
+    WeddingInfo.wedding,
+    WeddingInfo.reception,
+    WeddingInfo.brunch,
+)
+
+
 class WeddingInfoSQLRepository(
     SQLSingletonRepositoryMixin,
     WeddingInfoRepository[WeddingInfo]
@@ -15,3 +30,12 @@ class WeddingInfoSQLRepository(
     WeddingInfo SQL-based, singleton object storage repository.
     """
     __obj_cls__ = WeddingInfo
+    __load_profiles__ = {
+        'full': tuple(
+            joinedload(rel).joinedload(attr)
+            for rel in _people
+            for attr in (Person.name, Person.contact, Person.address)
+        ) + tuple(
+            joinedload(rel).joinedload(Event.address) for rel in _events
+        ),
+    }
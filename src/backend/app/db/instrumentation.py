@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+Database query instrumentation.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+import functools
+import logging
+import re
+import time
+import typing as tp
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+from app.core.metrics import DB_POOL_CHECKED_OUT
+from app.core.metrics import DB_POOL_OVERFLOW
+from app.exceptions import RepeatedQueryError
+
+
+logger = logging.getLogger(__name__)
+
+_current_stats = ContextVar('query_stats', default=None)
+
+_whitespace_re = re.compile(r'\s+')
+_params_re = re.compile(r'\((?:\s*(?:\?|%s|%\(\w+\)s|:\w+)\s*,?)+\)')
+
+
+def get_statement_template(statement: str) -> str:
+    """Gets the normalized template of the given SQL statement.
+
+    Parameters
+    ----------
+    statement : str
+        The (parameterized) SQL statement to get the template for.
+
+    Returns
+    -------
+    str
+        The `statement` with whitespace collapsed and parameter lists
+        (e.g. from ``IN (...)`` clauses) reduced to a single entry.
+
+    """
+    rv = _whitespace_re.sub(' ', statement).strip()
+    return _params_re.sub('(?)', rv)
+
+
+class QueryStats(object):
+    """
+    Statistics on the database statements executed in a scope.
+
+    Parameters
+    ----------
+    parent : QueryStats, optional
+        The enclosing statistics object (if any) to also record the
+        statements executed to.
+
+    """
+
+    def __init__(self, parent: tp.Optional['QueryStats'] = None) -> None:
+        self.parent = parent
+        self.count = 0
+        self.duration = 0.0
+        self.pool_wait = 0.0
+        self.templates = Counter()
+        return
+
+    def record(self, statement: str, duration: float) -> None:
+        """Records an executed statement.
+
+        Parameters
+        ----------
+        statement : str
+            The SQL statement executed.
+        duration : float
+            The time taken to execute the statement (in seconds).
+
+        """
+        template = get_statement_template(statement)
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            stats.templates[template] += 1
+            stats = stats.parent
+        return
+
+    def record_wait(self, duration: float) -> None:
+        """Records time spent getting a connection from the pool.
+
+        Parameters
+        ----------
+        duration : float
+            The time taken to get the connection (in seconds).
+
+        """
+        stats = self
+        while stats is not None:
+            stats.pool_wait += duration
+            stats = stats.parent
+        return
+
+    def repeated(self, threshold: int) -> tp.Dict[str, int]:
+        """Gets the statement templates executed repeatedly.
+
+        Statements executed once per result of an earlier query (i.e.
+        N+1 queries, usually from lazy loading) show up as the same
+        template being executed many times.
+
+        Parameters
+        ----------
+        threshold : int
+            The number of executions at which a template is considered
+            to be repeated.
+
+        Returns
+        -------
+        Dict[str, int]
+            The repeated templates and the number of times executed.
+
+        """
+        return {k: v for k, v in self.templates.items() if v >= threshold}
+
+
+def get_query_stats() -> tp.Optional[QueryStats]:
+    """Gets the query statistics object for the current scope.
+
+    Returns
+    -------
+    QueryStats or None
+        The current statistics object (if statements are being tracked,
+        ``None`` otherwise).
+
+    """
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(
+    *,
+    threshold: tp.Optional[int] = None,
+    raise_ex: bool = False
+) -> tp.Iterator[QueryStats]:
+    """Tracks the database statements executed within this block.
+
+    Blocks may be nested, statements are recorded to each enclosing
+    block's statistics too.
+
+    Parameters
+    ----------
+    threshold : int, optional
+        The number of executions of the same statement template to
+        flag as repeated (N+1) queries, if not given no checks are done.
+    raise_ex : bool, optional
+        Whether or not to raise an error if any repeated statements are
+        found, rather than just logging them (default is ``False``).
+
+    Yields
+    ------
+    QueryStats
+        The statistics object recording the statements executed.
+
+    Raises
+    ------
+    RepeatedQueryError
+        If `raise_ex` is set and repeated statements were executed.
+
+    """
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+    if threshold:
+        repeated = stats.repeated(threshold)
+        if repeated:
+            for template, count in repeated.items():
+                logger.warning(
+                    f"Statement executed {count} times (possible N+1): "
+                    f"{template}"
+                )
+            if raise_ex:
+                raise RepeatedQueryError(repeated)
+    return
+
+
+def _instrument_pool(pool: Pool) -> None:
+    """Times the connections handed out by the given pool."""
+    connect = pool.connect
+
+    @functools.wraps(connect)
+    def _timed_connect():
+        started = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            stats = _current_stats.get()
+            if stats is not None:
+                stats.record_wait(time.perf_counter() - started)
+
+    pool.connect = _timed_connect
+    return
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Adds the statement tracking hooks to the given engine.
+
+    This records the statements executed and the time spent waiting on
+    the engine's connection pool for the current :func:`track_queries`
+    block (if any), and keeps the connection pool metrics up to date.
+
+    Parameters
+    ----------
+    engine : Engine
+        The SQLAlchemy database engine to instrument.
+
+    """
+    _instrument_pool(engine.pool)
+
+    @event.listens_for(engine, 'engine_disposed')
+    def _engine_disposed(engine):
+        _instrument_pool(engine.pool)
+        return
+
+    def _update_overflow() -> None:
+        overflow = getattr(engine.pool, 'overflow', None)
+        if overflow is not None:
+            DB_POOL_OVERFLOW.set(max(overflow(), 0))
+        return
+
+    @event.listens_for(engine, 'checkout')
+    def _checkout(dbapi_conn, rec, proxy):
+        DB_POOL_CHECKED_OUT.inc()
+        _update_overflow()
+        return
+
+    @event.listens_for(engine, 'checkin')
+    def _checkin(dbapi_conn, rec):
+        DB_POOL_CHECKED_OUT.dec()
+        _update_overflow()
+        return
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _before_cursor_execute(conn, cursor, statement, parameters,
+                               context, executemany):
+        if _current_stats.get() is not None:
+            conn.info.setdefault('query_start', []).append(
+                time.perf_counter()
+            )
+        return
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _after_cursor_execute(conn, cursor, statement, parameters,
+                              context, executemany):
+        stats = _current_stats.get()
+        started = conn.info.get('query_start')
+        if stats is not None and started:
+            stats.record(statement, time.perf_counter() - started.pop())
+        return
+
+    @event.listens_for(engine, 'handle_error')
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get('query_start'):
+            conn.info['query_start'].pop()
+        return
+
+    return
@@ -4,6 +4,13 @@ Database storage models for permission models.
 """
 from app.db.models.config.permission import Permission
 from app.db.models.config.setting import (
+    FlatSetting,
+    FlatSettingBoolean,
+    FlatSettingDatetime,
+    FlatSettingFloat,
+    FlatSettingInteger,
+    FlatSettingString,
+    FlatSettingUUID,
     Setting,
     SettingBoolean,
     SettingDatetime,
@@ -13,8 +20,17 @@ from app.db.models.config.setting import (
     SettingUUID,
 )
 from app.db.models.config.user import UserPermission
+from app.db.models.config.version import CacheVersion
 
 __all__ = [
+    'CacheVersion',
+    'FlatSetting',
+    'FlatSettingBoolean',
+    'FlatSettingDatetime',
+    'FlatSettingFloat',
+    'FlatSettingInteger',
+    'FlatSettingString',
+    'FlatSettingUUID',
     'Permission',
     'Setting',
     'SettingBoolean',
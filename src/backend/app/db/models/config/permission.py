@@ -20,7 +20,7 @@ class Permission(ConfigSchemaMixin, Base):
 
     name = sa.Column(sa.String, index=True, unique=True)
     description = sa.Column(sa.Text)
-    create_default: sa.Column(sa.Boolean, nullable=False)
-    read_default: sa.Column(sa.Boolean, nullable=False)
-    update_default: sa.Column(sa.Boolean, nullable=False)
-    delete_default: sa.Column(sa.Boolean, nullable=False)
+    create_default = sa.Column(sa.Boolean, nullable=False, default=False)
+    read_default = sa.Column(sa.Boolean, nullable=False, default=False)
+    update_default = sa.Column(sa.Boolean, nullable=False, default=False)
+    delete_default = sa.Column(sa.Boolean, nullable=False, default=False)
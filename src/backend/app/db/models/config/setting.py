@@ -17,12 +17,16 @@ from app.models.config.setting import ValueType
 class Setting(ConfigSchemaMixin, Base):
     """
     Base class for setting storage.
+
+    Queries for settings load the (value) columns of all the subclasses
+    up front, via outer joins, rather than with a query per setting.
     """
 
     @declared_attr
     def __mapper_args__(cls) -> tp.Dict[str, tp.Any]:
         return {
             'polymorphic_on': 'type',
+            'with_polymorphic': '*',
         }
 
     @declared_attr
@@ -152,3 +156,97 @@ class SettingUUID(Setting):
         return {
             'polymorphic_identity': ValueType.UUID,
         }
+
+
+# Single-table layout
+
+class FlatSetting(ConfigSchemaMixin, Base):
+    """
+    Base class for (single-table) setting storage.
+
+    All the value types are kept in the one table, each in its own
+    (typed) column, so reading or writing a setting only touches a
+    single row.
+    """
+    id = sa.Column(sa.Integer, primary_key=True)
+    uid = sa.Column(GUID, unique=True, index=True, default=uuid4)
+    name = sa.Column(sa.String, unique=True, index=True)
+    required = sa.Column(sa.Boolean, default=False, nullable=False)
+    type = sa.Column(sa.Enum(ValueType), nullable=False)
+
+    __mapper_args__ = {
+        'polymorphic_on': type,
+        'with_polymorphic': '*',
+    }
+
+
+class FlatSettingString(FlatSetting):
+    """
+    String-valued (single-table) setting.
+    """
+    __tablename__ = None
+    __mapper_args__ = {
+        'polymorphic_identity': ValueType.STRING,
+    }
+
+    value = sa.Column('value_string', sa.String)
+
+
+class FlatSettingInteger(FlatSetting):
+    """
+    Integer-valued (single-table) setting.
+    """
+    __tablename__ = None
+    __mapper_args__ = {
+        'polymorphic_identity': ValueType.INTEGER,
+    }
+
+    value = sa.Column('value_integer', sa.Integer)
+
+
+class FlatSettingFloat(FlatSetting):
+    """
+    Float-valued (single-table) setting.
+    """
+    __tablename__ = None
+    __mapper_args__ = {
+        'polymorphic_identity': ValueType.FLOAT,
+    }
+
+    value = sa.Column('value_float', sa.Float)
+
+
+class FlatSettingBoolean(FlatSetting):
+    """
+    Boolean-valued (single-table) setting.
+    """
+    __tablename__ = None
+    __mapper_args__ = {
+        'polymorphic_identity': ValueType.BOOLEAN,
+    }
+
+    value = sa.Column('value_boolean', sa.Boolean)
+
+
+class FlatSettingDatetime(FlatSetting):
+    """
+    Datetime-valued (single-table) setting.
+    """
+    __tablename__ = None
+    __mapper_args__ = {
+        'polymorphic_identity': ValueType.DATETIME,
+    }
+
+    value = sa.Column('value_datetime', sa.DateTime)
+
+
+class FlatSettingUUID(FlatSetting):
+    """
+    UUID-valued (single-table) setting.
+    """
+    __tablename__ = None
+    __mapper_args__ = {
+        'polymorphic_identity': ValueType.UUID,
+    }
+
+    value = sa.Column('value_uuid', GUID)
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+Database storage specification for cache version counters.
+"""
+import sqlalchemy as sa
+
+from app.db.base_class import Base
+from app.db.models.config.base import ConfigSchemaMixin
+
+
+class CacheVersion(ConfigSchemaMixin, Base):
+    """
+    Database storage specification for cache version counters.
+
+    Each row counts the changes made to the data behind one of the
+    (per-process) caches, so processes can tell when theirs is stale.
+    """
+    name = sa.Column(sa.String, primary_key=True)
+    version = sa.Column(sa.Integer, nullable=False, default=0)
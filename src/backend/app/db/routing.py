@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Routing of database reads to replicas.
+"""
+import functools
+import logging
+import threading
+import time
+import typing as tp
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+
+logger = logging.getLogger(__name__)
+
+
+def check_engine(engine: Engine) -> bool:
+    """Checks whether the given engine's database is available.
+
+    Parameters
+    ----------
+    engine : Engine
+        The database engine to check.
+
+    Returns
+    -------
+    bool
+        Whether or not a query could be run on the database.
+
+    """
+    try:
+        with engine.connect() as conn:
+            conn.execute("SELECT 1")
+    except SQLAlchemyError as ex:
+        logger.warning(f"Database unavailable ({engine.url!r}): {ex}")
+        return False
+    return True
+
+
+class ReplicaRouter(object):
+    """
+    Round-robin router of (read-only) sessions to replica databases.
+
+    Each replica's health is checked (at most) once per `check_interval`
+    in a background thread, with one check in flight per replica, so
+    sessions are never held up by a check and are routed on the last
+    known health of the replicas meanwhile.  Any replica which is
+    unavailable - or whose connections are found to be broken - is
+    skipped until its next successful check.  If no replica is available
+    the primary is used instead.
+
+    Parameters
+    ----------
+    primary : Engine
+        The primary database's engine.
+    replicas : Sequence[Engine]
+        The replica databases' engines.
+    check_interval : float, optional
+        The time (in seconds) between health checks of each replica
+        (default is 10).
+    timer : Callable[[], float], optional
+        The clock to use (default is :func:`time.monotonic`).
+
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: tp.Sequence[Engine],
+        *,
+        check_interval: float = 10.0,
+        timer: tp.Callable[[], float] = time.monotonic
+    ) -> None:
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.check_interval = check_interval
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._next = 0
+        self._healthy = [True] * len(self.replicas)
+        self._checked: tp.List[tp.Optional[float]] = \
+            [None] * len(self.replicas)
+        self._checking = [False] * len(self.replicas)
+        for idx, engine in enumerate(self.replicas):
+            event.listen(engine, 'handle_error',
+                         functools.partial(self._handle_error, idx))
+        return
+
+    def get_engine(self) -> Engine:
+        """Gets the engine to use for the next read-only session.
+
+        Returns
+        -------
+        Engine
+            The next available replica's engine (or the primary's, if
+            none are available).
+
+        """
+        n_replicas = len(self.replicas)
+        if not n_replicas:
+            return self.primary
+        now = self._timer()
+        with self._lock:
+            start = self._next
+            self._next = (start + 1) % n_replicas
+            healthy = list(self._healthy)
+            due = []
+            for idx, checked in enumerate(self._checked):
+                if self._checking[idx]:
+                    continue
+                if checked is None or now - checked >= self.check_interval:
+                    self._checking[idx] = True
+                    due.append(idx)
+
+        for idx in due:
+            threading.Thread(
+                target=self._check, args=(idx,), daemon=True,
+                name=f'replica-check-{idx}'
+            ).start()
+
+        for i in range(n_replicas):
+            idx = (start + i) % n_replicas
+            if healthy[idx]:
+                return self.replicas[idx]
+        return self.primary
+
+    def status(self) -> tp.List[tp.Tuple[Engine, bool]]:
+        """Checks the health of all the replicas.
+
+        Returns
+        -------
+        List[Tuple[Engine, bool]]
+            Each replica's engine and whether or not it's available.
+
+        """
+        for idx in range(len(self.replicas)):
+            self._check(idx)
+        return list(zip(self.replicas, self._healthy))
+
+    def _check(self, idx: int) -> None:
+        """Checks the health of the given replica."""
+        healthy = check_engine(self.replicas[idx])
+        with self._lock:
+            self._healthy[idx] = healthy
+            self._checked[idx] = self._timer()
+            self._checking[idx] = False
+        return
+
+    def _handle_error(self, idx: int, context) -> None:
+        """Takes a replica out of rotation once disconnected."""
+        if context.is_disconnect:
+            logger.warning(
+                f"Replica disconnected ({self.replicas[idx].url!r})"
+            )
+            with self._lock:
+                self._healthy[idx] = False
+                self._checked[idx] = self._timer()
+        return
@@ -3,19 +3,25 @@
 Database Session-related objects.
 """
 import os
+import re
 import typing as tp
 from urllib import parse
 
 from sqlalchemy import create_engine
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as SessionBase
 from sqlalchemy.orm import scoped_session
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from app.core import config
 
 # Ensure all models are mapped first
 from app.db import base
+from app.db.instrumentation import instrument_engine
+from app.db.routing import ReplicaRouter
+from app.exceptions import ReadOnlyError
 
 
 # Utility functions
@@ -100,13 +106,91 @@ def get_schema() -> tp.Set[str]:
     )
 
 
-def build_engine(db_uri: str, **kwargs) -> Engine:
+# - SQLite pragmas which are set for each (attached) database, rather
+#   than the connection as a whole.
+_sqlite_schema_pragmas = ('journal_mode', 'synchronous', 'mmap_size',
+                          'cache_size')
+
+
+def get_sqlite_pragma_statements(
+    pragmas: tp.Mapping[str, tp.Union[int, str, None]],
+    schemas: tp.Iterable[str] = ()
+) -> tp.List[str]:
+    """Creates the statements setting the given SQLite pragmas.
+
+    Parameters
+    ----------
+    pragmas : Mapping[str, Union[int, str, None]]
+        The pragmas to set and their values (any which are ``None`` or
+        empty are left at SQLite's defaults).
+    schemas : Iterable[str], optional
+        The attached databases' schema names, per-database pragmas
+        (e.g. ``journal_mode``) are set for each of them as well as for
+        the main database.
+
+    Returns
+    -------
+    List[str]
+        The ``PRAGMA`` statements to execute on new connections.
+
+    Raises
+    ------
+    ValueError
+        If any of the pragma names or values given are invalid.
+
+    """
+    rv = []
+    for name, value in pragmas.items():
+        if value is None or value == '':
+            continue
+        valid_value = isinstance(value, int) \
+            or re.fullmatch(r'[A-Za-z0-9_]+', value)
+        if not valid_value or not re.fullmatch(r'[a-z_]+', name):
+            raise ValueError(f"Invalid SQLite pragma: {name}={value}")
+        if name in _sqlite_schema_pragmas:
+            for schema in ('main', *schemas):
+                rv.append(f"PRAGMA {schema}.{name} = {value}")
+        else:
+            rv.append(f"PRAGMA {name} = {value}")
+    return rv
+
+
+def build_engine(
+    db_uri: str,
+    *,
+    pool_size: tp.Optional[int] = None,
+    max_overflow: tp.Optional[int] = None,
+    pool_recycle: tp.Optional[int] = None,
+    pool_timeout: tp.Optional[int] = None,
+    pool_pre_ping: bool = False,
+    pool_use_lifo: bool = False,
+    sqlite_pragmas: tp.Optional[tp.Mapping[str, tp.Any]] = None,
+    **kwargs
+) -> Engine:
     """Creates and configures a new SQLAlchemy database engine.
 
     Parameters
     ----------
     db_uri : str
         The full database connection URI to use for the connection.
+    pool_size : int, optional
+        The number of connections to keep open in the pool (if not
+        given the SQLAlchemy default for the dialect is used).
+    max_overflow : int, optional
+        The number of connections allowed in excess of `pool_size`.
+    pool_recycle : int, optional
+        The number of seconds after which connections are recycled.
+    pool_timeout : int, optional
+        The number of seconds to wait for a connection from the pool.
+    pool_pre_ping : bool, optional
+        Whether or not to test connections for liveness on checkout
+        (default is ``False``).
+    pool_use_lifo : bool, optional
+        Whether or not to use LIFO (rather than FIFO) ordering when
+        checking out connections (default is ``False``).
+    sqlite_pragmas : Mapping[str, Any], optional
+        The pragmas to set on each new connection (if using SQLite),
+        for the main and any attached databases.
     **kwargs : optional
         Any additional keyword arguments to pass through to the
         ``create_engine`` function.
@@ -118,23 +202,175 @@ def build_engine(db_uri: str, **kwargs) -> Engine:
         use.
 
     """
+    # - Only pass the pool options given, not every pool class (e.g. the
+    #   ones used for SQLite) accepts them.
+    pool_kwargs = {
+        'pool_size': pool_size,
+        'max_overflow': max_overflow,
+        'pool_recycle': pool_recycle,
+        'pool_timeout': pool_timeout,
+    }
+    kwargs.update({k: v for k, v in pool_kwargs.items() if v is not None})
+    if pool_pre_ping:
+        kwargs['pool_pre_ping'] = True
+    if pool_use_lifo:
+        kwargs['pool_use_lifo'] = True
+
     engine = create_engine(db_uri, **kwargs)
 
     if engine.dialect.name == 'sqlite':
         # - Add Schema handling to SQLite connections
         schema_map = {x: f"{x}.sqlite3" for x in get_schema()}
+        pragma_stmts = get_sqlite_pragma_statements(
+            sqlite_pragmas or {}, schema_map.keys()
+        )
 
         @event.listens_for(engine, 'connect')
         def _sqlite_connect(dbapi_conn, rec):
             for sname, fname in schema_map.items():
                 dbapi_conn.execute(f"ATTACH DATABASE '{fname}' AS '{sname}'")
+            for stmt in pragma_stmts:
+                dbapi_conn.execute(stmt)
             return
 
     return engine
 
 
+def get_pool_capacity(engine: Engine) -> tp.Optional[int]:
+    """Gets the maximum number of connections the engine's pool allows.
+
+    Parameters
+    ----------
+    engine : Engine
+        The SQLAlchemy database engine to get the pool capacity of.
+
+    Returns
+    -------
+    int or None
+        The maximum number of simultaneously checked out connections,
+        or ``None`` if the engine's pool is unbounded.
+
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool) or pool._max_overflow < 0:
+        return None
+    return pool.size() + pool._max_overflow
+
+
+def get_worker_capacity(
+    engine: Engine,
+    headroom: tp.Optional[int] = None
+) -> tp.Optional[int]:
+    """Gets the number of API worker threads the engine's pool supports.
+
+    Request sessions keep their connection checked out until after the
+    response has been sent, so some of the pool is held back for the
+    sessions of requests whose worker thread has already finished.
+
+    Parameters
+    ----------
+    engine : Engine
+        The SQLAlchemy database engine to get the worker capacity for.
+    headroom : int, optional
+        The number of connections to leave for still-open sessions (if
+        not given a quarter of the pool's capacity, at least one, is
+        used).
+
+    Returns
+    -------
+    int or None
+        The number of worker threads to use, or ``None`` if the
+        engine's pool is unbounded.
+
+    """
+    capacity = get_pool_capacity(engine)
+    if capacity is None:
+        return None
+    if headroom is None:
+        headroom = max(capacity // 4, 1)
+    return max(capacity - headroom, 1)
+
+
+# Classes
+
+class ReadOnlySQLSession(SessionBase):
+    """
+    Database session which doesn't make changes.
+
+    Flushing any changes raises a :obj:`ReadOnlyError` instead, and on
+    PostgreSQL its transactions are read-only too.
+
+    If given a `router` the session reads from one of the replica
+    databases (chosen on first use), until :meth:`use_primary` is
+    called.
+
+    Parameters
+    ----------
+    router : ReplicaRouter, optional
+        The router to get the replica database to use from (if any).
+    args : optional
+        Additional arguments to pass to the ``Session`` class.
+    kwargs : optional
+        Additional keyword-arguments to pass to the ``Session`` class.
+
+    """
+
+    def __init__(
+        self,
+        *args,
+        router: tp.Optional[ReplicaRouter] = None,
+        **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._router = router
+        self._replica: tp.Optional[Engine] = None
+        self._primary_only = router is None
+        return
+
+    def get_bind(self, mapper=None, clause=None) -> Engine:
+        if self._primary_only:
+            return super().get_bind(mapper, clause)
+        if self._replica is None:
+            self._replica = self._router.get_engine()
+        return self._replica
+
+    def use_primary(self) -> None:
+        """Reads from the primary database from now on.
+
+        Any transaction already begun on a replica is ended (so objects
+        loaded from it are reloaded from the primary when next used).
+
+        """
+        if not self._primary_only:
+            self._primary_only = True
+            if self._replica is not None:
+                self.rollback()
+        return
+
+    def flush(self, objects: tp.Optional[tp.Sequence[tp.Any]] = None) -> None:
+        if self.new or self.dirty or self.deleted:
+            raise ReadOnlyError()
+        return
+
+
+@event.listens_for(ReadOnlySQLSession, 'after_begin')
+def _read_only_begin(session, transaction, connection) -> None:
+    if connection.dialect.name == 'postgresql':
+        connection.execute("SET TRANSACTION READ ONLY")
+    return
+
+
 # Objects
 
+sqlite_pragmas = {
+    'journal_mode': config.DB_SQLITE_JOURNAL_MODE,
+    'synchronous': config.DB_SQLITE_SYNCHRONOUS,
+    'mmap_size': config.DB_SQLITE_MMAP_SIZE,
+    'cache_size': config.DB_SQLITE_CACHE_SIZE,
+    'temp_store': config.DB_SQLITE_TEMP_STORE,
+    'busy_timeout': config.DB_SQLITE_BUSY_TIMEOUT,
+}
+
 db_uri = create_db_uri(
     config.DB_ENGINE,
     db_name=config.DB_NAME,
@@ -148,11 +384,50 @@ db_uri = create_db_uri(
 
 engine = build_engine(
     db_uri,
-    pool_pre_ping=True
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_POOL_MAX_OVERFLOW,
+    pool_recycle=config.DB_POOL_RECYCLE,
+    pool_timeout=config.DB_POOL_TIMEOUT,
+    pool_pre_ping=config.DB_POOL_PRE_PING,
+    pool_use_lifo=config.DB_POOL_USE_LIFO,
+    sqlite_pragmas=sqlite_pragmas
 )
+instrument_engine(engine)
+
+replica_engines = [
+    build_engine(
+        x,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_POOL_MAX_OVERFLOW,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        pool_use_lifo=config.DB_POOL_USE_LIFO,
+        sqlite_pragmas=sqlite_pragmas,
+        connect_args=dict(config.DB_CONNECT_EXTRA)
+    ) for x in config.DB_REPLICA_URIS
+]
+for x in replica_engines:
+    instrument_engine(x)
+
+replica_router = None
+if replica_engines:
+    replica_router = ReplicaRouter(
+        engine, replica_engines,
+        check_interval=config.DB_REPLICA_CHECK_INTERVAL
+    )
 
 db_session = scoped_session(
     sessionmaker(autocommit=False, autoflush=False, bind=engine)
 )
 
 Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+ReadOnlySession = sessionmaker(
+    class_=ReadOnlySQLSession,
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+    router=replica_router
+)
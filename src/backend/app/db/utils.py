@@ -4,12 +4,17 @@ Database utilities.
 """
 import typing as tp
 
+import sqlalchemy as sa
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
 from app.core import config
 from app.db import base
+from app.db.cache import bump_cache_version
+from app.db.crud.config.setting import get_setting_repository_type
 from app.db.crud.core import SQLUnitOfWork
+from app.db.models.config.permission import Permission
+from app.db.models.config.version import CacheVersion
 from app.db.session import engine
 from app.models.user import UserCreate
 
@@ -34,6 +39,53 @@ def create_database(
     return
 
 
+def upgrade_database(bind: Engine) -> tp.List[str]:
+    """Upgrades the schema of an existing database to match the models.
+
+    Only the (additive) changes made to the models since the database
+    was created are made, so it's safe to run on any database.
+
+    Parameters
+    ----------
+    bind : Engine
+        The engine of the database to upgrade.
+
+    Returns
+    -------
+    List[str]
+        Descriptions of the changes made (empty if up to date already).
+
+    """
+    rv = []
+
+    # - Cache version counters
+    table = CacheVersion.__table__
+    if not table.exists(bind=bind):
+        table.create(bind=bind)
+        rv.append(f"Created table {table.fullname}")
+
+    # - Permission defaults (all actions are denied by default)
+    table = Permission.__table__
+    if table.exists(bind=bind):
+        existing = {
+            x['name'] for x in
+            sa.inspect(bind).get_columns(table.name, schema=table.schema)
+        }
+        default = sa.false().compile(dialect=bind.dialect)
+        for column in (table.c.create_default, table.c.read_default,
+                       table.c.update_default, table.c.delete_default):
+            if column.name in existing:
+                continue
+            col_type = column.type.compile(dialect=bind.dialect)
+            bind.execute(
+                f"ALTER TABLE {table.fullname} ADD COLUMN {column.name} "
+                f"{col_type} NOT NULL DEFAULT {default}"
+            )
+            rv.append(f"Added column {table.fullname}.{column.name}")
+
+    return rv
+
+
 def create_initial_superuser(
     db_session: 'Session',
     *,
@@ -69,6 +121,127 @@ def create_initial_superuser(
     return
 
 
+def migrate_settings(
+    db_session: 'Session',
+    source: str,
+    target: str,
+    *,
+    replace: bool = False
+) -> int:
+    """Copies the settings from one storage layout to another.
+
+    The target layout's table(s) are created if needed, and settings
+    keep their IDs (so both layouts can be switched between).
+
+    Parameters
+    ----------
+    db_session : Session
+        The database session to use.
+    source : str
+        The storage layout to copy the settings from.
+    target : str
+        The storage layout to copy the settings to.
+    replace : bool, optional
+        Whether or not to replace any settings already stored in the
+        `target` layout (default is ``False``).
+
+    Returns
+    -------
+    int
+        The number of settings copied.
+
+    Raises
+    ------
+    ValueError
+        If the `source` and `target` layouts are the same, or settings
+        are already stored in the `target` layout (and `replace` isn't
+        set).
+
+    """
+    src_repo = get_setting_repository_type(source)
+    dst_repo = get_setting_repository_type(target)
+    if src_repo is dst_repo:
+        raise ValueError("The source and target layouts must differ")
+    dst_cls = dst_repo.__obj_cls__
+
+    bind = db_session.get_bind()
+    tables = [x.local_table for x in dst_cls.__mapper__.self_and_descendants]
+    for table in dict.fromkeys(tables):
+        table.create(bind=bind, checkfirst=True)
+
+    existing = db_session.query(dst_cls).all()
+    if existing:
+        if not replace:
+            raise ValueError(
+                f"Settings are already stored in the {target} layout"
+            )
+        for obj in existing:
+            db_session.delete(obj)
+        db_session.flush()
+
+    count = 0
+    for obj in db_session.query(src_repo.__obj_cls__):
+        db_session.add(dst_repo.__type_mapping__[obj.type](
+            id=obj.id,
+            uid=obj.uid,
+            name=obj.name,
+            required=obj.required,
+            value=obj.value
+        ))
+        count += 1
+    db_session.flush()
+
+    if bind.dialect.name == 'postgresql':
+        table = dst_cls.__table__
+        db_session.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table.fullname}', "
+            f"'id'), COALESCE(MAX(id), 1)) FROM {table.fullname}"
+        )
+    bump_cache_version(db_session, 'settings')
+    db_session.commit()
+    return count
+
+
+def copy_sqlite_database(
+    source: Engine,
+    targets: tp.Sequence[Engine]
+) -> None:
+    """Copies a SQLite database to others (e.g. to use as replicas).
+
+    Only the main database is copied, any attached (schema) databases
+    are shared by the engines already.
+
+    Parameters
+    ----------
+    source : Engine
+        The engine of the SQLite database to copy.
+    targets : Sequence[Engine]
+        The engines of the SQLite databases to copy to (replacing their
+        current contents).
+
+    Raises
+    ------
+    ValueError
+        If any of the databases given aren't SQLite ones.
+
+    """
+    for x in (source, *targets):
+        if x.dialect.name != 'sqlite':
+            raise ValueError(f"Not a SQLite database: {x.url!r}")
+
+    src_conn = source.raw_connection()
+    try:
+        for target in targets:
+            dst_conn = target.raw_connection()
+            try:
+                src_conn.connection.backup(dst_conn.connection)
+            finally:
+                dst_conn.close()
+    finally:
+        src_conn.close()
+    return
+
+
 def initialize_database(db_session: 'Session') -> None:
     """Initializes the database.
 
@@ -115,3 +115,96 @@ class PrivilegeError(APIError):
             else:
                 msg = "Insufficient privileges"
         return super().__init__(msg)
+
+
+class InvalidCursorError(APIError):
+    """
+    Error thrown when a pagination cursor is invalid.
+
+    Parameters
+    ----------
+    cursor : str
+        The invalid cursor value given.
+
+    """
+
+    def __init__(self, cursor: str) -> None:
+        self.cursor = cursor
+        return super().__init__(f"Invalid pagination cursor: {cursor}")
+
+
+class RateLimitError(APIError):
+    """
+    Error thrown when a client has exceeded a rate limit.
+
+    Parameters
+    ----------
+    retry_after : float
+        The time (in seconds) until the client may try again.
+    msg : str, optional
+        The error message to display.
+
+    """
+
+    def __init__(
+        self,
+        retry_after: float,
+        msg: tp.Optional[str] = None
+    ) -> None:
+        self.retry_after = retry_after
+        if not msg:
+            msg = "Too many requests, please try again later"
+        return super().__init__(msg)
+
+
+class StorageConflictError(APIError):
+    """
+    Error thrown when changes conflict with others made concurrently.
+
+    Parameters
+    ----------
+    msg : str, optional
+        The error message to display.
+
+    """
+
+    def __init__(self, msg: tp.Optional[str] = None) -> None:
+        if not msg:
+            msg = "The data was changed by another request, please retry"
+        return super().__init__(msg)
+
+
+class ReadOnlyError(Exception):
+    """
+    Error thrown when changes are made in a read-only unit of work.
+
+    Parameters
+    ----------
+    msg : str, optional
+        The error message to display.
+
+    """
+
+    def __init__(self, msg: tp.Optional[str] = None) -> None:
+        if not msg:
+            msg = "Changes can't be made in a read-only unit of work"
+        return super().__init__(msg)
+
+
+class RepeatedQueryError(Exception):
+    """
+    Error thrown when the same database query is executed repeatedly.
+
+    Parameters
+    ----------
+    repeated : Dict[str, int]
+        The repeated statement templates and their execution counts.
+
+    """
+
+    def __init__(self, repeated: tp.Dict[str, int]) -> None:
+        self.repeated = repeated
+        msg = "Repeated (N+1) queries executed:"
+        for template, count in repeated.items():
+            msg += f"\n  [{count}x] {template}"
+        return super().__init__(msg)
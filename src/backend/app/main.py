@@ -2,9 +2,12 @@
 """
 Main backend API components.
 """
-import typing as tp
+import asyncio
+import logging
+import math
 
 from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.httpsredirect import HTTPSRedirectMiddleware
 from starlette.requests import Request
@@ -13,24 +16,93 @@ from starlette.responses import Response
 from starlette.status import (
     HTTP_400_BAD_REQUEST,
     HTTP_403_FORBIDDEN,
-    HTTP_404_NOT_FOUND
+    HTTP_404_NOT_FOUND,
+    HTTP_409_CONFLICT,
+    HTTP_429_TOO_MANY_REQUESTS
 )
 
+from app.api.middleware import MetricsMiddleware
+from app.api.middleware import ServerTimingMiddleware
 from app.api.utils.core import load_api_router
+from app.api.utils.pagination import NEXT_CURSOR_HEADER
 from app.core import config
-from app.db.crud.core import SQLUnitOfWork
+from app.core.metrics import generate_metrics
+from app.db.crud.config.setting import warm_settings_cache
 from app.db.session import Session
+from app.db.session import engine
+from app.db.session import get_worker_capacity
 from app.exceptions import (
     APIError,
     ObjectNotFoundError,
     ObjectExistsError,
     PrivilegeError,
+    RateLimitError,
+    StorageConflictError,
 )
+from app.memory.store import memory_store
+from app.memory.utils import create_initial_superuser
+from app.utils.concurrency import MonitoredThreadPoolExecutor
 
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(title=config.PROJECT_NAME, openapi_url="/api/openapi.json")
 
 
+# Concurrency
+
+@app.on_event('startup')
+async def startup_executor() -> None:
+    """Installs the API's executor as the event loop's default.
+
+    Blocking work (sync endpoints/dependencies and so storage calls) is
+    run on this executor, sized to the database pool (less some headroom
+    for sessions still open while their response is sent) so that
+    requests queue here rather than on connection checkout.
+
+    """
+    max_workers = config.THREADPOOL_MAX_WORKERS or get_worker_capacity(
+        engine, config.THREADPOOL_POOL_HEADROOM
+    )
+    app.state.executor = MonitoredThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix='api-worker'
+    )
+    asyncio.get_event_loop().set_default_executor(app.state.executor)
+    logger.info(f"Using {app.state.executor.max_workers} worker threads")
+    return
+
+
+@app.on_event('startup')
+def startup_settings_cache() -> None:
+    """Loads the (process-wide) settings cache."""
+    if config.STORAGE_TYPE.lower() != 'database':
+        return
+    db = Session()
+    try:
+        warm_settings_cache(db)
+    except SQLAlchemyError as ex:
+        logger.warning(f"Could not load the settings cache: {ex}")
+    finally:
+        db.close()
+    return
+
+
+@app.on_event('startup')
+def startup_memory_store() -> None:
+    """Creates the initial superuser (if using in-memory storage)."""
+    if config.STORAGE_TYPE.lower() == 'memory' and config.SUPERUSER_EMAIL:
+        create_initial_superuser(memory_store)
+    return
+
+
+@app.on_event('shutdown')
+async def shutdown_executor() -> None:
+    """Shuts down the API's executor."""
+    app.state.executor.shutdown(wait=False)
+    return
+
+
 # Security
 
 # - HTTPS
@@ -44,39 +116,30 @@ if config.ALLOWED_ORIGINS:
         allow_origins=config.ALLOWED_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
-        allow_headers=["*"]
+        allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER]
     )
 
 
-# API Routes Configuration
+# Instrumentation
 
-api_router = load_api_router(config.API_VERSION)
-app.include_router(api_router, prefix=f"/api")
+if config.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
 
+if config.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, router=app.router)
 
-# Additional Middleware (order matters)
+    @app.get('/metrics', include_in_schema=False)
+    async def metrics() -> Response:
+        """Prometheus metrics endpoint."""
+        content, media_type = generate_metrics()
+        return Response(content, media_type=media_type)
 
-@app.middleware('http')
-async def uow_middleware(
-    request: Request,
-    call_next: tp.Callable
-) -> Response:
-    """Middleware to add session-based Unit of Work to request state."""
-    request.state.uow = SQLUnitOfWork(request.state.db)
-    response = await call_next(request)
-    return response
 
+# API Routes Configuration
 
-@app.middleware('http')
-async def db_session_middleware(
-    request: Request,
-    call_next: tp.Callable
-) -> Response:
-    """Middleware to add database session object to request state."""
-    request.state.db = Session()
-    response = await call_next(request)
-    request.state.db.close()
-    return response
+api_router = load_api_router(config.API_VERSION)
+app.include_router(api_router, prefix=f"/api")
 
 
 # Additional Error Handlers
@@ -117,3 +180,25 @@ async def privilege_exception_handler(
 ) -> JSONResponse:
     """Insufficient privileges exception handler."""
     return JSONResponse({'message': str(exc)}, status_code=HTTP_403_FORBIDDEN)
+
+
+@app.exception_handler(StorageConflictError)
+async def storage_conflict_exception_handler(
+    request: Request,
+    exc: StorageConflictError
+) -> JSONResponse:
+    """Conflicting concurrent changes exception handler."""
+    return JSONResponse({'message': str(exc)}, status_code=HTTP_409_CONFLICT)
+
+
+@app.exception_handler(RateLimitError)
+async def rate_limit_exception_handler(
+    request: Request,
+    exc: RateLimitError
+) -> JSONResponse:
+    """Rate limit exceeded exception handler."""
+    return JSONResponse(
+        {'message': str(exc)},
+        status_code=HTTP_429_TOO_MANY_REQUESTS,
+        headers={'Retry-After': str(math.ceil(exc.retry_after))}
+    )
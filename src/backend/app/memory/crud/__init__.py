@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+CRUD in-memory object storage implementations.
+"""
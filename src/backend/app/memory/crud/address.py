@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""
+Address repository.
+"""
+from app.crud.address import AddressRepository
+from app.db.models.address import Address
+from app.memory.crud.base import MemoryRepositoryMixin
+
+
+class AddressMemoryRepository(
+    MemoryRepositoryMixin,
+    AddressRepository[Address]
+):
+    """
+    In-memory Address object repository.
+    """
+    __obj_cls__ = Address
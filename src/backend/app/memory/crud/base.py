@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Base class for in-memory CRUD repositories.
+"""
+from abc import ABC
+from abc import ABCMeta
+from operator import attrgetter
+import typing as tp
+from uuid import UUID
+
+from app.crud.base import (T, C, U)
+from app.exceptions import InvalidCursorError
+from app.exceptions import ObjectNotFoundError
+from app.memory.store import MemoryTable
+from app.utils.pagination import decode_cursor
+from app.utils.pagination import encode_cursor
+
+
+IndexFns = tp.Mapping[str, tp.Callable[[tp.Any], tp.Any]]
+
+# - Unique index key functions by table name, for all the repositories
+table_indexes: tp.Dict[str, IndexFns] = {}
+
+
+class BaseMemoryRepositoryMixin(ABC):
+    """
+    In-memory object storage repository base mixin class.
+
+    Objects are stored as (transient) instances of the database storage
+    models, so they behave the same as those from the SQL repositories,
+    with their column defaults and foreign keys filled in on storage.
+
+    Unique indexes on the objects are declared in the ``__indexes__``
+    mapping of index name to the function getting an object's key (or
+    ``None`` to leave it out of the index).
+
+    Parameters
+    ----------
+    unit_of_work : MemoryUnitOfWork
+        The unit of work object to use.
+
+    """
+    __indexes__: tp.Dict[str, tp.Callable[[tp.Any], tp.Any]] = {}
+
+    def __init_subclass__(cls, **kwargs: tp.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        obj_cls = getattr(cls, '__obj_cls__', None)
+        if obj_cls is not None:
+            table_indexes[obj_cls.__tablename__] = cls.__indexes__
+        return
+
+    @property
+    def _table_name(self) -> str:
+        """str: The name of the table of these objects."""
+        return self.__obj_cls__.__tablename__
+
+    @property
+    def _table(self) -> MemoryTable:
+        """MemoryTable: The unit of work's (read-only) table of these
+        objects."""
+        return self._uow.get_table(self._table_name)
+
+    def _load(self, row: tp.Optional[tp.Any]) -> tp.Optional[T]:
+        """Gets the unit of work's object for a row of the table."""
+        return self._uow.load(self._table_name, row)
+
+    def _load_all(self) -> tp.List[T]:
+        """Gets the unit of work's objects for all rows of the table."""
+        return [self._load(x) for x in self._table.rows.values()]
+
+    def _lookup(self, index: str, key: tp.Any) -> tp.Optional[T]:
+        """Gets the object with the given `key` in an index."""
+        table = self._table
+        row_id = table.indexes.get(index, {}).get(key)
+        if row_id is None:
+            return None
+        return self._load(table.rows.get(row_id))
+
+    def create(self, obj: C) -> T:
+        new_obj = super().create(obj)
+        self._uow.put(self._table_name, new_obj)
+        return new_obj
+
+    def update(self, obj: T, update: U) -> T:
+        obj = super().update(obj, update)
+        self._uow.put(self._table_name, obj)
+        return obj
+
+    def delete(self, obj: T) -> T:
+        self._uow.remove(self._table_name, obj)
+        return obj
+
+
+class MemoryRepositoryMixin(BaseMemoryRepositoryMixin, metaclass=ABCMeta):
+    """
+    In-memory ID object storage repository mixin class.
+
+    Loading profiles are accepted (for compatibility with the SQL
+    repositories) but have no effect, as related objects are always
+    loaded.
+    """
+    __indexes__ = {
+        'uid': attrgetter('uid'),
+    }
+
+    def get(
+        self,
+        id: UUID,
+        *,
+        raise_ex: bool = False,
+        profile: tp.Optional[str] = None
+    ) -> tp.Optional[T]:
+        rv = self._lookup('uid', id)
+        if not rv and raise_ex:
+            raise ObjectNotFoundError(self.__obj_cls__, 'id')
+        return rv
+
+    def get_many(
+        self,
+        ids: tp.Sequence[UUID],
+        *,
+        raise_missing: bool = False,
+        profile: tp.Optional[str] = None
+    ) -> tp.List[T]:
+        rv = []
+        for id in ids:
+            obj = self._lookup('uid', id)
+            if obj is not None:
+                rv.append(obj)
+            elif raise_missing:
+                raise ObjectNotFoundError(self.__obj_cls__, 'id', str(id))
+        return rv
+
+    def get_by_id(
+        self,
+        id: int,
+        *,
+        raise_ex: bool = False
+    ) -> tp.Optional[T]:
+        rv = self._load(self._table.rows.get(id))
+        if not rv and raise_ex:
+            raise ObjectNotFoundError(self.__obj_cls__, 'id')
+        return rv
+
+    def all(
+        self,
+        *,
+        skip: tp.Optional[int] = None,
+        limit: tp.Optional[int] = None,
+        cursor: tp.Optional[str] = None,
+        profile: tp.Optional[str] = None
+    ) -> tp.List[T]:
+        # - Rows are kept in ID order
+        rv = list(self._table.rows.values())
+        if cursor is not None:
+            last_id = decode_cursor(cursor)
+            if not isinstance(last_id, int):
+                raise InvalidCursorError(cursor)
+            rv = [x for x in rv if x.id > last_id]
+
+        if skip:
+            rv = rv[skip:]
+        if limit is not None:
+            rv = rv[:limit]
+        return [self._load(x) for x in rv]
+
+    def get_cursor(self, obj: T) -> str:
+        return encode_cursor(obj.id)
+
+
+class MemorySingletonRepositoryMixin(
+    BaseMemoryRepositoryMixin,
+    metaclass=ABCMeta
+):
+    """
+    In-memory singleton object storage repository mixin class.
+    """
+
+    def get(
+        self,
+        *,
+        raise_ex: bool = False,
+        profile: tp.Optional[str] = None
+    ) -> tp.Optional[T]:
+        rv = self._load(next(iter(self._table.rows.values()), None))
+        if not rv and raise_ex:
+            raise ObjectNotFoundError(self.__obj_cls__)
+        return rv
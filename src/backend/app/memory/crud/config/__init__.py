@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+Configuration related in-memory object storage repositories.
+"""
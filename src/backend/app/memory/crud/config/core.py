@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Configuration in-memory storage repository group.
+"""
+from app.crud.config.core import ConfigRepositoryGroup
+from app.memory.crud.config.permission import PermissionMemoryRepository
+from app.memory.crud.config.setting import SettingMemoryRepository
+from app.memory.crud.config.user import UserPermissionMemoryRepository
+from app.utils.proputils import lazy_property
+
+
+class ConfigMemoryRepositoryGroup(ConfigRepositoryGroup):
+    """
+    Configuration-related in-memory repository group.
+    """
+
+    @lazy_property
+    def permission(self) -> PermissionMemoryRepository:
+        """PermissionMemoryRepository: Permission specification
+        repository."""
+        return PermissionMemoryRepository(
+            self._uow, *self._args, **self._kwargs
+        )
+
+    @lazy_property
+    def setting(self) -> SettingMemoryRepository:
+        """SettingMemoryRepository: Setting storage repository."""
+        return SettingMemoryRepository(
+            self._uow, *self._args, **self._kwargs
+        )
+
+    @lazy_property
+    def user(self) -> UserPermissionMemoryRepository:
+        """UserPermissionMemoryRepository: User permissions repository."""
+        return UserPermissionMemoryRepository(
+            self._uow, *self._args, **self._kwargs
+        )
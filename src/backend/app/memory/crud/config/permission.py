@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+Permission specification in-memory object repository.
+"""
+from operator import attrgetter
+
+from app.crud.config.permission import PermissionRepository
+from app.db.models.config.permission import Permission
+from app.memory.crud.base import MemoryRepositoryMixin
+
+
+class PermissionMemoryRepository(
+    MemoryRepositoryMixin,
+    PermissionRepository[Permission]
+):
+    """
+    Permission in-memory object storage repository.
+    """
+    __obj_cls__ = Permission
+    __indexes__ = {
+        'uid': attrgetter('uid'),
+        'name': attrgetter('name'),
+    }
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+In-memory configuration Setting storage repository implementation.
+"""
+from operator import attrgetter
+
+from app.crud.config.setting import SettingRepository
+from app.db.models.config.setting import Setting
+from app.db.models.config.setting import (
+    SettingBoolean,
+    SettingDatetime,
+    SettingFloat,
+    SettingInteger,
+    SettingString,
+    SettingUUID,
+)
+from app.exceptions import ObjectNotFoundError
+from app.memory.crud.base import MemoryRepositoryMixin
+from app.models.config.setting import SettingCreate
+from app.models.config.setting import ValueType
+
+
+_type_mapping = {
+    ValueType.BOOLEAN: SettingBoolean,
+    ValueType.DATETIME: SettingDatetime,
+    ValueType.FLOAT: SettingFloat,
+    ValueType.INTEGER: SettingInteger,
+    ValueType.STRING: SettingString,
+    ValueType.UUID: SettingUUID,
+}
+
+
+class SettingMemoryRepository(
+    MemoryRepositoryMixin,
+    SettingRepository[Setting]
+):
+    """
+    Setting in-memory object storage repository.
+    """
+    __obj_cls__ = Setting
+    __indexes__ = {
+        'uid': attrgetter('uid'),
+        'name': attrgetter('name'),
+    }
+
+    def _create_obj(self, obj: SettingCreate) -> Setting:
+        return _type_mapping[obj.type](**dict(obj))
+
+    def get_by_name(self, name: str, *, raise_ex: bool = False) -> Setting:
+        rv = self._lookup('name', name)
+        if not rv and raise_ex:
+            raise ObjectNotFoundError('Setting', 'name', name)
+        return rv
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+User Permission settings in-memory object repository.
+"""
+from uuid import UUID
+
+from app.core.security import PermissionAction
+from app.core.security import PermissionMatrix
+from app.crud.config.user import UserPermissionRepository
+from app.db.models.config.user import UserPermission
+from app.memory.crud.base import MemoryRepositoryMixin
+
+
+class UserPermissionMemoryRepository(
+    MemoryRepositoryMixin,
+    UserPermissionRepository[UserPermission]
+):
+    """
+    User Permission in-memory object storage repository.
+    """
+    __obj_cls__ = UserPermission
+    __indexes__ = {}
+
+    def get_matrix(self, user_uid: UUID) -> PermissionMatrix:
+        overrides = {
+            x.permission_id: x for x in self._load_all()
+            if x.user is not None and x.user.uid == user_uid
+        }
+        actions = {}
+        for permission in self._uow.config.permission.all():
+            own = overrides.get(permission.id)
+            allowed = PermissionAction(0)
+            for action in PermissionAction:
+                key = action.name.lower()
+                value = getattr(own, key) if own is not None else None
+                if value is None:
+                    value = getattr(permission, f'{key}_default')
+                if value:
+                    allowed |= action
+            actions[permission.name] = allowed
+        return PermissionMatrix(actions)
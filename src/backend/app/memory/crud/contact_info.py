@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""
+ContactInfo object storage repository.
+"""
+from app.crud.contact_info import ContactInfoRepository
+from app.db.models.contact_info import ContactInfo
+from app.memory.crud.base import MemoryRepositoryMixin
+
+
+class ContactInfoMemoryRepository(
+    MemoryRepositoryMixin,
+    ContactInfoRepository[ContactInfo]
+):
+    """
+    In-memory ContactInfo object repository.
+    """
+    __obj_cls__ = ContactInfo
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""
+Core functionality for the in-memory storage repositories.
+"""
+import typing as tp
+
+from sqlalchemy import inspect
+from sqlalchemy.orm.interfaces import MANYTOONE
+
+from app.crud.core import UnitOfWork
+from app.exceptions import ObjectExistsError
+from app.exceptions import StorageConflictError
+from app.memory.crud.base import table_indexes
+from app.memory.store import MemoryStore
+from app.memory.store import MemoryTable
+from app.utils.proputils import lazy_property
+
+from app.memory.crud.address import AddressMemoryRepository
+from app.memory.crud.contact_info import ContactInfoMemoryRepository
+from app.memory.crud.event import EventMemoryRepository
+from app.memory.crud.name import NameMemoryRepository
+from app.memory.crud.person import PersonMemoryRepository
+from app.memory.crud.user import UserMemoryRepository
+
+from app.memory.crud.config.core import ConfigMemoryRepositoryGroup
+from app.memory.crud.wedding.core import WeddingMemoryRepositoryGroup
+
+
+def _row_values(obj: tp.Any) -> tp.Dict[str, tp.Any]:
+    """Gets the column values of the given object."""
+    return {
+        x.key: getattr(obj, x.key) for x in inspect(type(obj)).column_attrs
+    }
+
+
+def _copy_row(obj: tp.Any) -> tp.Any:
+    """Copies the column values of an object into a new object."""
+    return type(obj)(**_row_values(obj))
+
+
+def _prepare(obj: tp.Any) -> None:
+    """Fills in the object's column defaults and foreign keys."""
+    mapper = inspect(type(obj))
+    for prop in mapper.column_attrs:
+        column = prop.columns[0]
+        if column.primary_key or column.default is None \
+                or getattr(obj, prop.key) is not None:
+            continue
+        if column.default.is_scalar:
+            setattr(obj, prop.key, column.default.arg)
+        elif column.default.is_callable:
+            setattr(obj, prop.key, column.default.arg(None))
+
+    for rel in mapper.relationships:
+        if rel.direction is not MANYTOONE:
+            continue
+        related = getattr(obj, rel.key)
+        for local, remote in rel.local_remote_pairs:
+            local_key = mapper.get_property_by_column(local).key
+            if related is None:
+                setattr(obj, local_key, None)
+            else:
+                remote_key = rel.mapper.get_property_by_column(remote).key
+                setattr(obj, local_key, getattr(related, remote_key))
+    return
+
+
+class MemoryUnitOfWork(UnitOfWork):
+    """
+    Unit of Work for the in-memory object storage.
+
+    The store's tables are read as they were when first used, with each
+    stored row loaded as a new object (its related objects resolved by
+    their foreign keys from the same tables), so changes made to the
+    objects are only seen by other units of work once committed.  Any
+    loaded objects changed without going through the repositories are
+    stored on commit too.
+
+    Only the tables changed are copied, and committing fails if another
+    unit of work committed changes to any of them first.
+
+    Parameters
+    ----------
+    store : MemoryStore
+        The in-memory object store to use.
+
+    """
+    __slots__ = ('_store', '_tables', '_version', '_changed', '_loaded',
+                 '_callbacks')
+
+    def __init__(self, store: MemoryStore) -> None:
+        self._store = store
+        self._tables: tp.Optional[tp.Mapping[str, MemoryTable]] = None
+        self._version: tp.Optional[int] = None
+        self._changed: tp.Dict[str, MemoryTable] = {}
+        self._loaded: tp.Dict[
+            tp.Tuple[str, int], tp.Tuple[tp.Any, tp.Any, tp.Dict[str, tp.Any]]
+        ] = {}
+        self._callbacks: tp.List[tp.Callable[[], None]] = []
+        return super().__init__()
+
+    def get_table(self, name: str) -> MemoryTable:
+        """Gets the table of objects with the given name.
+
+        The table returned (and its rows) must not be changed, use
+        :meth:`put` and :meth:`remove` to make changes.
+
+        Parameters
+        ----------
+        name : str
+            The name of the table to get.
+
+        Returns
+        -------
+        MemoryTable
+            The table, as of this unit of work's first use of the store
+            and with its changes made.
+
+        """
+        rv = self._changed.get(name)
+        if rv is None:
+            if self._tables is None:
+                self._version, self._tables = self._store.checkout()
+            rv = self._tables.get(name)
+            if rv is None:
+                rv = MemoryTable(table_indexes.get(name, ()))
+        return rv
+
+    def load(self, name: str, row: tp.Optional[tp.Any]) -> tp.Optional[tp.Any]:
+        """Gets this unit of work's object for a row of a table.
+
+        Parameters
+        ----------
+        name : str
+            The name of the table the `row` is from.
+        row : Any, optional
+            The stored row to get the object for.
+
+        Returns
+        -------
+        Any or None
+            The (same) object for the row each time it's loaded, or
+            ``None`` if no `row` was given.
+
+        """
+        if row is None:
+            return None
+        loaded = self._loaded.get((name, row.id))
+        if loaded is not None:
+            return loaded[0]
+
+        rv = _copy_row(row)
+        mapper = inspect(type(row))
+        for rel in mapper.relationships:
+            if rel.direction is not MANYTOONE:
+                continue
+            # - Foreign keys here all reference (row) IDs
+            (local, _), = rel.local_remote_pairs
+            related_id = getattr(row, mapper.get_property_by_column(local).key)
+            if related_id is None:
+                setattr(rv, rel.key, None)
+                continue
+            related_name = rel.mapper.class_.__tablename__
+            setattr(rv, rel.key, self.load(
+                related_name, self.get_table(related_name).rows.get(related_id)
+            ))
+        self._loaded[(name, row.id)] = (rv, row, self._index_keys(name, rv))
+        return rv
+
+    def put(self, name: str, obj: tp.Any) -> None:
+        """Stores an object in (this unit of work's copy of) a table.
+
+        Parameters
+        ----------
+        name : str
+            The name of the table to store the object in.
+        obj : Any
+            The (new or loaded) object to store.
+
+        Raises
+        ------
+        ObjectExistsError
+            If another object has the same key in one of the table's
+            indexes.
+
+        """
+        _prepare(obj)
+        table = self._get_changed_table(name)
+        if getattr(obj, 'id', None) is None:
+            obj.id = table.next_id()
+        old_keys = self._get_loaded_keys(name, obj.id)
+        new_keys = self._index_keys(name, obj)
+        for index, key in new_keys.items():
+            row_id = table.indexes[index].get(key)
+            if key is not None and row_id not in (None, obj.id):
+                raise ObjectExistsError(type(obj), index, str(key))
+
+        for index, key in old_keys.items():
+            if table.indexes[index].get(key) == obj.id:
+                del table.indexes[index][key]
+        for index, key in new_keys.items():
+            if key is not None:
+                table.indexes[index][key] = obj.id
+        row = table.rows[obj.id] = _copy_row(obj)
+        self._loaded[(name, obj.id)] = (obj, row, new_keys)
+        return
+
+    def remove(self, name: str, obj: tp.Any) -> None:
+        """Removes an object from (this unit of work's copy of) a table.
+
+        Parameters
+        ----------
+        name : str
+            The name of the table to remove the object from.
+        obj : Any
+            The object to remove.
+
+        """
+        old_keys = self._get_loaded_keys(name, obj.id)
+        table = self._get_changed_table(name)
+        table.rows.pop(obj.id, None)
+        for index, key in old_keys.items():
+            if table.indexes[index].get(key) == obj.id:
+                del table.indexes[index][key]
+        self._loaded.pop((name, obj.id), None)
+        return
+
+    def after_commit(self, callback: tp.Callable[[], None]) -> None:
+        """Registers a function to call once the changes are committed.
+
+        Parameters
+        ----------
+        callback : Callable[[], None]
+            The function to call (once) after the next successful
+            commit, it's discarded if the changes are rolled back.
+
+        """
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+        return
+
+    def _get_changed_table(self, name: str) -> MemoryTable:
+        """Gets this unit of work's copy of a table, to change."""
+        rv = self._changed.get(name)
+        if rv is None:
+            rv = self._changed[name] = self.get_table(name).copy(
+                table_indexes.get(name, ())
+            )
+        return rv
+
+    def _index_keys(self, name: str, obj: tp.Any) -> tp.Dict[str, tp.Any]:
+        """Gets the index keys of an object in a table."""
+        return {k: f(obj) for k, f in table_indexes.get(name, {}).items()}
+
+    def _get_loaded_keys(self, name: str, id: int) -> tp.Dict[str, tp.Any]:
+        """Gets the stored index keys of a row (loading it if needed)."""
+        loaded = self._loaded.get((name, id))
+        if loaded is None:
+            if self.load(name, self.get_table(name).rows.get(id)) is None:
+                return {}
+            loaded = self._loaded[(name, id)]
+        return loaded[2]
+
+    def _flush(self) -> None:
+        """Stores any loaded objects changed outside the repositories."""
+        for (name, _), (obj, row, _) in list(self._loaded.items()):
+            _prepare(obj)
+            if _row_values(obj) != _row_values(row):
+                self.put(name, obj)
+        return
+
+    def _reset(self) -> None:
+        self._tables = None
+        self._changed = {}
+        self._loaded = {}
+        self._callbacks = []
+        return
+
+    # Repositories
+
+    @lazy_property
+    def address(self) -> AddressMemoryRepository:
+        return AddressMemoryRepository(self)
+
+    @lazy_property
+    def contact_info(self) -> ContactInfoMemoryRepository:
+        return ContactInfoMemoryRepository(self)
+
+    @lazy_property
+    def event(self) -> EventMemoryRepository:
+        return EventMemoryRepository(self)
+
+    @lazy_property
+    def name(self) -> NameMemoryRepository:
+        return NameMemoryRepository(self)
+
+    @lazy_property
+    def person(self) -> PersonMemoryRepository:
+        return PersonMemoryRepository(self)
+
+    @lazy_property
+    def user(self) -> UserMemoryRepository:
+        return UserMemoryRepository(self)
+
+    # Repository groups
+
+    @lazy_property
+    def wedding(self) -> WeddingMemoryRepositoryGroup:
+        return WeddingMemoryRepositoryGroup(self)
+
+    @lazy_property
+    def config(self) -> ConfigMemoryRepositoryGroup:
+        return ConfigMemoryRepositoryGroup(self)
+
+    # Commit/rollback
+
+    def commit(self) -> None:
+        """Commits the changes made.
+
+        Raises
+        ------
+        StorageConflictError
+            If changes were made, but another unit of work committed
+            changes to any of the same tables since this one first used
+            the store.
+
+        """
+        self._flush()
+        if self._changed:
+            try:
+                self._store.publish(self._changed, self._version)
+            except StorageConflictError:
+                self._reset()
+                raise
+        callbacks = self._callbacks
+        self._reset()
+        for callback in callbacks:
+            callback()
+        return
+
+    def rollback(self) -> None:
+        self._reset()
+        return
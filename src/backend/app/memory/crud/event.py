@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Event object in-memory storage repository.
+"""
+import datetime
+import typing as tp
+from uuid import UUID
+
+from app.crud.event import EventRepository
+from app.db.models.event import Event
+from app.exceptions import ObjectNotFoundError
+from app.memory.crud.base import MemoryRepositoryMixin
+
+
+class EventMemoryRepository(MemoryRepositoryMixin, EventRepository[Event]):
+    """
+    Event object in-memory storage repository.
+    """
+    __obj_cls__ = Event
+
+    def get_by_address_id(
+        self,
+        address_id: UUID,
+        *,
+        raise_ex: bool = False
+    ) -> tp.List[Event]:
+        rv = [
+            x for x in self._load_all()
+            if x.address is not None and x.address.uid == address_id
+        ]
+        if not rv and raise_ex:
+            raise ObjectNotFoundError(Event, 'address_id')
+        return rv
+
+    def get_by_date(
+        self,
+        date: datetime.date,
+        *,
+        raise_ex: bool = False
+    ) -> tp.List[Event]:
+        rv = [self._load(x) for x in self._table.rows.values()
+              if x.date == date]
+        if not rv and raise_ex:
+            raise ObjectNotFoundError(Event, 'date')
+        return rv
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+Name repository.
+"""
+from app.crud.name import NameRepository
+from app.db.models.name import Name
+from app.memory.crud.base import MemoryRepositoryMixin
+
+
+class NameMemoryRepository(MemoryRepositoryMixin, NameRepository[Name]):
+    """
+    In-memory Name object repository.
+    """
+    __obj_cls__ = Name
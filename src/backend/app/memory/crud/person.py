@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Person object storage repository.
+"""
+from operator import attrgetter
+import typing as tp
+from uuid import UUID
+
+from app.crud.person import PersonRepository
+from app.db.models.person import Person
+from app.exceptions import ObjectNotFoundError
+from app.memory.crud.base import MemoryRepositoryMixin
+
+
+class PersonMemoryRepository(MemoryRepositoryMixin, PersonRepository[Person]):
+    """
+    Person object in-memory storage repository.
+    """
+    __obj_cls__ = Person
+    __indexes__ = {
+        'uid': attrgetter('uid'),
+        'name_id': lambda x: x.name.uid if x.name is not None else None,
+    }
+
+    def get_by_name_id(
+        self,
+        name_id: UUID,
+        *,
+        raise_ex: bool = False
+    ) -> tp.Optional[Person]:
+        rv = self._lookup('name_id', name_id)
+        if not rv and raise_ex:
+            raise ObjectNotFoundError(Person, 'name_id')
+        return rv
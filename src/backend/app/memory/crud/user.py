@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+User repository.
+"""
+from operator import attrgetter
+import typing as tp
+
+from app.core import config
+from app.core.security import UserAuth
+from app.crud.user import UserRepository
+from app.db.models.user import User
+from app.exceptions import ObjectNotFoundError
+from app.memory.crud.base import MemoryRepositoryMixin
+from app.models.user import UserUpdate
+from app.utils.cache import TTLCache
+
+
+# - Authorization snapshots by access token, cleared once a change to any
+#   user's authorization fields (or a user's removal) is committed.
+auth_cache: TTLCache[str, UserAuth] = TTLCache(
+    config.AUTH_CACHE_SIZE, config.AUTH_CACHE_TTL
+)
+
+
+class UserMemoryRepository(MemoryRepositoryMixin, UserRepository[User]):
+    """
+    User object in-memory storage repository.
+    """
+    __obj_cls__ = User
+    __indexes__ = {
+        'uid': attrgetter('uid'),
+        'email': attrgetter('email'),
+    }
+
+    @property
+    def _auth_cache(self) -> TTLCache[str, UserAuth]:
+        return auth_cache
+
+    def update(self, obj: User, updated: UserUpdate) -> User:
+        old_auth = UserAuth.from_user(obj)
+        rv = super().update(obj, updated)
+        if UserAuth.from_user(rv) != old_auth:
+            self._uow.after_commit(auth_cache.clear)
+        return rv
+
+    def delete(self, obj: User) -> User:
+        rv = super().delete(obj)
+        self._uow.after_commit(auth_cache.clear)
+        return rv
+
+    def get_by_email(
+        self,
+        email: str,
+        *,
+        raise_ex: bool = False
+    ) -> tp.Optional[User]:
+        rv = self._lookup('email', email)
+        if not rv and raise_ex:
+            raise ObjectNotFoundError(User, 'email')
+        return rv
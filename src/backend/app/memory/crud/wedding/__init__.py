@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+Wedding in-memory storage repositories.
+"""
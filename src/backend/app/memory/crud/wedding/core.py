@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""
+Wedding in-memory storage repository group.
+"""
+from app.crud.wedding.core import WeddingRepositoryGroup
+from app.memory.crud.wedding.wedding_info import WeddingInfoMemoryRepository
+from app.utils.proputils import lazy_property
+
+
+class WeddingMemoryRepositoryGroup(WeddingRepositoryGroup):
+    """
+    Wedding in-memory repository group.
+    """
+
+    @lazy_property
+    def wedding_info(self) -> WeddingInfoMemoryRepository:
+        """WeddingInfoMemoryRepository: Wedding information repository."""
+        return WeddingInfoMemoryRepository(
+            self._uow, *self._args, **self._kwargs
+        )
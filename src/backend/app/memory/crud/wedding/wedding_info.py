@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""
+Wedding information in-memory object repository.
+"""
+from app.crud.wedding.wedding_info import WeddingInfoRepository
+from app.db.models.wedding.wedding_info import WeddingInfo
+from app.memory.crud.base import MemorySingletonRepositoryMixin
+
+
+class WeddingInfoMemoryRepository(
+    MemorySingletonRepositoryMixin,
+    WeddingInfoRepository[WeddingInfo]
+):
+    """
+    WeddingInfo in-memory, singleton object storage repository.
+    """
+    __obj_cls__ = WeddingInfo
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+In-memory object storage.
+"""
+import threading
+import typing as tp
+
+from app.exceptions import StorageConflictError
+
+
+class MemoryTable(object):
+    """
+    In-memory storage for one type of object.
+
+    Parameters
+    ----------
+    indexes : Iterable[str], optional
+        The names of the (unique) indexes to keep for the objects.
+
+    """
+    __slots__ = ('rows', 'indexes', 'last_id')
+
+    def __init__(self, indexes: tp.Iterable[str] = ()) -> None:
+        self.rows: tp.Dict[int, tp.Any] = {}
+        self.indexes: tp.Dict[str, tp.Dict[tp.Any, int]] = {
+            x: {} for x in indexes
+        }
+        self.last_id = 0
+        return
+
+    def next_id(self) -> int:
+        """Gets the next (unused) ID for a new object.
+
+        Returns
+        -------
+        int
+            The new object's ID.
+
+        """
+        self.last_id += 1
+        return self.last_id
+
+    def copy(self, indexes: tp.Iterable[str] = ()) -> 'MemoryTable':
+        """Gets a (shallow) copy of this table to make changes to.
+
+        The rows themselves aren't copied, they must be replaced (rather
+        than changed) in the new table.
+
+        Parameters
+        ----------
+        indexes : Iterable[str], optional
+            The names of any (empty) indexes to add to the copy, if not
+            already in this table.
+
+        Returns
+        -------
+        MemoryTable
+            The new copy of this table.
+
+        """
+        rv = MemoryTable(indexes)
+        rv.rows.update(self.rows)
+        rv.indexes.update({k: dict(v) for k, v in self.indexes.items()})
+        rv.last_id = self.last_id
+        return rv
+
+
+class MemoryStore(object):
+    """
+    Process-wide, in-memory object storage.
+
+    The stored tables (and their rows) are never changed once stored,
+    units of work instead read from the tables as they were when first
+    used and replace the tables they change (with copies) on commit -
+    unless another unit of work changed any of the same tables first.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tables: tp.Dict[str, MemoryTable] = {}
+        self._changed_at: tp.Dict[str, int] = {}
+        self._version = 0
+        return
+
+    @property
+    def version(self) -> int:
+        """int: The number of commits made to the store."""
+        return self._version
+
+    def checkout(self) -> tp.Tuple[int, tp.Mapping[str, MemoryTable]]:
+        """Gets the stored tables to work with.
+
+        Returns
+        -------
+        Tuple[int, Mapping[str, MemoryTable]]
+            The store's current version and its (read-only) tables.
+
+        """
+        with self._lock:
+            return self._version, self._tables
+
+    def publish(
+        self,
+        tables: tp.Mapping[str, MemoryTable],
+        version: int
+    ) -> int:
+        """Replaces the given tables in the store.
+
+        Parameters
+        ----------
+        tables : Mapping[str, MemoryTable]
+            The (changed) tables to store, which mustn't be changed once
+            stored.
+        version : int
+            The version of the store the `tables` were checked out at.
+
+        Returns
+        -------
+        int
+            The store's new version.
+
+        Raises
+        ------
+        StorageConflictError
+            If any of the `tables` have changed since the given
+            `version`.
+
+        """
+        with self._lock:
+            for name in tables:
+                if self._changed_at.get(name, 0) > version:
+                    raise StorageConflictError()
+            new_tables = dict(self._tables)
+            new_tables.update(tables)
+            self._tables = new_tables
+            self._version += 1
+            for name in tables:
+                self._changed_at[name] = self._version
+            return self._version
+
+    def clear(self) -> None:
+        """Removes all the stored objects."""
+        with self._lock:
+            self._version += 1
+            for name in self._tables:
+                self._changed_at[name] = self._version
+            self._tables = {}
+        return
+
+
+memory_store = MemoryStore()
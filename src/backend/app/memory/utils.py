@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+In-memory storage utilities.
+"""
+import typing as tp
+
+from app.core import config
+from app.memory.crud.core import MemoryUnitOfWork
+from app.memory.store import MemoryStore
+from app.models.user import UserCreate
+
+
+def create_initial_superuser(
+    store: MemoryStore,
+    *,
+    su_email: tp.Optional[str] = None,
+    su_password: tp.Optional[str] = None
+) -> None:
+    """Creates the initial superuser account in the in-memory store.
+
+    Parameters
+    ----------
+    store : MemoryStore
+        The in-memory object store to use.
+    su_email : str, optional
+        The email address to use for the first superuser account (if not
+        given then :obj:`config.SUPERUSER_EMAIL` is used).
+    su_password : str, optional
+        The password to use for the first superuser account (if not
+        given then :obj:`config.SUPERUSER_PASSWORD` is used).
+
+    """
+    if not su_email:
+        su_email = config.SUPERUSER_EMAIL
+    uow = MemoryUnitOfWork(store)
+    user = uow.user.get_by_email(su_email)
+    if not user:
+        if not su_password:
+            su_password = config.SUPERUSER_PASSWORD
+        new_super_user = UserCreate(email=su_email, password=su_password)
+        new_super_user.is_poweruser = True
+        new_super_user.is_superuser = True
+        with uow:
+            uow.user.create(new_super_user)
+    return
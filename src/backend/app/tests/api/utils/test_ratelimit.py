@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the API's (login) rate limiting utilities.
+"""
+import ipaddress
+
+import pytest
+from starlette.requests import Request
+
+from app.api.utils import ratelimit
+from app.core import config
+from app.exceptions import RateLimitError
+from app.utils.ratelimit import MemoryRateLimitStore
+from app.utils.ratelimit import TokenBucketLimiter
+
+
+class FormData(object):
+
+    def __init__(self, username: str) -> None:
+        self.username = username
+        self.password = 'password'
+
+
+def make_request(host, *forwarded_for):
+    headers = [(b'x-forwarded-for', x.encode()) for x in forwarded_for]
+    return Request({'type': 'http', 'client': (host, 12345),
+                    'headers': headers})
+
+
+@pytest.fixture
+def trusted_proxies(monkeypatch):
+    proxies = [ipaddress.ip_network('10.0.0.0/8'),
+               ipaddress.ip_network('192.168.1.1')]
+    monkeypatch.setattr(ratelimit, '_trusted_proxies', proxies)
+    return proxies
+
+
+@pytest.fixture
+def login_limiters(monkeypatch):
+    store = MemoryRateLimitStore()
+    ip_limiter = TokenBucketLimiter(store, 2, 60.0, prefix='login:ip:')
+    user_limiter = TokenBucketLimiter(store, 2, 60.0, prefix='login:user:')
+    monkeypatch.setattr(ratelimit, 'login_ip_limiter', ip_limiter)
+    monkeypatch.setattr(ratelimit, 'login_user_limiter', user_limiter)
+    monkeypatch.setattr(config, 'LOGIN_RATE_LIMIT_ENABLED', True)
+    return ip_limiter, user_limiter
+
+
+def test_get_client_ip_no_trusted_proxies(monkeypatch) -> None:
+    monkeypatch.setattr(ratelimit, '_trusted_proxies', [])
+    request = make_request('10.0.0.1', '1.2.3.4')
+    assert ratelimit.get_client_ip(request) == '10.0.0.1'
+
+    return
+
+
+def test_get_client_ip_ignores_untrusted_forwarded_for(
+    trusted_proxies
+) -> None:
+    request = make_request('8.8.8.8', '1.2.3.4')
+    assert ratelimit.get_client_ip(request) == '8.8.8.8'
+
+    return
+
+
+def test_get_client_ip_from_trusted_proxy(trusted_proxies) -> None:
+    request = make_request('10.0.0.1', '1.2.3.4')
+    assert ratelimit.get_client_ip(request) == '1.2.3.4'
+
+    # - Addresses before the last untrusted one can be set by the client
+    request = make_request('10.0.0.1', '6.6.6.6, 1.2.3.4, 192.168.1.1')
+    assert ratelimit.get_client_ip(request) == '1.2.3.4'
+
+    request = make_request('10.0.0.1', '6.6.6.6', '1.2.3.4, 10.0.0.2')
+    assert ratelimit.get_client_ip(request) == '1.2.3.4'
+
+    return
+
+
+def test_get_client_ip_trusted_proxy_without_header(trusted_proxies) -> None:
+    assert ratelimit.get_client_ip(make_request('10.0.0.1')) == '10.0.0.1'
+    request = make_request('10.0.0.1', '10.0.0.2')
+    assert ratelimit.get_client_ip(request) == '10.0.0.2'
+
+    return
+
+
+def test_check_login_rate_limit_denies(login_limiters) -> None:
+    request = make_request('1.2.3.4')
+    ratelimit.check_login_rate_limit(request, FormData('a@example.com'))
+    ratelimit.check_login_rate_limit(request, FormData('b@example.com'))
+    with pytest.raises(RateLimitError) as exc_info:
+        ratelimit.check_login_rate_limit(request, FormData('c@example.com'))
+    assert exc_info.value.retry_after > 0
+
+    # - Usernames are limited across clients
+    request = make_request('5.6.7.8')
+    ratelimit.check_login_rate_limit(request, FormData('a@example.com'))
+    with pytest.raises(RateLimitError):
+        ratelimit.check_login_rate_limit(request, FormData('A@example.com '))
+
+    return
+
+
+def test_check_login_rate_limit_blocked_client_keeps_user_tokens(
+    login_limiters
+) -> None:
+    _, user_limiter = login_limiters
+    request = make_request('1.2.3.4')
+    ratelimit.check_login_rate_limit(request, FormData('a@example.com'))
+    ratelimit.check_login_rate_limit(request, FormData('b@example.com'))
+    for _ in range(5):
+        with pytest.raises(RateLimitError):
+            ratelimit.check_login_rate_limit(
+                request, FormData('victim@example.com')
+            )
+
+    assert user_limiter.hit('victim@example.com') == 0.0
+    assert user_limiter.hit('victim@example.com') == 0.0
+
+    return
+
+
+def test_login_rate_limited_retry_after(client, login_limiters) -> None:
+    login_data = {
+        "username": "nobody@example.com",
+        "password": "wrong",
+    }
+    for _ in range(2):
+        r = client.post("/api/login/login/access-token", data=login_data)
+        assert r.status_code == 400
+
+    r = client.post("/api/login/login/access-token", data=login_data)
+    assert r.status_code == 429
+    assert int(r.headers["Retry-After"]) == 30
+
+    return
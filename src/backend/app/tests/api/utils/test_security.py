@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the API's security utilities.
+"""
+from uuid import uuid4
+
+import pytest
+
+from app.api.utils.security import require_permission
+from app.core.security import PermissionAction
+from app.core.security import PermissionMatrix
+from app.core.security import UserAuth
+from app.exceptions import PrivilegeError
+
+
+def make_user_auth(*, is_superuser: bool = False) -> UserAuth:
+    return UserAuth(uuid4(), True, is_superuser, is_superuser)
+
+
+def test_require_permission_allowed() -> None:
+    check = require_permission('events', PermissionAction.READ)
+    user = make_user_auth()
+    permissions = PermissionMatrix({
+        'events': PermissionAction.READ | PermissionAction.UPDATE,
+    })
+    assert check(current_user=user, permissions=permissions) is user
+
+    check = require_permission(
+        'events', PermissionAction.READ | PermissionAction.UPDATE
+    )
+    assert check(current_user=user, permissions=permissions) is user
+
+    return
+
+
+def test_require_permission_denied() -> None:
+    user = make_user_auth()
+    permissions = PermissionMatrix({'events': PermissionAction.READ})
+
+    check = require_permission('events', PermissionAction.DELETE)
+    with pytest.raises(PrivilegeError):
+        check(current_user=user, permissions=permissions)
+
+    # - All the actions given are required
+    check = require_permission(
+        'events', PermissionAction.READ | PermissionAction.UPDATE
+    )
+    with pytest.raises(PrivilegeError):
+        check(current_user=user, permissions=permissions)
+
+    check = require_permission('people', PermissionAction.READ)
+    with pytest.raises(PrivilegeError):
+        check(current_user=user, permissions=permissions)
+
+    return
+
+
+def test_require_permission_superuser_bypass() -> None:
+    check = require_permission('events', PermissionAction.DELETE)
+    user = make_user_auth(is_superuser=True)
+    assert check(current_user=user, permissions=PermissionMatrix()) is user
+
+    return
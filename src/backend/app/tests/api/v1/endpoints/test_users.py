@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for /users API endpoints.
+"""
+import pytest
+
+from app.core import config
+from app.db.crud.core import SQLUnitOfWork
+from app.db.instrumentation import track_queries
+from app.db.session import Session
+from app.exceptions import RepeatedQueryError
+from app.tests.utils.utils import random_lower_string
+from app.tests.utils.utils import requires_database
+
+
+@pytest.fixture(scope="module")
+def users_with_people(client, client_superuser_token_headers):
+    # - More users (with people) than repeated queries are allowed for
+    users = []
+    for _ in range(config.DB_REPEATED_QUERY_THRESHOLD + 1):
+        email = f"{random_lower_string()}@example.com"
+        user_data = {
+            "email": email,
+            "password": random_lower_string(),
+            "person": {
+                "name": {"first": random_lower_string(), "last": "Test"},
+                "contact": {"email": email, "preferredMethod": 3},
+            },
+        }
+        r = client.post(
+            "/api/users/",
+            headers=client_superuser_token_headers,
+            json=user_data,
+        )
+        assert r.status_code == 200
+        users.append(r.json())
+
+    yield users
+
+    for user in users:
+        r = client.delete(
+            f"/api/users/id/{user['uid']}",
+            headers=client_superuser_token_headers,
+        )
+        assert r.status_code == 200
+        r = client.delete(
+            f"/api/people/id/{user['person']['uid']}",
+            headers=client_superuser_token_headers,
+        )
+        assert r.status_code == 200
+    return
+
+
+def test_delete_user_self(client, client_superuser_token_headers) -> None:
+    r = client.get("/api/users/me", headers=client_superuser_token_headers)
+    assert r.status_code == 200
+    user_id = r.json()["uid"]
+
+    r = client.delete(
+        f"/api/users/id/{user_id}",
+        headers=client_superuser_token_headers,
+    )
+    assert r.status_code == 400
+
+    r = client.get("/api/users/me", headers=client_superuser_token_headers)
+    assert r.status_code == 200
+
+    return
+
+
+def test_read_users_no_repeated_queries(
+    client,
+    client_superuser_token_headers,
+    users_with_people,
+    no_repeated_queries
+) -> None:
+    r = client.get("/api/users/", headers=client_superuser_token_headers)
+    assert r.status_code == 200
+    users = [x for x in r.json() if x["email"] != config.SUPERUSER_EMAIL]
+    assert len(users) > config.DB_REPEATED_QUERY_THRESHOLD
+    assert all(x["person"]["name"] for x in users)
+
+    return
+
+
+@requires_database
+def test_read_users_lazy_loads_repeat_queries(users_with_people) -> None:
+    session = Session()
+    try:
+        uow = SQLUnitOfWork(session)
+        with pytest.raises(RepeatedQueryError):
+            with track_queries(threshold=config.DB_REPEATED_QUERY_THRESHOLD,
+                               raise_ex=True):
+                for user in uow.user.all():
+                    if user.person is not None:
+                        user.person.name
+    finally:
+        session.close()
+
+    return
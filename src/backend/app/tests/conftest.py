@@ -3,7 +3,12 @@
 PyTest configuration/fixtures
 """
 import pytest
+from starlette.testclient import TestClient
 
+from app.core import config
+from app.db.instrumentation import track_queries
+from app.main import app
+from app.tests.utils.utils import get_client_superuser_token_headers
 from app.tests.utils.utils import get_server_api
 from app.tests.utils.utils import get_superuser_token_headers
 
@@ -16,3 +21,21 @@ def server_api():
 @pytest.fixture(scope="module")
 def superuser_token_headers():
     return get_superuser_token_headers()
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="module")
+def client_superuser_token_headers(client):
+    return get_client_superuser_token_headers(client)
+
+
+@pytest.fixture
+def no_repeated_queries():
+    with track_queries(threshold=config.DB_REPEATED_QUERY_THRESHOLD,
+                       raise_ex=True) as stats:
+        yield stats
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the SQL setting repositories.
+"""
+import pytest
+
+from app.core import config
+from app.db.cache import get_cache_version
+from app.db.crud.core import SQLUnitOfWork
+from app.db.session import Session
+from app.models.config.setting import SettingCreate
+from app.models.config.setting import SettingUpdate
+from app.tests.utils.utils import random_lower_string
+from app.tests.utils.utils import requires_database
+
+
+pytestmark = requires_database
+
+
+@pytest.fixture
+def session(monkeypatch):
+    monkeypatch.setattr(config, 'SETTINGS_CACHE_ENABLED', True)
+    rv = Session()
+    try:
+        yield rv
+    finally:
+        rv.close()
+
+
+def test_setting_changes_bump_cache_version(session) -> None:
+    uow = SQLUnitOfWork(session)
+    name = f"test-{random_lower_string()}"
+
+    def _version() -> int:
+        return get_cache_version(session, 'settings')
+
+    start = _version()
+    with uow:
+        setting = uow.config.setting.create(
+            SettingCreate(name=name, value="a")
+        )
+    assert _version() == start + 1
+    assert uow.config.setting.get_snapshot(name).value == "a"
+
+    with uow:
+        uow.config.setting.update(setting, SettingUpdate(value="b"))
+    assert _version() == start + 2
+    assert uow.config.setting.get_snapshot(name).value == "b"
+
+    with uow:
+        uow.config.setting.update_value(name, "c")
+    assert _version() == start + 3
+    assert uow.config.setting.get_snapshot(name).value == "c"
+
+    with uow:
+        uow.config.setting.delete(setting)
+    assert _version() == start + 4
+    assert uow.config.setting.get_snapshot(name) is None
+
+    return
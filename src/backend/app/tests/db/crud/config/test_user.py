@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the SQL user permission repositories.
+"""
+import pytest
+
+from app.core.security import PermissionAction
+from app.db.crud.core import SQLUnitOfWork
+from app.db.models.config.user import UserPermission
+from app.db.session import Session
+from app.models.config.permission import PermissionCreate
+from app.models.config.permission import PermissionUpdate
+from app.models.config.user import UserPermissionUpdate
+from app.models.user import UserCreate
+from app.tests.utils.utils import random_lower_string
+from app.tests.utils.utils import requires_database
+
+
+pytestmark = requires_database
+
+
+@pytest.fixture
+def session():
+    rv = Session()
+    try:
+        yield rv
+    finally:
+        rv.rollback()
+        rv.close()
+
+
+@pytest.fixture
+def uow(session):
+    return SQLUnitOfWork(session)
+
+
+@pytest.fixture
+def users(uow):
+    with uow:
+        rv = [
+            uow.user.create(UserCreate(
+                email=f"{random_lower_string()}@example.com",
+                password=random_lower_string(),
+            ))
+            for _ in range(2)
+        ]
+    yield rv
+    with uow:
+        uow.user.delete_many(rv)
+
+
+@pytest.fixture
+def permissions(uow, session):
+    with uow:
+        rv = [
+            uow.config.permission.create(PermissionCreate(
+                name=f"test-{random_lower_string()}",
+                readDefault=True,
+                updateDefault=True,
+            )),
+            uow.config.permission.create(PermissionCreate(
+                name=f"test-{random_lower_string()}",
+                readDefault=True,
+            )),
+        ]
+    yield rv
+    with uow:
+        for user_perm in session.query(UserPermission).filter(
+            UserPermission.permission_id.in_([x.id for x in rv])
+        ):
+            uow.config.user.delete(user_perm)
+        uow.config.permission.delete_many(rv)
+
+
+@pytest.fixture
+def user_permission(uow, session, users, permissions):
+    with uow:
+        rv = UserPermission(user=users[0], permission=permissions[0],
+                            create=True, read=False, update=False,
+                            delete=False)
+        session.add(rv)
+    return rv
+
+
+def test_get_matrix_defaults_and_overrides(
+    uow,
+    users,
+    permissions,
+    user_permission
+) -> None:
+    perm_1, perm_2 = permissions
+    matrix = uow.config.user.get_matrix(users[0].uid)
+    assert matrix[perm_1.name] == PermissionAction.CREATE
+    assert matrix[perm_2.name] == PermissionAction.READ
+    assert matrix['test-missing'] == PermissionAction(0)
+
+    matrix = uow.config.user.get_matrix(users[1].uid)
+    assert matrix[perm_1.name] == \
+        PermissionAction.READ | PermissionAction.UPDATE
+    assert matrix.allows(perm_1.name, PermissionAction.UPDATE)
+    assert not matrix.allows(perm_1.name, PermissionAction.DELETE)
+
+    return
+
+
+def test_get_matrix_cached_until_user_permission_changes(
+    uow,
+    users,
+    permissions,
+    user_permission
+) -> None:
+    perm_1 = permissions[0]
+    matrix = uow.config.user.get_matrix(users[0].uid)
+    assert uow.config.user.get_matrix(users[0].uid) is matrix
+
+    with uow:
+        uow.config.user.update(
+            user_permission,
+            UserPermissionUpdate.construct({'delete': True}, {'delete'})
+        )
+    matrix = uow.config.user.get_matrix(users[0].uid)
+    assert matrix[perm_1.name] == \
+        PermissionAction.CREATE | PermissionAction.DELETE
+
+    with uow:
+        uow.config.user.delete(user_permission)
+    matrix = uow.config.user.get_matrix(users[0].uid)
+    assert matrix[perm_1.name] == \
+        PermissionAction.READ | PermissionAction.UPDATE
+
+    return
+
+
+def test_get_matrix_cached_until_permission_changes(
+    uow,
+    users,
+    permissions
+) -> None:
+    perm_1 = permissions[0]
+    matrix = uow.config.user.get_matrix(users[1].uid)
+    assert matrix[perm_1.name] == \
+        PermissionAction.READ | PermissionAction.UPDATE
+
+    with uow:
+        uow.config.permission.update(
+            perm_1, PermissionUpdate(readDefault=False)
+        )
+    matrix = uow.config.user.get_matrix(users[1].uid)
+    assert matrix[perm_1.name] == PermissionAction.UPDATE
+
+    with uow:
+        perm_3 = uow.config.permission.create(PermissionCreate(
+            name=f"test-{random_lower_string()}",
+            deleteDefault=True,
+        ))
+    try:
+        matrix = uow.config.user.get_matrix(users[1].uid)
+        assert matrix[perm_3.name] == PermissionAction.DELETE
+    finally:
+        with uow:
+            uow.config.permission.delete(perm_3)
+    matrix = uow.config.user.get_matrix(users[1].uid)
+    assert perm_3.name not in matrix
+
+    return
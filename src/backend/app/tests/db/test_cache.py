@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the process-wide database data caches.
+"""
+import pytest
+
+from app.db.cache import VersionedCache
+from app.db.cache import bump_cache_version
+from app.db.cache import get_cache_version
+from app.db.session import Session
+from app.tests.utils.utils import random_lower_string
+from app.tests.utils.utils import requires_database
+
+
+pytestmark = requires_database
+
+
+class FakeTimer(object):
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLoader(object):
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, session) -> int:
+        self.calls += 1
+        return self.calls
+
+
+@pytest.fixture
+def session():
+    rv = Session()
+    try:
+        yield rv
+    finally:
+        rv.rollback()
+        rv.close()
+
+
+@pytest.fixture
+def cache_name():
+    return f"test-{random_lower_string()}"
+
+
+def test_bump_cache_version(session, cache_name) -> None:
+    assert get_cache_version(session, cache_name) == 0
+    bump_cache_version(session, cache_name)
+    bump_cache_version(session, cache_name)
+    session.commit()
+    assert get_cache_version(session, cache_name) == 2
+
+    bump_cache_version(session, cache_name)
+    session.rollback()
+    assert get_cache_version(session, cache_name) == 2
+
+    return
+
+
+def test_versioned_cache_reloads_after_commit(session, cache_name) -> None:
+    timer = FakeTimer()
+    loader_1, loader_2 = CountingLoader(), CountingLoader()
+    cache_1 = VersionedCache(cache_name, loader_1, check_interval=5.0,
+                             timer=timer)
+    cache_2 = VersionedCache(cache_name, loader_2, check_interval=5.0,
+                             timer=timer)
+    assert cache_1.get(session) == 1
+    assert cache_2.get(session) == 1
+    assert cache_1.get(session) == 1
+
+    # - The changing cache checks again once committed, others only once
+    #   their check interval has passed
+    cache_1.changed(session)
+    assert cache_1.get(session) == 1
+    session.commit()
+    assert cache_1.get(session) == 2
+    assert cache_2.get(session) == 1
+
+    timer.now += 5.0
+    assert cache_2.get(session) == 2
+    assert cache_2.get(session) == 2
+    assert loader_1.calls == 2
+    assert loader_2.calls == 2
+
+    return
+
+
+def test_versioned_cache_rollback_keeps_data(session, cache_name) -> None:
+    loader = CountingLoader()
+    cache = VersionedCache(cache_name, loader)
+    assert cache.get(session) == 1
+
+    cache.changed(session)
+    session.rollback()
+    assert cache.get(session) == 1
+
+    cache.clear()
+    assert cache.get(session) == 2
+
+    return
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the in-memory storage unit of work.
+"""
+import pytest
+
+from app.exceptions import ObjectExistsError
+from app.exceptions import StorageConflictError
+from app.memory.crud.core import MemoryUnitOfWork
+from app.memory.store import MemoryStore
+from app.models.config.permission import PermissionCreate
+from app.models.config.permission import PermissionUpdate
+from app.models.name import NameCreate
+from app.models.name import NameUpdate
+
+
+@pytest.fixture
+def store():
+    return MemoryStore()
+
+
+def names(uow: MemoryUnitOfWork):
+    return sorted(x.first for x in uow.name.all())
+
+
+def test_commit(store) -> None:
+    uow = MemoryUnitOfWork(store)
+    with uow:
+        name = uow.name.create(NameCreate(first="Jane", last="Doe"))
+    assert name.id is not None and name.uid is not None
+
+    other = MemoryUnitOfWork(store)
+    assert names(other) == ["Jane"]
+    assert other.name.get(name.uid).last == "Doe"
+    assert other.name.get(name.uid) is not name
+
+    with uow:
+        uow.name.update(name, NameUpdate(first="Janet", last="Doe"))
+    # - Units of work keep reading the store as it was when first used
+    assert names(other) == ["Jane"]
+    assert names(MemoryUnitOfWork(store)) == ["Janet"]
+
+    with uow:
+        uow.name.delete(name)
+    assert names(MemoryUnitOfWork(store)) == []
+    assert MemoryUnitOfWork(store).name.get(name.uid) is None
+
+    return
+
+
+def test_uncommitted_changes(store) -> None:
+    uow = MemoryUnitOfWork(store)
+    uow.name.create(NameCreate(first="Jane", last="Doe"))
+    assert names(uow) == ["Jane"]
+    assert names(MemoryUnitOfWork(store)) == []
+
+    return
+
+
+def test_rollback(store) -> None:
+    uow = MemoryUnitOfWork(store)
+    with uow:
+        name = uow.name.create(NameCreate(first="Jane", last="Doe"))
+    version = store.version
+
+    with pytest.raises(RuntimeError):
+        with uow:
+            uow.name.create(NameCreate(first="John", last="Doe"))
+            uow.name.update(name, NameUpdate(first="Janet", last="Doe"))
+            raise RuntimeError()
+    assert names(uow) == ["Jane"]
+    assert names(MemoryUnitOfWork(store)) == ["Jane"]
+    assert store.version == version
+
+    return
+
+
+def test_changes_to_loaded_objects(store) -> None:
+    uow = MemoryUnitOfWork(store)
+    with uow:
+        name = uow.name.create(NameCreate(first="Jane", last="Doe"))
+
+    uow = MemoryUnitOfWork(store)
+    loaded = uow.name.get(name.uid)
+    loaded.first = "Janet"
+    assert names(MemoryUnitOfWork(store)) == ["Jane"]
+    uow.commit()
+    assert names(MemoryUnitOfWork(store)) == ["Janet"]
+
+    # - Reading only doesn't publish anything
+    version = store.version
+    uow = MemoryUnitOfWork(store)
+    names(uow)
+    uow.commit()
+    assert store.version == version
+
+    return
+
+
+def test_unique_index_conflicts(store) -> None:
+    uow = MemoryUnitOfWork(store)
+    with uow:
+        perm_a = uow.config.permission.create(PermissionCreate(name="a"))
+        perm_b = uow.config.permission.create(PermissionCreate(name="b"))
+
+    with pytest.raises(ObjectExistsError):
+        with uow:
+            uow.config.permission.create(PermissionCreate(name="a"))
+    with pytest.raises(ObjectExistsError):
+        with uow:
+            uow.config.permission.update(perm_b, PermissionUpdate(name="a"))
+
+    # - Keys freed by changes can be reused
+    with uow:
+        uow.config.permission.update(perm_a, PermissionUpdate(name="c"))
+        uow.config.permission.create(PermissionCreate(name="a"))
+    uow = MemoryUnitOfWork(store)
+    assert sorted(x.name for x in uow.config.permission.all()) == \
+        ["a", "b", "c"]
+
+    return
+
+
+def test_conflicting_commits(store) -> None:
+    uow = MemoryUnitOfWork(store)
+    with uow:
+        name = uow.name.create(NameCreate(first="Jane", last="Doe"))
+
+    uow_1 = MemoryUnitOfWork(store)
+    uow_2 = MemoryUnitOfWork(store)
+    name_1 = uow_1.name.get(name.uid)
+    name_2 = uow_2.name.get(name.uid)
+    with uow_1:
+        uow_1.name.update(name_1, NameUpdate(first="Janet", last="Doe"))
+    with pytest.raises(StorageConflictError):
+        with uow_2:
+            uow_2.name.update(name_2, NameUpdate(first="Jan", last="Doe"))
+    assert names(MemoryUnitOfWork(store)) == ["Janet"]
+
+    # - The unit of work starts over (from the latest data) after that
+    with uow_2:
+        name_2 = uow_2.name.get(name.uid)
+        assert name_2.first == "Janet"
+        uow_2.name.update(name_2, NameUpdate(first="Jan", last="Doe"))
+    assert names(MemoryUnitOfWork(store)) == ["Jan"]
+
+    # - Changes to other tables don't conflict
+    uow_1 = MemoryUnitOfWork(store)
+    uow_2 = MemoryUnitOfWork(store)
+    names(uow_1)
+    names(uow_2)
+    with uow_1:
+        uow_1.name.create(NameCreate(first="John", last="Doe"))
+    with uow_2:
+        uow_2.config.permission.create(PermissionCreate(name="a"))
+    assert names(MemoryUnitOfWork(store)) == ["Jan", "John"]
+
+    return
+
+
+def test_after_commit(store) -> None:
+    calls = []
+    uow = MemoryUnitOfWork(store)
+    uow.after_commit(lambda: calls.append(1))
+    uow.rollback()
+    uow.commit()
+    assert calls == []
+
+    def callback() -> None:
+        calls.append(2)
+
+    uow.after_commit(callback)
+    uow.after_commit(callback)
+    uow.commit()
+    uow.commit()
+    assert calls == [2]
+
+    return
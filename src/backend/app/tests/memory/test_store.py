@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the in-memory object store.
+"""
+import pytest
+
+from app.exceptions import StorageConflictError
+from app.memory.store import MemoryStore
+from app.memory.store import MemoryTable
+
+
+def make_table(*rows, indexes=('name',)) -> MemoryTable:
+    rv = MemoryTable(indexes)
+    for row in rows:
+        row_id = rv.next_id()
+        rv.rows[row_id] = row
+        rv.indexes['name'][row] = row_id
+    return rv
+
+
+def test_table_copy() -> None:
+    table = make_table('a', 'b')
+    copy = table.copy(('name', 'other'))
+    copy.rows[copy.next_id()] = 'c'
+    copy.indexes['name']['c'] = 3
+
+    assert table.rows == {1: 'a', 2: 'b'}
+    assert table.indexes == {'name': {'a': 1, 'b': 2}}
+    assert table.last_id == 2
+    assert copy.rows == {1: 'a', 2: 'b', 3: 'c'}
+    assert copy.indexes == {'name': {'a': 1, 'b': 2, 'c': 3}, 'other': {}}
+
+    return
+
+
+def test_publish() -> None:
+    store = MemoryStore()
+    version, tables = store.checkout()
+    assert (version, tables) == (0, {})
+
+    new_version = store.publish({'a': make_table('x')}, version)
+    assert new_version == store.version == 1
+    version, tables = store.checkout()
+    assert version == 1
+    assert tables['a'].rows == {1: 'x'}
+    # - Published tables aren't changed by later publishes
+    store.publish({'b': make_table('y')}, version)
+    assert set(tables) == {'a'}
+    assert set(store.checkout()[1]) == {'a', 'b'}
+
+    return
+
+
+def test_publish_conflicts() -> None:
+    store = MemoryStore()
+    store.publish({'a': make_table('x'), 'b': make_table('y')}, 0)
+    version, _ = store.checkout()
+
+    store.publish({'a': make_table('x', 'z')}, version)
+    with pytest.raises(StorageConflictError):
+        store.publish({'a': make_table('x', 'w')}, version)
+    with pytest.raises(StorageConflictError):
+        store.publish({'a': make_table('w'), 'b': make_table('w')}, version)
+    assert store.checkout()[1]['a'].rows == {1: 'x', 2: 'z'}
+    assert store.checkout()[1]['b'].rows == {1: 'y'}
+
+    # - Changes to other tables don't conflict
+    store.publish({'b': make_table('y', 'w')}, version)
+    assert store.checkout()[1]['b'].rows == {1: 'y', 2: 'w'}
+
+    return
+
+
+def test_clear() -> None:
+    store = MemoryStore()
+    store.publish({'a': make_table('x')}, 0)
+    version, _ = store.checkout()
+
+    store.clear()
+    assert store.checkout()[1] == {}
+    with pytest.raises(StorageConflictError):
+        store.publish({'a': make_table('y')}, version)
+
+    return
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the token bucket rate limiting utilities.
+"""
+import pytest
+
+from app.utils.ratelimit import MemoryRateLimitStore
+from app.utils.ratelimit import SQLiteRateLimitStore
+from app.utils.ratelimit import TokenBucketLimiter
+
+
+class FakeTimer(object):
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def timer():
+    return FakeTimer()
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def store(request, timer, tmp_path):
+    if request.param == 'memory':
+        return MemoryRateLimitStore(timer=timer)
+    return SQLiteRateLimitStore(str(tmp_path / 'ratelimit.sqlite3'),
+                                timer=timer)
+
+
+def test_limiter_allows_burst_then_denies(store) -> None:
+    limiter = TokenBucketLimiter(store, 3, 3.0)
+    assert [limiter.hit('a') for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.hit('a') == pytest.approx(1.0)
+    assert limiter.hit('b') == 0.0
+
+    return
+
+
+def test_limiter_refills(store, timer) -> None:
+    limiter = TokenBucketLimiter(store, 2, 2.0)
+    limiter.hit('a')
+    limiter.hit('a')
+    assert limiter.hit('a') > 0
+
+    timer.now += 1.0
+    assert limiter.hit('a') == 0.0
+    assert limiter.hit('a') > 0
+
+    # - Buckets never refill past their capacity
+    timer.now += 60.0
+    assert [limiter.hit('a') for _ in range(3)][-1] > 0
+
+    return
+
+
+def test_limiter_denied_hits_take_no_tokens(store, timer) -> None:
+    limiter = TokenBucketLimiter(store, 1, 4.0)
+    assert limiter.hit('a') == 0.0
+    assert limiter.hit('a') == pytest.approx(4.0)
+
+    timer.now += 1.0
+    assert limiter.hit('a') == pytest.approx(3.0)
+    assert limiter.hit('a') == pytest.approx(3.0)
+
+    timer.now += 3.0
+    assert limiter.hit('a') == 0.0
+
+    return
+
+
+def test_limiter_reset_and_prefix(store) -> None:
+    limiter = TokenBucketLimiter(store, 1, 60.0, prefix='x:')
+    other = TokenBucketLimiter(store, 1, 60.0, prefix='y:')
+    assert limiter.hit('a') == 0.0
+    assert limiter.hit('a') > 0
+    assert other.hit('a') == 0.0
+
+    limiter.reset('a')
+    assert limiter.hit('a') == 0.0
+
+    store.clear()
+    assert limiter.hit('a') == 0.0
+    assert other.hit('a') == 0.0
+
+    return
+
+
+def test_memory_store_drops_least_recently_used(timer) -> None:
+    store = MemoryRateLimitStore(maxsize=2, timer=timer)
+    limiter = TokenBucketLimiter(store, 1, 60.0)
+    limiter.hit('a')
+    limiter.hit('b')
+    assert limiter.hit('a') > 0
+    limiter.hit('c')
+
+    # - The bucket for 'b' was dropped (so it's full again), not 'a'
+    assert limiter.hit('a') > 0
+    assert limiter.hit('b') == 0.0
+
+    return
+
+
+def test_sqlite_store_shared_between_stores(timer, tmp_path) -> None:
+    path = str(tmp_path / 'ratelimit.sqlite3')
+    limiter_1 = TokenBucketLimiter(SQLiteRateLimitStore(path, timer=timer),
+                                   2, 60.0)
+    limiter_2 = TokenBucketLimiter(SQLiteRateLimitStore(path, timer=timer),
+                                   2, 60.0)
+    assert limiter_1.hit('a') == 0.0
+    assert limiter_2.hit('a') == 0.0
+    assert limiter_1.hit('a') > 0
+    assert limiter_2.hit('a') > 0
+
+    return
+
+
+def test_sqlite_store_prunes_refilled_buckets(timer, tmp_path) -> None:
+    store = SQLiteRateLimitStore(str(tmp_path / 'ratelimit.sqlite3'),
+                                 prune_every=2, timer=timer)
+    limiter = TokenBucketLimiter(store, 1, 10.0)
+    limiter.hit('a')
+    timer.now += 10.0
+    limiter.hit('b')
+
+    keys = [x for x, in store._connect().execute(
+        "SELECT key FROM rate_limits"
+    )]
+    assert keys == ['b']
+
+    return
@@ -5,11 +5,20 @@ Misc. utilities for tests.
 import random
 import string
 
+import pytest
 import requests
+from starlette.testclient import TestClient
 
 from app.core import config
 
 
+# - For tests of the database storage implementations
+requires_database = pytest.mark.skipif(
+    config.STORAGE_TYPE.lower() != 'database',
+    reason="Requires database storage"
+)
+
+
 def random_lower_string():
     return "".join(random.choices(string.ascii_lowercase, k=32))
 
@@ -39,3 +48,15 @@ def get_superuser_token_headers():
     a_token = tokens["access_token"]
     headers = {"Authorization": f"Bearer {a_token}"}
     return headers
+
+
+def get_client_superuser_token_headers(client: TestClient):
+    login_data = {
+        "username": config.SUPERUSER_EMAIL,
+        "password": config.SUPERUSER_PASSWORD,
+    }
+    r = client.post("/api/login/login/access-token", data=login_data)
+    tokens = r.json()
+    a_token = tokens["accessToken"]
+    headers = {"Authorization": f"Bearer {a_token}"}
+    return headers
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Caching utilities.
+"""
+from collections import OrderedDict
+import threading
+import time
+import typing as tp
+
+
+K = tp.TypeVar('K')
+V = tp.TypeVar('V')
+
+
+class TTLCache(tp.Generic[K, V]):
+    """
+    Thread-safe, size-bounded LRU cache with expiring entries.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of entries to keep (least recently used
+        entries are evicted first).
+    ttl : float
+        The default number of seconds entries are valid for.
+    timer : Callable[[], float], optional
+        The clock to use for expiry times (default is
+        :func:`time.time`).
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        *,
+        timer: tp.Callable[[], float] = time.time
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: tp.MutableMapping[K, tp.Tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        return
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K, default: tp.Optional[V] = None) -> tp.Optional[V]:
+        """Gets the (unexpired) value for the given key.
+
+        Parameters
+        ----------
+        key : K
+            The key to get the value for.
+        default : V, optional
+            The value to return if there's no (valid) entry for `key`.
+
+        Returns
+        -------
+        V or None
+            The cached value for `key` (or `default` if not found).
+
+        """
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                return default
+            if expires <= self._timer():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(
+        self,
+        key: K,
+        value: V,
+        *,
+        expires: tp.Optional[float] = None
+    ) -> None:
+        """Sets the cached value for the given key.
+
+        Parameters
+        ----------
+        key : K
+            The key to store the value under.
+        value : V
+            The value to cache.
+        expires : float, optional
+            The time (per the cache's timer) at which the entry must
+            expire, if sooner than the cache's `ttl`.
+
+        """
+        if self.maxsize <= 0:
+            return
+        expiry = self._timer() + self.ttl
+        if expires is not None:
+            expiry = min(expiry, expires)
+        with self._lock:
+            self._data[key] = (expiry, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return
+
+    def pop(self, key: K, default: tp.Optional[V] = None) -> tp.Optional[V]:
+        """Removes (and returns) the cached value for the given key."""
+        with self._lock:
+            rv = self._data.pop(key, None)
+        return default if rv is None else rv[1]
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+        return
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Concurrency-related utilities.
+"""
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import typing as tp
+
+
+class MonitoredThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    Thread pool executor which keeps track of its queue depth.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        The maximum number of threads to use (if not given the
+        :obj:`ThreadPoolExecutor` default is used).
+    thread_name_prefix : str, optional
+        The prefix to use for the names of the worker threads.
+
+    """
+
+    def __init__(
+        self,
+        max_workers: tp.Optional[int] = None,
+        thread_name_prefix: str = ''
+    ) -> None:
+        super().__init__(max_workers=max_workers,
+                         thread_name_prefix=thread_name_prefix)
+        self._stats_lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        return
+
+    @property
+    def max_workers(self) -> int:
+        """int: The maximum number of worker threads."""
+        return self._max_workers
+
+    @property
+    def queued(self) -> int:
+        """int: The number of tasks waiting for a worker thread."""
+        return self._queued
+
+    @property
+    def running(self) -> int:
+        """int: The number of tasks currently running."""
+        return self._running
+
+    @property
+    def completed(self) -> int:
+        """int: The total number of tasks completed."""
+        return self._completed
+
+    def stats(self) -> tp.Dict[str, int]:
+        """Gets a snapshot of this executor's statistics.
+
+        Returns
+        -------
+        Dict[str, int]
+            The current ``max_workers``, ``queued``, ``running`` and
+            ``completed`` task counts.
+
+        """
+        with self._stats_lock:
+            return {
+                'max_workers': self._max_workers,
+                'queued': self._queued,
+                'running': self._running,
+                'completed': self._completed,
+            }
+
+    def submit(self, fn: tp.Callable, *args, **kwargs) -> Future:
+        with self._stats_lock:
+            self._queued += 1
+
+        def _tracked() -> tp.Any:
+            with self._stats_lock:
+                self._queued -= 1
+                self._running += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._stats_lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        return super().submit(_tracked)
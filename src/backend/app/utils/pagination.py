@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Pagination-related utilities.
+"""
+import base64
+import binascii
+import json
+import typing as tp
+
+from app.exceptions import InvalidCursorError
+
+
+def encode_cursor(key: tp.Any) -> str:
+    """Encodes the given key value as an opaque pagination cursor.
+
+    Parameters
+    ----------
+    key : Any
+        The (JSON-serializable) key of the last item on a page.
+
+    Returns
+    -------
+    str
+        The URL-safe cursor string for the next page.
+
+    """
+    raw = json.dumps([key], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tp.Any:
+    """Decodes the key value from the given pagination cursor.
+
+    Parameters
+    ----------
+    cursor : str
+        The cursor string (as created by :func:`encode_cursor`).
+
+    Returns
+    -------
+    Any
+        The key value encoded in the `cursor`.
+
+    Raises
+    ------
+    InvalidCursorError
+        If the given `cursor` is malformed.
+
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        rv = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise InvalidCursorError(cursor)
+    if not isinstance(rv, list) or len(rv) != 1 or isinstance(rv[0], bool):
+        raise InvalidCursorError(cursor)
+    return rv[0]
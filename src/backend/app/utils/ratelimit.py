@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Token bucket rate limiting utilities.
+"""
+from abc import ABCMeta
+from abc import abstractmethod
+from collections import OrderedDict
+import os
+import sqlite3
+import threading
+import time
+import typing as tp
+
+
+def _take_token(
+    tokens: float,
+    updated: float,
+    now: float,
+    capacity: float,
+    rate: float
+) -> tp.Tuple[float, float]:
+    """Takes a token from a bucket (if one is available).
+
+    Returns
+    -------
+    float
+        The tokens left in the bucket.
+    float
+        The time (in seconds) until a token will be available, ``0.0`` if
+        one was taken.
+
+    """
+    tokens = min(capacity, tokens + max(now - updated, 0.0) * rate)
+    if tokens >= 1.0:
+        return tokens - 1.0, 0.0
+    return tokens, (1.0 - tokens) / rate
+
+
+class RateLimitStore(object, metaclass=ABCMeta):
+    """
+    Storage for the state of token buckets.
+    """
+
+    @abstractmethod
+    def consume(self, key: str, capacity: float, rate: float) -> float:
+        """Takes a token from the bucket for the given key.
+
+        Parameters
+        ----------
+        key : str
+            The key of the bucket to take a token from (buckets start
+            out full).
+        capacity : float
+            The maximum number of tokens the bucket holds.
+        rate : float
+            The number of tokens added back to the bucket per second.
+
+        Returns
+        -------
+        float
+            The time (in seconds) until a token will be available if the
+            bucket is empty, ``0.0`` if a token was taken.
+
+        """
+        pass
+
+    @abstractmethod
+    def reset(self, key: str) -> None:
+        """Resets the bucket for the given key (so it's full again)."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Resets all the buckets in this store."""
+        pass
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """
+    Per-process, in-memory token bucket storage.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of buckets to keep (least recently used ones
+        are dropped first, default is 10000).
+    timer : Callable[[], float], optional
+        The clock to use (default is :func:`time.monotonic`).
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        *,
+        timer: tp.Callable[[], float] = time.monotonic
+    ) -> None:
+        self.maxsize = maxsize
+        self._timer = timer
+        self._buckets: tp.MutableMapping[str, tp.Tuple[float, float]] = \
+            OrderedDict()
+        self._lock = threading.Lock()
+        return
+
+    def consume(self, key: str, capacity: float, rate: float) -> float:
+        now = self._timer()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens, wait = _take_token(tokens, updated, now, capacity, rate)
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+        return wait
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._buckets.pop(key, None)
+        return
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+        return
+
+
+class SQLiteRateLimitStore(RateLimitStore):
+    """
+    Token bucket storage in a (local) SQLite database file.
+
+    The buckets are shared by all the processes using the same file
+    (e.g. each of the API's worker processes), updates are serialized
+    with SQLite's write lock.
+
+    Parameters
+    ----------
+    path : str
+        The path to the SQLite database file to use (created if needed).
+    timeout : float, optional
+        The time (in seconds) to wait for the database's write lock
+        (default is 5).
+    prune_every : int, optional
+        The number of updates between removing the buckets which have
+        refilled from the database (default is 1000).
+    timer : Callable[[], float], optional
+        The clock to use, it must be shared by all processes (default is
+        :func:`time.time`).
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        timeout: float = 5.0,
+        prune_every: int = 1000,
+        timer: tp.Callable[[], float] = time.time
+    ) -> None:
+        self.path = path
+        self.timeout = timeout
+        self.prune_every = prune_every
+        self._timer = timer
+        self._local = threading.local()
+        self._updates = 0
+        return
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout,
+                                   isolation_level=None)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits ("
+                "key TEXT PRIMARY KEY, "
+                "tokens REAL NOT NULL, "
+                "updated REAL NOT NULL, "
+                "refilled REAL NOT NULL)"
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def consume(self, key: str, capacity: float, rate: float) -> float:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = self._timer()
+            row = conn.execute(
+                "SELECT tokens, updated FROM rate_limits WHERE key = ?",
+                (key,)
+            ).fetchone()
+            tokens, updated = row or (capacity, now)
+            tokens, wait = _take_token(tokens, updated, now, capacity, rate)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limits "
+                "(key, tokens, updated, refilled) VALUES (?, ?, ?, ?)",
+                (key, tokens, now, now + (capacity - tokens) / rate)
+            )
+
+            self._updates += 1
+            if self.prune_every and self._updates % self.prune_every == 0:
+                conn.execute("DELETE FROM rate_limits WHERE refilled <= ?",
+                             (now,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return wait
+
+    def reset(self, key: str) -> None:
+        self._connect().execute("DELETE FROM rate_limits WHERE key = ?",
+                                (key,))
+        return
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM rate_limits")
+        return
+
+
+class TokenBucketLimiter(object):
+    """
+    Rate limiter allowing bursts of up to `capacity` hits per key, with
+    tokens refilled evenly over each `period`.
+
+    Parameters
+    ----------
+    store : RateLimitStore
+        The storage to keep the buckets' state in.
+    capacity : int
+        The maximum number of hits allowed in a burst.
+    period : float
+        The time (in seconds) for an empty bucket to refill.
+    prefix : str, optional
+        The prefix to add to keys in the `store` (so multiple limiters
+        can share one).
+
+    """
+
+    def __init__(
+        self,
+        store: RateLimitStore,
+        capacity: int,
+        period: float,
+        *,
+        prefix: str = ''
+    ) -> None:
+        self.store = store
+        self.capacity = capacity
+        self.period = period
+        self.prefix = prefix
+        return
+
+    @property
+    def rate(self) -> float:
+        """float: The number of tokens refilled per second."""
+        return self.capacity / self.period
+
+    def hit(self, key: str) -> float:
+        """Records a hit for the given key.
+
+        Parameters
+        ----------
+        key : str
+            The key to record the hit for.
+
+        Returns
+        -------
+        float
+            The time (in seconds) to wait before retrying if the hit
+            exceeds the limit, ``0.0`` if it's allowed.
+
+        """
+        return self.store.consume(self.prefix + key, self.capacity, self.rate)
+
+    def reset(self, key: str) -> None:
+        """Resets the limit for the given key."""
+        self.store.reset(self.prefix + key)
+        return
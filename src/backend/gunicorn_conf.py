@@ -33,6 +33,26 @@ bind = use_bind
 keepalive = 120
 errorlog = "-"
 
+# Metrics
+# - Each worker writes its metrics to files in this directory, they're
+#   cleared on start and dead workers' live gauges are removed.
+prometheus_multiproc_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR", None)
+
+
+def on_starting(server):
+    if prometheus_multiproc_dir:
+        os.makedirs(prometheus_multiproc_dir, exist_ok=True)
+        for fname in os.listdir(prometheus_multiproc_dir):
+            if fname.endswith(".db"):
+                os.remove(os.path.join(prometheus_multiproc_dir, fname))
+
+
+def child_exit(server, worker):
+    if prometheus_multiproc_dir:
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid, prometheus_multiproc_dir)
+
+
 # For debugging and testing
 log_data = {
     "loglevel": loglevel,
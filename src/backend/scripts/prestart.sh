@@ -5,6 +5,7 @@ python -m app check db
 
 # Run migrations
 alembic upgrade head
+python -m app migrate schema
 
 # Create initial data in DB
 python -m app init
@@ -26,6 +26,11 @@ const PeopleAPI = function (axios: NuxtAxiosInstance): IPeopleAPI {
       return res;
     },
 
+    async getPeopleBatch (personIds) {
+      const res = await axios.$post('/people/batch', personIds);
+      return res;
+    },
+
     async getCurrent () {
       const res = await axios.$get('/people/me');
       return res
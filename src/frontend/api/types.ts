@@ -44,6 +44,7 @@ export interface IPeopleAPI {
   createPerson (person: Person): Promise<Person>
   getPeople (skip?: number, limit?: number): Promise<Person[]>
   getPerson (personId: string): Promise<Person>
+  getPeopleBatch (personIds: string[]): Promise<Person[]>
   getCurrent (): Promise<Person|undefined>
   updatePerson (personId: string, data: object): Promise<Person>
   updateCurrent (data: object): Promise<Person>